@@ -1,27 +1,90 @@
+import time
+from collections import deque
 from PyQt5.QtCore import QTimer, Qt, pyqtSignal
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
 import psutil
 import numpy as np
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from SystemResourceViewModel import SystemResourceViewModel  # ✅ ViewModel import 추가
+from SparklineCanvas import SparklineCanvas
+from StartupProfiler import STARTUP
+import TileDiagnostics
+from WidgetRegistry import register_widget
+from PerfInstrumentation import traced
+from RenderScheduler import RENDER_SCHEDULER
 import qdarktheme
 
+# matplotlib은 첫 matplotlib 그래프 타일을 만들 때 import (시작 시간 단축)
+Figure = None
+_TimedFigureCanvas = None
+
+
+def _load_matplotlib():
+    """matplotlib 지연 import 및 draw() 시간을 기록하는 캔버스 클래스 준비"""
+    global Figure, _TimedFigureCanvas
+    if _TimedFigureCanvas is not None:
+        return
+    with STARTUP.phase("imports"):
+        from matplotlib.figure import Figure as _Figure
+        from matplotlib.backends.backend_qt5agg import (
+            FigureCanvasQTAgg as FigureCanvas,
+        )
+
+    class TimedFigureCanvas(FigureCanvas):
+        """draw() 소요 시간을 기록하는 FigureCanvas"""
+
+        def __init__(self, figure):
+            super().__init__(figure)
+            self.paint_times = deque(maxlen=120)  # 최근 draw 소요 시간 (ms)
+
+        @traced("graph.draw")
+        def draw(self):
+            start = time.perf_counter()
+            super().draw()
+            self.paint_times.append((time.perf_counter() - start) * 1000.0)
+
+        @traced("graph.paint")
+        def paintEvent(self, event):
+            super().paintEvent(event)
+
+    Figure = _Figure
+    _TimedFigureCanvas = TimedFigureCanvas
+
 
 class CPUGraphWidget(QWidget):
+    RENDERER_MATPLOTLIB = "matplotlib"
+    RENDERER_QPAINTER = "qpainter"
+    RENDERERS = (RENDERER_MATPLOTLIB, RENDERER_QPAINTER)
+    DEFAULT_RENDERER = RENDERER_MATPLOTLIB
+
     def __init__(
         self,
         core_id: str = None,  # ✅ core_id 추가
         viewmodel: SystemResourceViewModel = None,  # ✅ viewmodel 추가
         title: str = "CPU Usage",
         num_points: int = 30,
+        renderer: str = None,  # "matplotlib" 또는 "qpainter"
+        blit: bool = True,  # matplotlib: 정적 배경 캐시 후 라인/채움만 다시 그림
         parent=None,
     ):
         super().__init__(parent)
+        if renderer is not None and renderer not in self.RENDERERS:
+            raise ValueError(
+                f"알 수 없는 그래프 렌더러: {renderer} (가능: {self.RENDERERS})"
+            )
         self.core_id = core_id  # ✅ core_id 저장
         self.viewmodel = viewmodel  # ✅ viewmodel 저장
         self.num_points = num_points
-        self.data = [0] * num_points
+        self.renderer = renderer or self.DEFAULT_RENDERER
+        # 풀에서 재사용될 때 구독이 바뀌므로 현재 구독은 dict에 담아 공유
+        self._binding = {"viewmodel": None, "subscription": None}
+        self._disposed = False
+        TileDiagnostics.track_widget(self)
+        self.blit = blit
+        self._background = None  # blit용 정적 배경 (축/눈금/그리드) 캐시
+        self._mpl_callbacks = []  # mpl_connect ID (dispose 시 해제)
+        self.data = [0] * num_points  # ViewModel이 없을 때만 사용하는 로컬 데이터
+        self._x = np.arange(num_points)
+        self._latest_value = None  # 다음 프레임에 그릴 최신 샘플
 
         # ✅ title이 없으면 core_id 기반으로 자동 생성
         if core_id and not title:
@@ -38,9 +101,77 @@ class CPUGraphWidget(QWidget):
         text_color = palette.text().color().name()  # 텍스트/축 색상
         grid_color = palette.shadow().color().name()  # 그리드 색상
 
+        if self.renderer == self.RENDERER_QPAINTER:
+            self.canvas = SparklineCanvas(
+                num_points=num_points,
+                bg_color=bg_color,
+                text_color=text_color,
+                grid_color="gray",
+            )
+            self.figure = None
+        else:
+            self._build_matplotlib(bg_color, text_color, grid_color)
+
+        # 레이아웃
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)  # ✅ 여백 제거
+        layout.setSpacing(0)
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+
+        # ✅ ViewModel 연결 (편집모드가 아닐 때만 타이머 사용)
+        if self.viewmodel and self.core_id:
+            self._subscribe()
+            # Qt 객체가 삭제되면 구독도 해제
+            self.destroyed.connect(
+                lambda _=None, binding=self._binding: CPUGraphWidget._release(binding)
+            )
+        else:
+            # ✅ ViewModel이 없는 경우 기존 타이머 유지 (테스트용)
+            self.timer = QTimer()
+            self.timer.timeout.connect(self.update_graph)
+            self.timer.start(1000)
+
+    @staticmethod
+    def _release(binding: dict):
+        if binding["subscription"] is not None:
+            binding["viewmodel"].unsubscribe(binding["subscription"])
+        binding["viewmodel"] = binding["subscription"] = None
+
+    def _subscribe(self):
+        # ✅ 담당 코어만 구독 (그래프는 매 틱 스크롤되므로 데드밴드 없음)
+        self._binding["viewmodel"] = self.viewmodel
+        self._binding["subscription"] = self.viewmodel.subscribe(
+            self.core_id, self.on_core_value, deadband=None
+        )
+
+    @property
+    def _subscription(self):
+        return self._binding["subscription"]
+
+    def rebind(self, core_id: str, viewmodel: SystemResourceViewModel):
+        """풀에서 꺼낸 위젯을 다른 코어/ViewModel에 다시 연결"""
+        self._release(self._binding)
+        self.core_id = core_id
+        self.viewmodel = viewmodel
+        self.data = [0] * self.num_points
+        self._latest_value = None
+        self._subscribe()
+        # 이전 코어의 그래프가 남지 않도록 새 코어 이력으로 바로 다시 그림
+        self.update_graph()
+
+    def detach(self):
+        """풀에 반납될 때 호출: 구독만 해제하고 위젯은 유지"""
+        self._release(self._binding)
+        RENDER_SCHEDULER.discard(self)
+
+    def _build_matplotlib(self, bg_color: str, text_color: str, grid_color: str):
+        """matplotlib Figure 기반 렌더러 구성"""
+        _load_matplotlib()
         # 200x200 픽셀로 지정 (dpi=100, figsize=2x2인치)
         self.figure = Figure(figsize=(2, 2), dpi=80, facecolor=bg_color)
-        self.canvas = FigureCanvas(self.figure)
+        TileDiagnostics.track_figure(self.figure)
+        self.canvas = _TimedFigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
         self.ax.set_facecolor(bg_color)  # 축 배경색
 
@@ -77,26 +208,72 @@ class CPUGraphWidget(QWidget):
         )  # ✅ 폰트 크기 축소
 
         # 초기 플롯 생성
-        (self.line,) = self.ax.plot(range(num_points), self.data, color="#00FF00")
+        (self.line,) = self.ax.plot(range(self.num_points), self.data, color="#00FF00")
         self.fill = self.ax.fill_between(
-            range(num_points), self.data, 0, color="#00FF00", alpha=0.3
+            range(self.num_points), self.data, 0, color="#00FF00", alpha=0.3
         )
 
-        # 레이아웃
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)  # ✅ 여백 제거
-        layout.setSpacing(0)
-        layout.addWidget(self.canvas)
-        self.setLayout(layout)
+        if self.blit:
+            # ✅ 데이터 아티스트는 전체 draw에서 제외하고 배경만 캐시
+            self.line.set_animated(True)
+            self.fill.set_animated(True)
+            self._mpl_callbacks = [
+                self.canvas.mpl_connect("draw_event", self._on_draw),
+                self.canvas.mpl_connect("resize_event", self.invalidate_background),
+            ]
 
-        # ✅ ViewModel 연결 (편집모드가 아닐 때만 타이머 사용)
-        if self.viewmodel and self.core_id:
-            self.viewmodel.cpu_data_updated.connect(self.on_cpu_updated)
-        else:
-            # ✅ ViewModel이 없는 경우 기존 타이머 유지 (테스트용)
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.update_graph)
-            self.timer.start(1000)
+    def _on_draw(self, event):
+        """전체 draw 직후: 정적 배경을 캐시하고 데이터 아티스트를 얹음"""
+        if self._disposed:
+            return  # dispose 전에 예약된 draw_idle (축/아티스트는 이미 해제됨)
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.fill)
+        self.ax.draw_artist(self.line)
+
+    def invalidate_background(self, event=None):
+        """크기/테마 변경 시 배경 캐시 무효화 (다음 갱신은 전체 draw)"""
+        self._background = None
+
+    def _blit_update(self):
+        if self._background is None:
+            self.canvas.draw_idle()  # 전체 draw → _on_draw에서 배경 재캐시
+            return
+        start = time.perf_counter()
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self.fill)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.paint_times.append((time.perf_counter() - start) * 1000.0)
+
+    def dispose(self):
+        """타일 제거 시 호출: 구독/타이머 해제, Figure 정리 후 Qt 객체 삭제"""
+        if self._disposed:
+            return
+        self._disposed = True
+        self._release(self._binding)
+        RENDER_SCHEDULER.discard(self)
+        timer = getattr(self, "timer", None)
+        if timer is not None:
+            timer.stop()
+        for cid in self._mpl_callbacks:
+            self.canvas.mpl_disconnect(cid)
+        self._mpl_callbacks = []
+        if self.figure is not None:
+            self.figure.clear()  # 축/아티스트 참조 해제
+            self.figure = None
+            self.ax = self.line = self.fill = None
+            self._background = None
+        self.deleteLater()
+
+    def render_stats(self) -> dict:
+        """렌더러별 그리기 소요 시간 통계 (ms)"""
+        times = list(self.canvas.paint_times)
+        return {
+            "renderer": self.renderer,
+            "paints": len(times),
+            "avg_ms": sum(times) / len(times) if times else 0.0,
+            "max_ms": max(times) if times else 0.0,
+        }
 
     # def resizeEvent(self, event):
     #     """위젯 크기 변경 시 Figure 크기 동기화"""
@@ -106,21 +283,62 @@ class CPUGraphWidget(QWidget):
     #     self.figure.set_size_inches(width_inch, height_inch)
     #     self.canvas.draw()
 
+    def set_updates_paused(self, paused: bool):
+        """화면 밖에 있을 때 갱신 중지 (재개 시 최신 상태로 한 번 갱신)"""
+        if self._subscription is not None:
+            self.viewmodel.set_subscription_paused(self._subscription, paused)
+
+    def on_core_value(self, core_id: str, value: float):
+        """ViewModel에서 담당 코어 샘플이 들어올 때 호출 (그리기는 다음 프레임)"""
+        self._latest_value = value
+        RENDER_SCHEDULER.mark_dirty(self)
+
     def on_cpu_updated(self, new_data: dict):
-        """ViewModel에서 CPU 데이터 업데이트 시 호출"""
+        """전체 CPU 데이터(dict)로 갱신 (직접 연결용)"""
         if self.core_id and self.core_id in new_data:
-            cpu_value = new_data[self.core_id]
-            self.update_graph(cpu_value)
+            self.on_core_value(self.core_id, new_data[self.core_id])
+
+    def render_frame(self):
+        """RenderScheduler가 프레임마다 한 번 호출: 그 사이 쌓인 이력으로 다시 그림"""
+        if not self._disposed:
+            self.update_graph(self._latest_value)
 
+    @traced("graph.update")
     def update_graph(self, cpu_value: float = None):
-        """외부에서 값을 전달받거나 psutil로 직접 측정"""
+        """ViewModel 이력으로 다시 그림 (ViewModel이 없을 때만 psutil로 직접 측정)"""
+        if self.viewmodel is not None:
+            # ✅ 모델 링 버퍼의 뷰를 그대로 사용 (위젯별 리스트/배열 변환 없음)
+            y = None
+            if self.core_id:
+                y = self.viewmodel.get_history(self.core_id, self.num_points)
+            if y is None:
+                # 아직 이 코어 샘플이 없음 (재연결/풀 재사용 직후): 빈 그래프
+                # GUI 스레드에서 psutil을 직접 측정하지 않음
+                y = np.zeros(0)
+        else:
+            # ViewModel 없이 단독으로 쓸 때만 직접 측정
+            if cpu_value is None:
+                cpu_value = psutil.cpu_percent()
+            self.data.pop(0)
+            self.data.append(cpu_value)
+            y = np.array(self.data)
+        if len(y) < self.num_points:
+            y = np.concatenate([np.zeros(self.num_points - len(y)), y])
         if cpu_value is None:
-            cpu_value = psutil.cpu_percent()
+            cpu_value = float(y[-1])
+        x = self._x
 
-        self.data.pop(0)
-        self.data.append(cpu_value)
-        y = np.array(self.data)
-        x = np.arange(len(y))
+        # ✅ 색상 조건에 따라 라인 색상 변경
+        if cpu_value <= 80:
+            color = "#00FF00"
+        elif 80 < cpu_value <= 90:
+            color = "#FFFF00"
+        else:
+            color = "#FF0000"
+
+        if self.figure is None:
+            self.canvas.set_data(y, color)
+            return
 
         # ✅ 기존 라인과 채움 영역 업데이트 (제거하지 않음)
         self.line.set_ydata(y)
@@ -131,17 +349,25 @@ class CPUGraphWidget(QWidget):
         )
         self.fill.set_verts([verts])
 
-        # ✅ 색상 조건에 따라 라인 색상 변경
-        if cpu_value <= 80:
-            color = "#00FF00"
-        elif 80 < cpu_value <= 90:
-            color = "#FFFF00"
-        else:
-            color = "#FF0000"
         self.line.set_color(color)
         self.fill.set_color(color)
 
-        self.canvas.draw_idle()
+        if self.blit:
+            self._blit_update()
+        else:
+            self.canvas.draw_idle()
+
+
+def _create_graph(tile_model, viewmodel):
+    return CPUGraphWidget(
+        core_id=tile_model.core_id,
+        viewmodel=viewmodel,
+        renderer=tile_model.renderer,
+    )
+
+
+# ✅ 위젯 레지스트리 등록 (풀은 렌더러별로 나뉨)
+register_widget("CPUGraphWidget", _create_graph)
 
 
 # 테스트 코드
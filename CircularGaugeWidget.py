@@ -1,12 +1,29 @@
 import sys
 from PyQt5.QtWidgets import QApplication, QWidget, QSizePolicy
-from PyQt5.QtCore import Qt, QRectF
-from PyQt5.QtGui import QBrush, QColor, QPainter, QPen, QPainterPath, QFont, QPalette
+from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtGui import (
+    QBrush,
+    QColor,
+    QPainter,
+    QPen,
+    QPainterPath,
+    QFont,
+    QPalette,
+    QPixmap,
+    QStaticText,
+)
 from typing import Optional
 from SystemResourceViewModel import SystemResourceViewModel  # ViewModel 임포트
+import TileDiagnostics
+from WidgetRegistry import register_widget
+from PerfInstrumentation import traced
+from RenderScheduler import RENDER_SCHEDULER
 
 
 class CircularGaugeWidget(QWidget):
+    WARNING_LEVEL = 80  # 이하 초록, 초과 노랑
+    CRITICAL_LEVEL = 90  # 초과 빨강
+
     def __init__(
         self,
         core_id: str,  # ✅ core_id 추가
@@ -30,13 +47,15 @@ class CircularGaugeWidget(QWidget):
         super().__init__(parent)
         self.core_id = core_id  # ✅ core_id 저장
         self.viewmodel = viewmodel  # ✅ viewmodel 저장
+        self._disposed = False
+        TileDiagnostics.track_widget(self)
 
         # ✅ title이 없으면 core_id 기반으로 자동 생성
         self.title = title if title else f"CPU {core_id}"
 
         self.min_value = min_value
         self.max_value = max_value
-        self.value = 0.0  # ✅ 초기값 0으로 설정 (ViewModel에서 업데이트)
+        self.value = 0.0  # ✅ ViewModel 이력의 최신값으로 시작 (없으면 0)
         self.steps = steps
         self.start_angle = start_angle
         self.end_angle = end_angle
@@ -53,48 +72,165 @@ class CircularGaugeWidget(QWidget):
         # self.setAttribute(Qt.WA_TranslucentBackground)
         # self.setStyleSheet("background: transparent;")
 
-        # ✅ ViewModel의 데이터 업데이트 신호 연결
-        self.viewmodel.cpu_data_updated.connect(self.on_cpu_updated)
+        # ✅ 정적 레이어(배경 아크, 3색 외곽 밴드) 캐시: (폭, 높이, DPR) → QPixmap
+        self._static_cache_key = None
+        self._static_cache = None
+        # 퍼센트 텍스트 캐시: 텍스트 → QStaticText (폰트 크기가 바뀌면 비움)
+        self._percent_font = None
+        self._percent_texts = {}
+
+        # ✅ 담당 코어만 구독 (표시 단위 미만의 변화는 다시 그리지 않음)
+        # 풀에서 재사용될 때 구독이 바뀌므로 현재 구독은 dict에 담아 공유
+        self._binding = {"viewmodel": None, "subscription": None}
+        self._subscribe()
+        self._seed_value()
+        # Qt 객체가 삭제되면 구독도 해제
+        self.destroyed.connect(
+            lambda _=None, binding=self._binding: CircularGaugeWidget._release(binding)
+        )
+
+    @staticmethod
+    def _release(binding: dict):
+        if binding["subscription"] is not None:
+            binding["viewmodel"].unsubscribe(binding["subscription"])
+        binding["viewmodel"] = binding["subscription"] = None
+
+    def _subscribe(self):
+        self._binding["viewmodel"] = self.viewmodel
+        self._binding["subscription"] = self.viewmodel.subscribe(
+            self.core_id, self.on_core_value, change_key=self.display_key
+        )
+
+    @classmethod
+    def display_key(cls, value: float):
+        """화면에 보이는 상태 (정수 % 표시, 색 구간): 이 값이 바뀔 때만 다시 그림"""
+        if value <= cls.WARNING_LEVEL:
+            band = 0
+        elif value <= cls.CRITICAL_LEVEL:
+            band = 1
+        else:
+            band = 2
+        return f"{value:.0f}", band
+
+    def _seed_value(self):
+        """구독 직후 첫 샘플 전까지 보여 줄 값 (ViewModel 이력의 최신값)"""
+        history = self.viewmodel.get_history(self.core_id, 1)
+        if history is not None and len(history):
+            self.value = max(self.min_value, min(self.max_value, float(history[-1])))
+        else:
+            self.value = 0.0
+
+    @property
+    def _subscription(self):
+        return self._binding["subscription"]
+
+    def rebind(self, core_id: str, viewmodel: SystemResourceViewModel):
+        """풀에서 꺼낸 위젯을 다른 코어/ViewModel에 다시 연결"""
+        self._release(self._binding)
+        self.core_id = core_id
+        self.viewmodel = viewmodel
+        self.title = f"CPU {core_id}"
+        self._subscribe()
+        self._seed_value()
+        self.update()
+
+    def detach(self):
+        """풀에 반납될 때 호출: 구독만 해제하고 위젯은 유지"""
+        self._release(self._binding)
+        RENDER_SCHEDULER.discard(self)
+
+    def set_updates_paused(self, paused: bool):
+        """화면 밖에 있을 때 갱신 중지 (재개 시 최신 상태로 한 번 갱신)"""
+        if self._subscription is not None:
+            self.viewmodel.set_subscription_paused(self._subscription, paused)
+
+    def dispose(self):
+        """타일 제거 시 호출: 구독 해제, 캐시 정리 후 Qt 객체 삭제"""
+        if self._disposed:
+            return
+        self._disposed = True
+        self._release(self._binding)
+        RENDER_SCHEDULER.discard(self)
+        self._static_cache = None
+        self._static_cache_key = None
+        self._percent_texts.clear()
+        self.deleteLater()
+
+    def on_core_value(self, core_id: str, value: float):
+        """ViewModel에서 담당 코어 값이 바뀌었을 때 호출"""
+        self.setValue(value)
 
     def on_cpu_updated(self, new_data: dict):
-        """ViewModel에서 CPU 데이터 업데이트 시 호출"""
+        """전체 CPU 데이터(dict)로 갱신 (직접 연결용)"""
         if self.core_id in new_data:
             self.setValue(new_data[self.core_id])
 
+    @traced("gauge.update")
     def setValue(self, value):
         self.value = max(self.min_value, min(self.max_value, value))
+        RENDER_SCHEDULER.mark_dirty(self)  # 다시 그리기는 다음 프레임에 한 번
+
+    def render_frame(self):
+        """RenderScheduler가 프레임마다 한 번 호출"""
         self.update()
 
-    def paintEvent(self, event):
-        try:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            rect = self.rect()
+    def _geometry(self):
+        """위젯 크기 기반 중심점/반지름 계산 (두께도 함께 갱신)"""
+        rect = self.rect()
 
-            # ✅ 타일 높이의 20%를 상단 여백으로 사용 (동적 계산)
-            top_margin = int(rect.height() * 0.2)
-            content_rect = rect.adjusted(0, top_margin, 0, 0)
+        # ✅ 타일 높이의 20%를 상단 여백으로 사용 (동적 계산)
+        top_margin = int(rect.height() * 0.2)
+        content_rect = rect.adjusted(0, top_margin, 0, 0)
 
-            # ✅ 콘텐츠 영역 기반으로 반지름 계산
-            center = content_rect.center()
-            radius = (content_rect.height() - 20) // 2  # 20px 패딩
+        # ✅ 콘텐츠 영역 기반으로 반지름 계산
+        center = content_rect.center()
+        radius = (content_rect.height() - 20) // 2  # 20px 패딩
 
-            # ✅ 동적으로 두께 계산 (반지름의 20%, 최소 5px)
-            self.outer_circle_thickness = max(5, int(radius * 0.3))
+        # ✅ 동적으로 두께 계산 (반지름의 20%, 최소 5px)
+        self.outer_circle_thickness = max(5, int(radius * 0.3))
+        return center, radius
 
+    def _static_layer(self, center, radius) -> QPixmap:
+        """크기/DPR이 같으면 캐시된 정적 레이어 반환"""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if key != self._static_cache_key:
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
             painter.translate(center)
-            self.drawInnerArc(painter, radius)
+            self.drawBackgroundArc(painter, radius)
             self.drawOuterArc(painter, radius)
+            painter.end()
+            self._static_cache = pixmap
+            self._static_cache_key = key
+        return self._static_cache
+
+    def resizeEvent(self, event):
+        self._static_cache_key = None  # 정적 레이어 다시 생성
+        super().resizeEvent(event)
+
+    @traced("gauge.paint")
+    def paintEvent(self, event):
+        try:
+            center, radius = self._geometry()
+            static_layer = self._static_layer(center, radius)
+
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, static_layer)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.translate(center)
+            self.drawInnerArc(painter, radius)
             self.drawCenterPercentage(painter, radius)
         except Exception as e:
             print(f"Error in paintEvent: {e}")
 
-    def drawInnerArc(self, painter, radius):
-        path = QPainterPath()
+    def drawBackgroundArc(self, painter, radius):
         outer_radius = radius
         inner_radius = radius - self.outer_circle_thickness
         total_angle = self.angle_range
-        filled_angle = total_angle * (self.value / 100)
 
         # 배경 아크 생성 (전체 각도)
         bg_path = QPainterPath()
@@ -114,10 +250,22 @@ class CircularGaugeWidget(QWidget):
         painter.setBrush(QColor(80, 80, 80, 180))  # 배경 색상
         painter.drawPath(bg_path)
 
+    def drawInnerArc(self, painter, radius):
+        outer_radius = radius
+        inner_radius = radius - self.outer_circle_thickness
+        total_angle = self.angle_range
+        filled_angle = total_angle * (self.value / 100)
+        bg_rect = QRectF(
+            -outer_radius, -outer_radius, 2 * outer_radius, 2 * outer_radius
+        )
+        inner_rect = QRectF(
+            -inner_radius, -inner_radius, 2 * inner_radius, 2 * inner_radius
+        )
+
         # 구간별 색상 결정 (80% 초록, 80~90% 노랑, 90% 이상 빨강)
-        if self.value <= 80:
+        if self.value <= self.WARNING_LEVEL:
             color = QColor(0, 200, 0, 180)  # 초록
-        elif 80 < self.value <= 90:
+        elif self.value <= self.CRITICAL_LEVEL:
             color = QColor(220, 200, 0, 180)  # 노랑
         else:
             color = QColor(220, 50, 50, 200)  # 빨강
@@ -130,6 +278,7 @@ class CircularGaugeWidget(QWidget):
         filled_path.arcTo(inner_rect, -self.start_angle - filled_angle, filled_angle)
 
         # 채워진 아크 그리기
+        painter.setPen(Qt.NoPen)
         painter.setBrush(color)
         painter.drawPath(filled_path)
 
@@ -191,21 +340,42 @@ class CircularGaugeWidget(QWidget):
         )
 
     def drawCenterPercentage(self, painter, radius):
-        if self.value <= 80:
+        if self.value <= self.WARNING_LEVEL:
             color = QColor(0, 200, 0, 180)  # 초록
-        elif 80 < self.value <= 90:
+        elif self.value <= self.CRITICAL_LEVEL:
             color = QColor(220, 200, 0, 180)  # 노랑
         else:
             color = QColor(220, 50, 50, 200)  # 빨강
         painter.setPen(color)
         # 폰트 크기를 위젯 크기에 맞게 동적으로 계산
         percent_font_size = max(10, int(radius * 0.2))  # 더 크게!
-        font = QFont(self.number_font_family, percent_font_size)
-        painter.setFont(font)
-        # 사각형을 충분히 크게 (중앙 정렬)
-        box_size = radius * 1.6  # 1.6~1.8 정도로 확대
-        text_rect = QRectF(-box_size / 2, -box_size / 2, box_size, box_size)
-        painter.drawText(text_rect, Qt.AlignCenter, f"{self.value:.0f}%")
+        if self._percent_font is None or self._percent_font.pointSize() != (
+            percent_font_size
+        ):
+            self._percent_font = QFont(self.number_font_family, percent_font_size)
+            self._percent_texts.clear()
+        painter.setFont(self._percent_font)
+
+        # ✅ 값별 QStaticText 캐시 (레이아웃 계산은 처음 한 번만)
+        text = f"{self.value:.0f}%"
+        static_text = self._percent_texts.get(text)
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+            static_text.prepare(painter.transform(), self._percent_font)
+            self._percent_texts[text] = static_text
+        size = static_text.size()
+        painter.drawStaticText(
+            QPointF(-size.width() / 2, -size.height() / 2), static_text
+        )
+
+
+def _create_gauge(tile_model, viewmodel):
+    return CircularGaugeWidget(core_id=tile_model.core_id, viewmodel=viewmodel)
+
+
+# ✅ 위젯 레지스트리 등록 (저장 파일의 "CircularGaugeWidget"도 같은 종류로 취급)
+register_widget("CircularGauge", _create_gauge, aliases=("CircularGaugeWidget",))
 
 
 if __name__ == "__main__":
@@ -220,6 +390,15 @@ if __name__ == "__main__":
     class DummyViewModel:
         cpu_data_updated = type("Signal", (), {"connect": lambda self, x: None})()
 
+        def subscribe(self, cores, callback, deadband=0.0, change_key=None):
+            return None
+
+        def get_history(self, core_id, num_points=None):
+            return None
+
+        def unsubscribe(self, subscription):
+            pass
+
     app = QApplication(sys.argv)
     qdarktheme.setup_theme("dark")
 
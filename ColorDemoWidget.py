@@ -0,0 +1,35 @@
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QPainter
+from WidgetRegistry import register_widget
+
+
+class ColorDemoWidget(QWidget):
+    def __init__(self, color=QColor(255, 100, 100, 180), parent=None):
+        super().__init__(parent)
+        self.color = color
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def rebind(self, core_id, viewmodel):
+        """풀에서 재사용 (데이터 구독이 없으므로 할 일 없음)"""
+
+    def detach(self):
+        """풀에 반납 (데이터 구독이 없으므로 할 일 없음)"""
+
+    def dispose(self):
+        self.deleteLater()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(self.color)
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(self.rect())
+
+
+# ✅ 위젯 레지스트리 등록
+register_widget(
+    "ColorDemoWidget",
+    lambda tile_model, viewmodel: ColorDemoWidget(color=QColor(255, 100, 100, 180)),
+)
@@ -0,0 +1,215 @@
+import math
+import time
+from collections import deque
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QColor, QImage, QPainter, QFont
+
+from SystemResourceViewModel import SystemResourceViewModel
+import TileDiagnostics
+from WidgetRegistry import register_widget
+from PerfInstrumentation import traced
+from RenderScheduler import RENDER_SCHEDULER
+
+# 사용률(%) → 색상 기준점 (사이는 선형 보간)
+_COLOR_STOPS = (
+    (0.0, (25, 35, 70)),
+    (50.0, (0, 200, 0)),
+    (80.0, (255, 255, 0)),
+    (90.0, (255, 160, 0)),
+    (100.0, (255, 0, 0)),
+)
+_EMPTY_COLOR = (30, 30, 30)  # 코어가 없는 빈 칸
+
+
+def _build_lut() -> np.ndarray:
+    """0~255 단계(0.4%) → 0xFFRRGGBB 조회 테이블 (마지막 칸은 빈 칸 색)"""
+    levels = np.linspace(0.0, 100.0, 256)
+    stops = [s[0] for s in _COLOR_STOPS]
+    channels = [
+        np.interp(levels, stops, [s[1][i] for s in _COLOR_STOPS]).astype(np.uint32)
+        for i in range(3)
+    ]
+    lut = np.empty(257, dtype=np.uint32)
+    lut[:256] = 0xFF000000 | (channels[0] << 16) | (channels[1] << 8) | channels[2]
+    r, g, b = _EMPTY_COLOR
+    lut[256] = 0xFF000000 | (r << 16) | (g << 8) | b
+    return lut
+
+
+_LUT = _build_lut()
+
+
+class CoreHeatmapWidget(QWidget):
+    """전체 코어를 이미지 한 장으로 그리는 히트맵 타일
+
+    history 모드: 행 = 코어, 열 = 시간 (모델 링 버퍼의 최근 num_points개)
+    cells 모드: 코어별 현재값을 위젯 비율에 맞춘 격자 칸으로 표시
+    값 → 색 변환은 조회 테이블 인덱싱 한 번으로 끝내고, 결과 배열을 그대로
+    QImage로 감싸 paintEvent에서 확대해 그린다 (코어 수와 무관하게 drawImage 1회).
+    """
+
+    MODE_HISTORY = "history"
+    MODE_CELLS = "cells"
+    MODES = (MODE_HISTORY, MODE_CELLS)
+    DEFAULT_MODE = MODE_HISTORY
+    TITLE_HEIGHT = 18
+
+    def __init__(
+        self,
+        viewmodel: SystemResourceViewModel = None,
+        mode: str = None,
+        num_points: int = 60,
+        parent=None,
+    ):
+        super().__init__(parent)
+        if mode is not None and mode not in self.MODES:
+            raise ValueError(f"알 수 없는 히트맵 모드: {mode} (가능: {self.MODES})")
+        self.viewmodel = None
+        self.mode = mode or self.DEFAULT_MODE
+        self.num_points = num_points
+        self.core_count = 0
+        self._paused = False
+        self._disposed = False
+        self._pixels = None  # QImage가 참조하는 ARGB 배열 (이미지보다 오래 살아야 함)
+        self._image = None
+        self._dirty = True
+        self.build_times = deque(maxlen=300)  # 이미지 생성 시간 (ms)
+        self.paint_times = deque(maxlen=300)
+        TileDiagnostics.track_widget(self)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(100, 60)
+        self._title_font = QFont("Arial", 9)
+        if viewmodel is not None:
+            self.rebind(None, viewmodel)
+
+    def rebind(self, core_id, viewmodel: SystemResourceViewModel):
+        """ViewModel 연결 (core_id는 쓰지 않음: 항상 전체 코어 표시)"""
+        self.detach()
+        self.viewmodel = viewmodel
+        viewmodel.cpu_data_updated.connect(self.on_cpu_updated)
+        self._dirty = True
+        self.update()
+
+    def detach(self):
+        """풀 반납/삭제 시 ViewModel 연결 해제"""
+        if self.viewmodel is not None:
+            try:
+                self.viewmodel.cpu_data_updated.disconnect(self.on_cpu_updated)
+            except TypeError:
+                pass  # 이미 끊어짐
+            self.viewmodel = None
+        RENDER_SCHEDULER.discard(self)
+
+    def dispose(self):
+        if self._disposed:
+            return
+        self._disposed = True
+        self.detach()
+        self._image = self._pixels = None
+        self.deleteLater()
+
+    def set_updates_paused(self, paused: bool):
+        """화면 밖에 있을 때 갱신 중지 (재개 시 최신 상태로 한 번 갱신)"""
+        self._paused = paused
+        if not paused:
+            self._dirty = True
+            self.update()
+
+    @traced("heatmap.update")
+    def on_cpu_updated(self, new_data: dict):
+        if self._paused:
+            return
+        self._dirty = True
+        RENDER_SCHEDULER.mark_dirty(self)  # 이미지는 다음 프레임에 한 번만 다시 만듦
+
+    def render_frame(self):
+        """RenderScheduler가 프레임마다 한 번 호출"""
+        self.update()
+
+    def render_stats(self) -> dict:
+        builds = list(self.build_times)
+        paints = list(self.paint_times)
+        return {
+            "renderer": f"heatmap/{self.mode}",
+            "cores": self.core_count,
+            "builds": len(builds),
+            "avg_build_ms": sum(builds) / len(builds) if builds else 0.0,
+            "avg_paint_ms": sum(paints) / len(paints) if paints else 0.0,
+        }
+
+    def _values(self) -> np.ndarray:
+        """모드에 맞는 (행 × 열) 사용률 배열 (빈 칸은 NaN)"""
+        window = self.viewmodel.get_history_window(self.num_points)
+        self.core_count = window.shape[0]
+        if self.mode != self.MODE_CELLS or window.shape[0] == 0:
+            return window
+        current = window[:, -1]
+        image_rect = self._image_rect()
+        aspect = image_rect.width() / max(image_rect.height(), 1.0)
+        cols = max(1, math.ceil(math.sqrt(len(current) * aspect)))
+        rows = math.ceil(len(current) / cols)
+        cells = np.full(rows * cols, np.nan)
+        cells[: len(current)] = current
+        return cells.reshape(rows, cols)
+
+    def _rebuild_image(self):
+        start = time.perf_counter()
+        self._dirty = False
+        if self.viewmodel is None:
+            self._image = None
+            return
+        values = self._values()
+        if values.size == 0:
+            self._image = None
+            return
+        # ✅ 값 → 조회 테이블 인덱스 → ARGB (전부 벡터 연산)
+        index = np.clip(values, 0.0, 100.0) * 2.55 + 0.5
+        index = np.where(np.isnan(values), 256, index).astype(np.intp)
+        self._pixels = np.ascontiguousarray(_LUT[index])
+        height, width = self._pixels.shape
+        self._image = QImage(
+            self._pixels.data, width, height, width * 4, QImage.Format_RGB32
+        )
+        self.build_times.append((time.perf_counter() - start) * 1000.0)
+
+    def _image_rect(self) -> QRectF:
+        return QRectF(
+            0, self.TITLE_HEIGHT, self.width(), self.height() - self.TITLE_HEIGHT
+        )
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.mode == self.MODE_CELLS:
+            self._dirty = True  # 격자 행/열 수가 위젯 비율을 따름
+
+    @traced("heatmap.paint")
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        if self._dirty:
+            self._rebuild_image()
+        painter = QPainter(self)
+        painter.setPen(QColor(220, 220, 220))
+        painter.setFont(self._title_font)
+        title = "history" if self.mode == self.MODE_HISTORY else "now"
+        painter.drawText(
+            QRectF(4, 0, self.width() - 8, self.TITLE_HEIGHT),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            f"CPU heatmap ({title}) · {self.core_count} cores",
+        )
+        if self._image is not None:
+            # 칸 경계가 번지지 않도록 보간 없이 확대
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+            painter.drawImage(self._image_rect(), self._image)
+        painter.end()
+        self.paint_times.append((time.perf_counter() - start) * 1000.0)
+
+
+def _create_heatmap(tile_model, viewmodel):
+    return CoreHeatmapWidget(viewmodel=viewmodel, mode=tile_model.mode)
+
+
+# ✅ 위젯 레지스트리 등록 (TileModel.mode로 모드 선택: "history"/"cells")
+register_widget("CoreHeatmap", _create_heatmap, aliases=("CoreHeatmapWidget",))
@@ -0,0 +1,232 @@
+import threading
+import time
+from typing import Callable, Dict, List
+
+import psutil
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from PerfInstrumentation import PERF
+
+
+def read_psutil_cpu() -> Dict[str, float]:
+    """psutil 코어별 사용률을 { "core1": 값, ... } 형태로 반환"""
+    cpu_percent = psutil.cpu_percent(percpu=True)
+    return {f"core{i+1}": val for i, val in enumerate(cpu_percent)}
+
+
+class _SamplerSource:
+    """샘플링 소스 하나의 설정과 측정 통계"""
+
+    def __init__(
+        self, name: str, read_fn: Callable[[], Dict[str, float]], period_ms: int
+    ):
+        self.name = name
+        self.read_fn = read_fn
+        self.period_ms = period_ms
+        self.next_due = 0.0  # time.monotonic() 기준 다음 샘플 시각
+        self.subscribers = []  # SystemResourceViewModel 목록
+        self.sample_log = (
+            None  # 장기 기록 (SampleLog, 구독자 수와 무관하게 한 번만 기록)
+        )
+        self.sample_count = 0  # 전달한 샘플 수 (poll 한 번에 여러 개일 수 있음)
+        self.poll_count = 0  # 성공한 poll/read 호출 수 (total_ms 기준)
+        self.late_count = 0  # 예정 시각보다 주기의 절반 이상 늦게 수행된 샘플
+        self.error_count = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+
+class CpuSampler(QObject):
+    """모든 탭이 공유하는 데이터 수집 서비스
+
+    샘플링은 백그라운드 스레드에서 수행하고, 결과는 각 ViewModel의
+    제한 크기 버퍼(push_sample)로 넘긴다. GUI 스레드는 프레임 타이머에서
+    버퍼를 비우므로(drain_samples) 프레임당 최대 한 번만 신호가 발생한다.
+    """
+
+    sample_ready = pyqtSignal(str, dict)  # (소스 이름, 최신 { "core1": 값, ... })
+
+    def __init__(self, parent=None, frame_interval_ms: int = 16):
+        super().__init__(parent)
+        self._sources: Dict[str, _SamplerSource] = {}
+        # 소스/구독자 목록 변경 보호 (샘플 전달 경로에는 사용하지 않음)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._latest: Dict[str, dict] = {}
+
+        # ✅ GUI 스레드 프레임 타이머: 버퍼를 비우고 화면 갱신
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(frame_interval_ms)
+        self._frame_timer.timeout.connect(self._drain)
+
+    def add_source(
+        self,
+        name: str,
+        read_fn: Callable[[], Dict[str, float]],
+        period_ms: int = 1000,
+        sample_log=None,
+    ):
+        """샘플링 소스 등록 (이미 있으면 교체, 구독자/장기 기록은 유지)
+
+        read_fn은 최신 샘플 dict를 반환하는 함수 또는 TelemetrySource.
+        sample_log(SampleLog)를 주면 이 소스의 모든 샘플을 한 번씩 기록한다.
+        """
+        with self._lock:
+            old = self._sources.get(name)
+            source = _SamplerSource(name, read_fn, period_ms)
+            if old:
+                source.subscribers = old.subscribers
+                source.sample_log = old.sample_log
+            if sample_log is not None:
+                source.sample_log = sample_log
+            self._sources[name] = source
+        self._wake.set()
+
+    def remove_source(self, name: str):
+        with self._lock:
+            self._sources.pop(name, None)
+
+    def set_period(self, name: str, period_ms: int):
+        """소스별 샘플링 주기 변경"""
+        with self._lock:
+            source = self._sources[name]
+            source.period_ms = period_ms
+            source.next_due = time.monotonic()
+        self._wake.set()
+
+    def subscribe(self, viewmodel, source: str = "cpu"):
+        """ViewModel을 소스에 연결 (샘플은 viewmodel.push_sample로 전달)"""
+        with self._lock:
+            subscribers = self._sources[source].subscribers
+            if viewmodel not in subscribers:
+                # 복사 후 교체: 작업 스레드는 잠금 없이 목록을 순회
+                self._sources[source].subscribers = subscribers + [viewmodel]
+
+    def unsubscribe(self, viewmodel, source: str = "cpu"):
+        with self._lock:
+            subscribers = self._sources[source].subscribers
+            if viewmodel in subscribers:
+                self._sources[source].subscribers = [
+                    vm for vm in subscribers if vm is not viewmodel
+                ]
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """작업 스레드와 프레임 타이머 시작"""
+        if self.is_running():
+            return
+        self._stop.clear()
+        now = time.monotonic()
+        with self._lock:
+            for source in self._sources.values():
+                source.next_due = now
+        self._thread = threading.Thread(
+            target=self._run, name="CpuSampler", daemon=True
+        )
+        self._thread.start()
+        self._frame_timer.start()
+
+    def stop(self, timeout: float = 2.0):
+        """작업 스레드 종료 대기 후 남은 샘플을 한 번 비움"""
+        self._frame_timer.stop()
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._drain()
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                sources = list(self._sources.values())
+            now = time.monotonic()
+            next_wake = now + 1.0
+            for source in sources:
+                if now >= source.next_due:
+                    self._sample_source(source, now)
+                    now = time.monotonic()
+                next_wake = min(next_wake, source.next_due)
+            self._wake.wait(max(0.0, next_wake - time.monotonic()))
+            self._wake.clear()
+
+    def _sample_source(self, source: _SamplerSource, now: float):
+        period = source.period_ms / 1000.0
+        if now - source.next_due > period / 2:
+            source.late_count += 1
+        # 밀린 주기는 건너뛰고 다음 예정 시각을 주기 격자에 맞춤
+        missed = int((now - source.next_due) // period) + 1
+        source.next_due += missed * period
+
+        start = time.perf_counter()
+        try:
+            # ✅ TelemetrySource는 그동안 쌓인 샘플을 모두 넘겨줌 (빠른 소스도 손실 없음)
+            poll = getattr(source.read_fn, "poll", None)
+            if poll is not None:
+                samples = poll()
+            else:
+                samples = [(time.time(), source.read_fn())]
+        except Exception as e:
+            source.error_count += 1
+            print(f"{source.name} 샘플링 실패: {e}")
+            return
+        end = time.perf_counter()
+        elapsed_ms = (end - start) * 1000.0
+        PERF.record("fetch_cpu_data", start, end)
+
+        source.poll_count += 1
+        source.total_ms += elapsed_ms
+        source.last_ms = elapsed_ms
+        source.max_ms = max(source.max_ms, elapsed_ms)
+        if not samples:
+            return
+
+        source.sample_count += len(samples)
+        if source.sample_log is not None:
+            # 큐에 넣기만 함 (디스크 쓰기는 SampleLog 쓰기 스레드)
+            for timestamp, values in samples:
+                source.sample_log.append(timestamp, values)
+        for viewmodel in source.subscribers:
+            for timestamp, values in samples:
+                viewmodel.push_sample(timestamp, values)
+        self._latest[source.name] = samples[-1][1]
+
+    def _drain(self):
+        """GUI 스레드: 구독 ViewModel의 버퍼를 비우고 최신 샘플 알림"""
+        with self._lock:
+            sources = list(self._sources.values())
+        for source in sources:
+            for viewmodel in source.subscribers:
+                viewmodel.drain_samples()
+            values = self._latest.pop(source.name, None)
+            if values is not None:
+                self.sample_ready.emit(source.name, values)
+
+    def stats(self) -> Dict[str, dict]:
+        """소스별 샘플링 비용 통계 (ms) 및 누락/지연 카운터"""
+        with self._lock:
+            sources = dict(self._sources)
+        return {
+            name: {
+                "period_ms": s.period_ms,
+                "samples": s.sample_count,
+                "polls": s.poll_count,
+                "last_ms": s.last_ms,
+                "avg_ms": s.total_ms / s.poll_count if s.poll_count else 0.0,
+                "max_ms": s.max_ms,
+                "late": s.late_count,
+                "errors": s.error_count,
+                "dropped": sum(vm.dropped_samples for vm in s.subscribers),
+                "subscribers": len(s.subscribers),
+            }
+            for name, s in sources.items()
+        }
+
+    def source_names(self) -> List[str]:
+        with self._lock:
+            return list(self._sources)
@@ -0,0 +1,340 @@
+"""대시보드 자체 비용 측정 (샘플 → 시그널 → 그리기)
+
+offscreen Qt 플랫폼에서 실행되며 결과를 JSON으로 출력한다.
+
+    python DashboardBenchmark.py --cores 16,64 --rate 10 --ticks 30 -o bench.json
+    python DashboardBenchmark.py --baseline bench.json  # 이전 결과 대비 회귀 검사
+
+측정 항목
+- widget: 위젯 종류별 위젯 하나의 그리기 시간, 틱당 종단 지연
+  (update_cpu_values 호출 ~ 렌더 프레임 ~ 모든 위젯 그리기 완료),
+  타일당 메모리(RSS 증가분)
+- view: 전체 MainTabWidget/SystemResourceView 장면의 틱당 지연
+- profile_switch: 프로필 전환(레이아웃 교체) 시간
+"""
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+import psutil
+from PyQt5.QtCore import Qt, QT_VERSION_STR
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QApplication
+
+from TelemetrySource import SyntheticSource
+
+# (이름, widget_type, renderer, mode)
+WIDGET_CASES = (
+    ("CircularGauge", "CircularGauge", None, None),
+    ("CPUGraphWidget[matplotlib]", "CPUGraphWidget", "matplotlib", None),
+    ("CPUGraphWidget[qpainter]", "CPUGraphWidget", "qpainter", None),
+    ("CoreHeatmap", "CoreHeatmap", None, "history"),
+)
+PROFILES = {
+    "ALL": ("CircularGauge", "CPUGraphWidget"),
+    "GRAPH": ("CPUGraphWidget",),
+    "GAUGE": ("CircularGauge",),
+}
+METRICS = ("paint_ms", "latency_ms", "switch_ms")  # 회귀 검사 대상 (p50 기준)
+
+
+def summarize(samples: List[float]) -> dict:
+    if not samples:
+        return {"n": 0}
+    values = np.asarray(samples)
+    return {
+        "n": len(samples),
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+def rss_bytes() -> int:
+    gc.collect()
+    return psutil.Process().memory_info().rss
+
+
+def pace(start: float, rate: float):
+    """rate(Hz)에 맞춰 남은 시간만큼 대기 (rate가 0이면 대기 없음)"""
+    if rate > 0:
+        remaining = 1.0 / rate - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def bench_widget(
+    app, name, widget_type, renderer, mode, cores, rate, ticks, max_widgets
+):
+    """위젯 종류 하나: 코어마다 위젯 하나 (히트맵은 전체 코어에 하나)"""
+    from SystemResourceModel import SystemResourceModel, TileModel
+    from SystemResourceViewModel import SystemResourceViewModel
+    from RenderScheduler import RENDER_SCHEDULER
+    from WidgetRegistry import WIDGET_REGISTRY
+
+    source = SyntheticSource(cores)
+    viewmodel = SystemResourceViewModel(SystemResourceModel())
+    viewmodel.update_cpu_values(source.sample())  # 코어 목록/이력 준비
+    core_ids = source.core_ids()[:max_widgets]
+    if widget_type == "CoreHeatmap":
+        core_ids = ["all"]
+
+    before = rss_bytes()
+    widgets = []
+    for core_id in core_ids:
+        tile = TileModel(0, 0, 200, 180, widget_type, core_id, renderer, mode)
+        widget = WIDGET_REGISTRY.acquire(tile, viewmodel)
+        widget.setAttribute(Qt.WA_DontShowOnScreen)
+        widget.resize(200, 180)
+        widget.show()
+        widgets.append(widget)
+    app.processEvents()
+    memory_per_tile = (rss_bytes() - before) / len(widgets)
+
+    image = QImage(200, 180, QImage.Format_ARGB32_Premultiplied)
+    for widget in widgets:
+        widget.render(image)  # 첫 그리기(캐시 생성)는 측정에서 제외
+
+    paint_ms, latency_ms, dispatch_ms, frame_ms = [], [], [], []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        viewmodel.update_cpu_values(source.sample())
+        dispatched = time.perf_counter()
+        RENDER_SCHEDULER.flush()  # 다음 프레임 타이머를 기다리지 않고 바로 반영
+        framed = time.perf_counter()
+        for widget in widgets:
+            paint_start = time.perf_counter()
+            widget.render(image)
+            paint_ms.append((time.perf_counter() - paint_start) * 1000.0)
+        end = time.perf_counter()
+        dispatch_ms.append((dispatched - start) * 1000.0)
+        frame_ms.append((framed - dispatched) * 1000.0)
+        latency_ms.append((end - start) * 1000.0)
+        app.processEvents()
+        pace(start, rate)
+
+    for widget in widgets:
+        widget.dispose()
+    WIDGET_REGISTRY.clear_pools()
+    app.processEvents()
+    return {
+        "scenario": "widget",
+        "widget": name,
+        "cores": cores,
+        "widgets": len(widgets),
+        "rate_hz": rate,
+        "ticks": ticks,
+        "paint_ms": summarize(paint_ms),
+        "dispatch_ms": summarize(dispatch_ms),
+        "render_frame_ms": summarize(frame_ms),
+        "latency_ms": summarize(latency_ms),
+        "memory_per_tile_kb": memory_per_tile / 1024.0,
+    }
+
+
+def write_profiles(directory: str, cores: int):
+    """코어 수에 맞는 프로필 파일(ALL/GRAPH/GAUGE) 생성"""
+    from SystemResourceModel import SystemResourceModel
+    from TileLayoutEngine import TileLayoutEngine
+
+    engine = TileLayoutEngine()
+    core_ids = [f"core{i+1}" for i in range(cores)]
+    for profile, widget_types in PROFILES.items():
+        document = {}
+        for system_name in ("AP1", "AP2", "MCU"):
+            model = SystemResourceModel()
+            for tile in engine.build_tiles(core_ids, widget_types):
+                model.add_tile(tile)
+            engine.pack(model.tiles, 1600)
+            document[system_name] = model.to_dict()
+        path = os.path.join(directory, f"dashboard_state_{profile}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f)
+    with open(os.path.join(directory, "app_config.json"), "w") as f:
+        json.dump({"last_profile": "ALL"}, f)
+
+
+def bench_view(app, cores, rate, ticks, switches):
+    """전체 장면: 틱당 지연과 프로필 전환 시간"""
+    from MainTabWidget import MainTabWidget
+    from RenderScheduler import RENDER_SCHEDULER
+
+    source = SyntheticSource(cores)
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        write_profiles(directory, cores)
+        os.chdir(directory)
+        try:
+            before = rss_bytes()
+            window = MainTabWidget(telemetry_source=SyntheticSource(cores))
+            window.sampler.stop()  # 틱은 아래에서 직접 공급
+            window.setAttribute(Qt.WA_DontShowOnScreen)
+            window.resize(1600, 900)
+            window.show()
+            app.processEvents()
+            view = window.get_view("AP1")
+            tiles = len(view.tiles)
+            memory_per_tile = (rss_bytes() - before) / max(tiles, 1)
+
+            image = QImage(window.size(), QImage.Format_ARGB32_Premultiplied)
+            window.render(image)
+            latency_ms = []
+            for _ in range(ticks):
+                start = time.perf_counter()
+                view.viewmodel.update_cpu_values(source.sample())
+                RENDER_SCHEDULER.flush()
+                window.render(image)
+                latency_ms.append((time.perf_counter() - start) * 1000.0)
+                app.processEvents()
+                pace(start, rate)
+            diagnostics = view.diagnostics()
+            results.append(
+                {
+                    "scenario": "view",
+                    "cores": cores,
+                    "tiles": tiles,
+                    "materialized": diagnostics.get("materialized", tiles),
+                    "rate_hz": rate,
+                    "ticks": ticks,
+                    "latency_ms": summarize(latency_ms),
+                    "memory_per_tile_kb": memory_per_tile / 1024.0,
+                }
+            )
+
+            switch_ms = []
+            profiles = ["GRAPH", "GAUGE", "ALL"]
+            for i in range(switches):
+                start = time.perf_counter()
+                window.set_profile(profiles[i % len(profiles)])
+                app.processEvents()
+                switch_ms.append((time.perf_counter() - start) * 1000.0)
+            results.append(
+                {
+                    "scenario": "profile_switch",
+                    "cores": cores,
+                    "switches": switches,
+                    "switch_ms": summarize(switch_ms),
+                    "pool_hit_rate": view.widget_registry.stats()["hit_rate"],
+                }
+            )
+            window.close()
+            window.deleteLater()
+            app.processEvents()
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def result_key(result: dict) -> str:
+    return "/".join(
+        str(result.get(k)) for k in ("scenario", "widget", "cores") if k in result
+    )
+
+
+def compare(results: List[dict], baseline_path: str, threshold: float) -> List[str]:
+    """기준 결과 대비 p50이 threshold배를 넘은 항목"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        old = baseline.get(result_key(result))
+        if old is None:
+            continue
+        for metric in METRICS:
+            new_p50 = result.get(metric, {}).get("p50")
+            old_p50 = old.get(metric, {}).get("p50")
+            if new_p50 and old_p50 and new_p50 > old_p50 * threshold:
+                regressions.append(
+                    f"{result_key(result)} {metric} p50 "
+                    f"{old_p50:.2f} → {new_p50:.2f} ms ({new_p50 / old_p50:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cores", default="16,64", help="코어 수 목록 (쉼표 구분)")
+    parser.add_argument("--rate", type=float, default=10.0, help="틱 속도 Hz (0=최대)")
+    parser.add_argument("--ticks", type=int, default=30)
+    parser.add_argument("--switches", type=int, default=9)
+    parser.add_argument(
+        "--max-widgets", type=int, default=32, help="종류별 최대 위젯 수"
+    )
+    parser.add_argument(
+        "--scenarios", default="widget,view", help="widget, view (쉼표 구분)"
+    )
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 (없으면 표준 출력)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    import qdarktheme
+
+    qdarktheme.setup_theme("dark")
+
+    scenarios = set(args.scenarios.split(","))
+    results = []
+    # 앱 로그(print)는 표준 에러로 보내 표준 출력에는 JSON만 남김
+    with contextlib.redirect_stdout(sys.stderr):
+        for cores in [int(c) for c in args.cores.split(",")]:
+            if "widget" in scenarios:
+                for name, widget_type, renderer, mode in WIDGET_CASES:
+                    results.append(
+                        bench_widget(
+                            app,
+                            name,
+                            widget_type,
+                            renderer,
+                            mode,
+                            cores,
+                            args.rate,
+                            args.ticks,
+                            args.max_widgets,
+                        )
+                    )
+            if "view" in scenarios:
+                results += bench_view(app, cores, args.rate, args.ticks, args.switches)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "platform": platform.platform(),
+            "cpu_count": psutil.cpu_count(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold)
+        for line in regressions:
+            print(f"⚠️ 회귀: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
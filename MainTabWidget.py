@@ -1,36 +1,137 @@
-from PyQt5.QtWidgets import QApplication, QTabWidget, QWidget, QVBoxLayout
+from StartupProfiler import STARTUP
+from PyQt5.QtWidgets import QApplication, QTabWidget, QWidget, QVBoxLayout, QLabel
 import sys
 from SystemResourceView import SystemResourceView
+from CpuSampler import CpuSampler
+from TelemetrySource import (
+    TelemetrySource,
+    PsutilSource,
+    add_telemetry_arguments,
+    telemetry_source_from_args,
+)
+from ProfileStore import ProfileStore
+from SampleLog import SampleLog
+import TileDiagnostics
 import qdarktheme
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
 import json
+import argparse
+
+STARTUP.mark("imports")
 
 
 class MainTabWidget(QTabWidget):
     current_profile_changed = pyqtSignal(str)  # ✅ 프로필 변경 신호
+    SYSTEM_NAMES = ("AP1", "AP2", "MCU")
 
-    def __init__(self):
+    def __init__(
+        self, telemetry_source: TelemetrySource = None, sample_log_dir: str = None
+    ):
         super().__init__()
+        self.sample_log_dir = sample_log_dir  # 설정하면 샘플 장기 기록
         self.current_profile = "ALL"  # 모든 탭이 공유하는 프로필
-        self._views = []  # 모든 SystemResourceView 인스턴스 저장
+        self._views = []  # 생성된 SystemResourceView 인스턴스 저장
+        self._first_paint_done = False
         self._load_current_profile()  # 앱 시작 시 프로필 불러오기
 
-        # 각 시스템별 리소스 뷰를 탭으로 추가
-        self.ap1_view = SystemResourceView(system_name="AP1", parent=self)
-        self.addTab(self.ap1_view, "AP1")
-        self._views.append(self.ap1_view)
+        # ✅ 모든 탭이 공유하는 프로필 저장소 (프로필 파일은 한 번만 파싱)
+        self.profile_store = ProfileStore()
+
+        # ✅ 모든 탭이 공유하는 CPU 샘플러 (틱당 한 번만 소스 호출)
+        # 소스는 실제 장비(psutil), 가상 부하, 기록 재생 중 하나
+        self.telemetry_source = telemetry_source or PsutilSource()
+        self.sampler = CpuSampler(self)
+        # ✅ 장기 기록은 소스당 하나 (모든 탭이 같은 샘플을 받으므로 탭마다 기록하지 않음)
+        self.sample_log = SampleLog(sample_log_dir, "cpu") if sample_log_dir else None
+        self.sampler.add_source(
+            "cpu",
+            self.telemetry_source,
+            period_ms=self.telemetry_source.period_ms,
+            sample_log=self.sample_log,
+        )
+
+        # 각 시스템별 탭은 처음 활성화될 때 생성 (그 전에는 가벼운 자리표시자)
+        for system_name in self.SYSTEM_NAMES:
+            self.addTab(self._make_placeholder(system_name), system_name)
+        self._ensure_view(self.currentIndex())
 
-        self.ap2_view = SystemResourceView(system_name="AP2", parent=self)
-        self.addTab(self.ap2_view, "AP2")
-        self._views.append(self.ap2_view)
+        # ✅ 보이는 탭만 위젯 갱신 (숨겨진 탭은 이력만 누적)
+        self.currentChanged.connect(self._on_current_tab_changed)
+        self._on_current_tab_changed(self.currentIndex())
 
-        self.mcu_view = SystemResourceView(system_name="MCU", parent=self)
-        self.addTab(self.mcu_view, "MCU")
-        self._views.append(self.mcu_view)
+        self.sampler.start()
 
         # ✅ 프로필 변경 시 모든 뷰 업데이트
         self.current_profile_changed.connect(self._broadcast_profile_change)
 
+    def _make_placeholder(self, system_name: str) -> QWidget:
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        label = QLabel(f"{system_name} 불러오는 중...")
+        label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(label)
+        placeholder.system_name = system_name
+        return placeholder
+
+    def _ensure_view(self, index: int):
+        """index 탭이 자리표시자이면 실제 SystemResourceView로 교체"""
+        tab = self.widget(index)
+        if tab is None or isinstance(tab, SystemResourceView):
+            return tab
+        system_name = tab.system_name
+        was_current = self.currentIndex() == index
+        view = SystemResourceView(system_name=system_name, parent=self)
+        self._views.append(view)
+        self.blockSignals(True)  # 교체 중 currentChanged 재진입 방지
+        self.removeTab(index)
+        self.insertTab(index, view, system_name)
+        if was_current:
+            self.setCurrentIndex(index)
+        self.blockSignals(False)
+        view.set_active(was_current)
+        tab.deleteLater()
+        return view
+
+    def get_view(self, system_name: str, create: bool = True):
+        """시스템 이름으로 뷰 조회 (create=True면 필요 시 생성)"""
+        for view in self._views:
+            if view.system_name == system_name:
+                return view
+        if create and system_name in self.SYSTEM_NAMES:
+            return self._ensure_view(self.SYSTEM_NAMES.index(system_name))
+        return None
+
+    def diagnostics(self) -> dict:
+        """전체 뷰의 살아있는 위젯/Figure/연결 수"""
+        result = TileDiagnostics.report([view.viewmodel for view in self._views])
+        result["tiles"] = sum(len(view.tiles) for view in self._views)
+        return result
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            # 자식 위젯까지 그려진 뒤(다음 이벤트 루프)에 시작 시간 보고
+            self._first_paint_done = True
+            QTimer.singleShot(0, self._report_startup)
+
+    def _report_startup(self):
+        STARTUP.finish()
+        STARTUP.print_report()
+
+    def _on_current_tab_changed(self, index: int):
+        self._ensure_view(index)
+        current = self.widget(index)
+        for view in self._views:
+            view.set_active(view is current)
+
+    def closeEvent(self, event):
+        self.sampler.stop()  # ✅ 수집 스레드 정리
+        self.telemetry_source.close()  # 기록 중이면 파일 닫기
+        if self.sample_log is not None:
+            self.sample_log.close()  # 남은 샘플 기록 후 쓰기 스레드 종료
+        self.profile_store.flush()  # ✅ 저장 대기 중인 레이아웃 변경 기록
+        super().closeEvent(event)
+
     def _broadcast_profile_change(self, profile_name):
         for idx in range(self.count()):
             tab = self.widget(idx)
@@ -62,9 +163,18 @@ class MainTabWidget(QTabWidget):
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="System Resource Dashboard")
+    add_telemetry_arguments(parser)
+    parser.add_argument(
+        "--sample-log", metavar="DIR", help="시스템별 샘플 장기 기록 폴더"
+    )
+    args, qt_args = parser.parse_known_args()
+    app = QApplication(sys.argv[:1] + qt_args)
     qdarktheme.setup_theme("dark")
-    window = MainTabWidget()
+    window = MainTabWidget(
+        telemetry_source=telemetry_source_from_args(args),
+        sample_log_dir=args.sample_log,
+    )
     window.setWindowTitle("System Resource Dashboard")
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,226 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def tile_label(obj) -> Optional[str]:
+    """계측 대상이 속한 타일 이름 ("위젯종류/코어", 타일이 아니면 None)
+
+    타일 아이템은 tile_model로, 위젯은 레지스트리가 붙인 widget_type/core_id로
+    찾고, 그래프 캔버스처럼 위젯 안의 자식이면 부모 위젯에서 찾는다.
+    """
+    tile_model = getattr(obj, "tile_model", None)
+    if tile_model is not None:
+        return f"{tile_model.widget_type}/{tile_model.core_id}"
+    for _ in range(3):
+        widget_type = getattr(obj, "widget_type", None)
+        if widget_type is not None:
+            return f"{widget_type}/{getattr(obj, 'core_id', None) or 'all'}"
+        parent = getattr(obj, "parentWidget", None)
+        obj = parent() if parent is not None else None
+        if obj is None:
+            break
+    return None
+
+
+class _Span:
+    """with 블록 하나의 소요 시간 기록"""
+
+    __slots__ = ("perf", "name", "tile", "start")
+
+    def __init__(self, perf: "PerfInstrumentation", name: str, tile: Optional[str]):
+        self.perf = perf
+        self.name = name
+        self.tile = tile
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.perf.record(self.name, self.start, time.perf_counter(), self.tile)
+        return False
+
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 쓰는 빈 블록 (아무것도 기록하지 않음)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class PerfInstrumentation:
+    """핫 패스 구간별 소요 시간 기록 (꺼져 있으면 enabled 확인 한 번만 함)
+
+    구간은 이름별 최근 소요 시간, 타일별 최근 비용, 트레이스 이벤트로 쌓인다.
+    프레임(뷰 paintEvent 한 번)은 frame()으로 따로 기록해 FPS와 프레임 시간
+    분포를 계산한다. export_chrome_trace()는 Chrome 트레이스 형식(JSON)으로
+    저장하므로 chrome://tracing, Perfetto 등에서 열 수 있다.
+    수집 스레드에서도 record()를 호출하므로 deque의 원자적 append만 사용한다.
+    """
+
+    MAX_EVENTS = 200000  # 트레이스로 보관할 최근 이벤트 수
+    WINDOW = 600  # 이름별/프레임 분포 계산에 쓰는 최근 샘플 수
+    TILE_WINDOW_S = 1.0  # 타일 비용(ms/s) 집계 구간
+
+    def __init__(self):
+        self.enabled = False
+        self._reset()
+
+    def _reset(self):
+        self.t0 = time.perf_counter()
+        # (이름, 스레드 id, 시작 s, 소요 s, 타일)
+        self._events = deque(maxlen=self.MAX_EVENTS)
+        self._durations: Dict[str, deque] = {}  # 이름 → 최근 소요 시간 (ms)
+        self._tiles: Dict[str, deque] = {}  # 타일 → 최근 (끝 시각, 소요 ms)
+        self._frames = deque(maxlen=self.WINDOW)  # (끝 시각, 소요 ms)
+        self._thread_names: Dict[int, str] = {}
+
+    def set_enabled(self, enabled: bool):
+        """계측 켜기/끄기 (켤 때 이전 기록은 지움)"""
+        if enabled and not self.enabled:
+            self._reset()
+        self.enabled = enabled
+
+    def span(self, name: str, tile: Optional[str] = None):
+        """with PERF.span("이름"): ... 구간 측정"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, tile)
+
+    def record(self, name: str, start: float, end: float, tile: Optional[str] = None):
+        """perf_counter 기준 시작/끝 시각으로 구간 하나 기록"""
+        if not self.enabled:
+            return
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        elapsed_ms = (end - start) * 1000.0
+        self._events.append((name, tid, start, end - start, tile))
+        durations = self._durations.get(name)
+        if durations is None:
+            durations = self._durations.setdefault(name, deque(maxlen=self.WINDOW))
+        durations.append(elapsed_ms)
+        if tile is not None:
+            costs = self._tiles.get(tile)
+            if costs is None:
+                costs = self._tiles.setdefault(tile, deque(maxlen=self.WINDOW))
+            costs.append((end, elapsed_ms))
+
+    def frame(self, start: float, end: float):
+        """화면 한 프레임(뷰 그리기) 기록"""
+        if not self.enabled:
+            return
+        self._frames.append((end, (end - start) * 1000.0))
+        self.record("frame", start, end)
+
+    @staticmethod
+    def _percentiles(values) -> dict:
+        if not values:
+            return {"n": 0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+        array = np.fromiter(values, dtype=np.float64)
+        p50, p99 = np.percentile(array, (50, 99))
+        return {
+            "n": len(array),
+            "p50": float(p50),
+            "p99": float(p99),
+            "max": float(array.max()),
+        }
+
+    def slowest_tiles(self, count: int = 5) -> List[tuple]:
+        """최근 TILE_WINDOW_S 동안 계측 시간 합이 큰 타일 [(타일, ms/s), ...]"""
+        since = time.perf_counter() - self.TILE_WINDOW_S
+        costs = []
+        for tile, samples in list(self._tiles.items()):
+            total = sum(ms for end, ms in list(samples) if end >= since)
+            if total > 0:
+                costs.append((tile, total / self.TILE_WINDOW_S))
+        costs.sort(key=lambda item: item[1], reverse=True)
+        return costs[:count]
+
+    def summary(self, tiles: int = 5) -> dict:
+        """FPS, 프레임 시간 분포, 구간별 분포, 가장 느린 타일"""
+        now = time.perf_counter()
+        frames = list(self._frames)
+        return {
+            "fps": sum(1 for end, _ in frames if end >= now - 1.0),
+            "frame_ms": self._percentiles([ms for _, ms in frames]),
+            "spans": {
+                name: self._percentiles(list(durations))
+                for name, durations in list(self._durations.items())
+                if name != "frame"
+            },
+            "slowest_tiles": self.slowest_tiles(tiles),
+            "events": len(self._events),
+        }
+
+    def export_chrome_trace(self, filename: str) -> int:
+        """Chrome 트레이스 형식으로 저장, 기록한 구간(span) 수 반환
+
+        스레드 이름 메타데이터 이벤트는 함께 저장하지만 반환값에는 세지 않는다.
+        """
+        pid = os.getpid()
+        events = list(self._events)
+        trace = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in list(self._thread_names.items())
+        ]
+        for name, tid, start, duration, tile in events:
+            event = {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (start - self.t0) * 1e6,  # µs
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            if tile is not None:
+                event["args"] = {"tile": tile}
+            trace.append(event)
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+
+# 프로세스 전체에서 공유하는 인스턴스 (기본은 꺼짐)
+PERF = PerfInstrumentation()
+
+
+def traced(name: str):
+    """메서드 계측 데코레이터 (self가 속한 타일 이름을 함께 기록)"""
+
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not PERF.enabled:
+                return method(self, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                PERF.record(name, start, time.perf_counter(), tile_label(self))
+
+        return wrapper
+
+    return decorate
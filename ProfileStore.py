@@ -0,0 +1,270 @@
+import json
+import os
+import stat
+import tempfile
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from PyQt5.QtCore import QTimer
+
+from SystemResourceModel import SystemResourceModel, TileModel
+from StartupProfiler import STARTUP
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+class ProfileStore:
+    """프로필 파일(dashboard_state_<PROFILE>.json) 파싱 결과를 뷰 간에 공유
+
+    파일마다 한 번만 파싱하고 시스템별 SystemResourceModel을 캐시한다.
+    파일 수정 시각(mtime)이 바뀌면 해당 프로필 캐시를 버리고 다시 읽는다.
+
+    저장도 모든 뷰가 이 저장소 하나를 거친다. mark_dirty()로 변경을 모아 두었다가
+    debounce_ms 동안 추가 변경이 없으면 프로필 파일마다 한 번만 쓴다.
+    변경된 시스템 섹션만 다시 직렬화하고(압축 형식은 변경된 타일 행만),
+    임시 파일에 쓴 뒤 os.replace로 교체해 쓰는 도중에도 파일이 깨지지 않는다.
+    """
+
+    COMPACT_TILE_THRESHOLD = 1000  # compact=None일 때 이 이상이면 압축 형식
+
+    def __init__(
+        self,
+        filename_pattern: str = "dashboard_state_{profile}.json",
+        debounce_ms: int = 500,
+        compact: Optional[bool] = None,
+    ):
+        self.filename_pattern = filename_pattern
+        self.compact = compact  # None이면 타일 수에 따라 자동 선택
+        # profile → (mtime, 파싱된 전체 문서)
+        # 저장 후에는 _models/_sections 쪽이 최신이며 문서는 파싱 시점 그대로다.
+        # (파싱 후 새로 저장한 시스템은 문서에 없고 _sections에만 있다)
+        self._documents: Dict[str, Tuple[float, dict]] = {}
+        # (profile, system_name) → 모델
+        self._models: Dict[Tuple[str, str], SystemResourceModel] = {}
+        # (profile, system_name) → (압축 여부, 직렬화된 섹션 텍스트)
+        self._sections: Dict[Tuple[str, str], Tuple[bool, str]] = {}
+        # (profile, system_name) → {id(tile): (tile, 직렬화된 행)} (압축 형식용)
+        self._rows: Dict[Tuple[str, str], Dict[int, Tuple[TileModel, str]]] = {}
+        # profile → {system_name: 변경된 타일 집합 (None이면 전체)}
+        self._pending: Dict[str, Dict[str, Optional[Set[int]]]] = {}
+        self.parse_count = 0  # 실제로 파일을 읽고 파싱한 횟수
+        self.write_count = 0  # 실제로 파일을 쓴 횟수
+        self.serialized_sections = 0  # 다시 직렬화한 시스템 섹션 수
+        self.last_write_ms = 0.0
+
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(debounce_ms)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def filename(self, profile: str) -> str:
+        return self.filename_pattern.format(profile=profile)
+
+    def _mtime(self, profile: str) -> Optional[float]:
+        try:
+            return os.stat(self.filename(profile)).st_mtime
+        except OSError:
+            return None
+
+    def has_layout(self, profile: str) -> bool:
+        filename = self.filename(profile)
+        return os.path.exists(filename) and os.path.getsize(filename) > 0
+
+    def invalidate(self, profile: str = None):
+        """캐시 삭제 (profile이 None이면 전체)"""
+        if profile is None:
+            self._documents.clear()
+            self._models.clear()
+            self._sections.clear()
+            self._rows.clear()
+            return
+        self._documents.pop(profile, None)
+        for cache in (self._models, self._sections, self._rows):
+            for key in [k for k in cache if k[0] == profile]:
+                del cache[key]
+
+    def load_document(self, profile: str) -> dict:
+        """파싱된 프로필 문서 반환 (파일이 없으면 빈 dict)"""
+        mtime = self._mtime(profile)
+        cached = self._documents.get(profile)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        self.invalidate(profile)
+        document = {}
+        if mtime is not None:
+            with STARTUP.phase("layout_parse"):
+                with open(self.filename(profile), "r", encoding="utf-8") as f:
+                    document = json.load(f)
+            self.parse_count += 1
+        self._documents[profile] = (mtime, document)
+        return document
+
+    def get_model(
+        self, profile: str, system_name: str
+    ) -> Optional[SystemResourceModel]:
+        """프로필의 시스템별 모델 (데이터가 없으면 None)"""
+        document = self.load_document(profile)
+        key = (profile, system_name)
+        model = self._models.get(key)
+        if model is None:
+            data = document.get(system_name)
+            if not data:
+                return None
+            model = SystemResourceModel.from_dict(data)
+            self._models[key] = model
+        return model
+
+    def mark_dirty(
+        self,
+        profile: str,
+        system_name: str,
+        model: SystemResourceModel,
+        tiles=None,
+    ):
+        """시스템 모델 변경 기록 후 지연 저장 예약 (tiles가 None이면 전체 변경)"""
+        self._models[(profile, system_name)] = model
+        systems = self._pending.setdefault(profile, {})
+        if tiles is None or (system_name in systems and systems[system_name] is None):
+            systems[system_name] = None
+        else:
+            dirty = systems.setdefault(system_name, set())
+            dirty.update(id(tile) for tile in tiles)
+        self._flush_timer.start()  # 다시 시작: 연속 편집은 한 번의 쓰기로 합침
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def save_model(self, profile: str, system_name: str, model: SystemResourceModel):
+        """시스템 섹션 전체를 즉시 저장 (다른 시스템 섹션은 캐시에서 유지)"""
+        self.mark_dirty(profile, system_name, model)
+        self.flush()
+
+    def flush(self):
+        """예약된 변경을 프로필 파일마다 한 번씩 기록"""
+        self._flush_timer.stop()
+        pending, self._pending = self._pending, {}
+        for profile, systems in pending.items():
+            self._write_profile(profile, systems)
+
+    def _use_compact(self, model: SystemResourceModel) -> bool:
+        if self.compact is not None:
+            return self.compact
+        return len(model.tiles) >= self.COMPACT_TILE_THRESHOLD
+
+    def _write_profile(self, profile: str, dirty: Dict[str, Optional[Set[int]]]):
+        start = time.perf_counter()
+        # 변경 중인 모델은 파일이 바뀌어 캐시가 비워져도 잃지 않도록 먼저 잡아 둠
+        models = {name: self._models[(profile, name)] for name in dirty}
+        document = self.load_document(profile)
+        for name, model in models.items():
+            self._models[(profile, name)] = model
+
+        # 파싱 이후 새로 쓴 섹션(문서에는 없고 섹션 캐시에만 있음)도 유지
+        names = list(document)
+        names += [
+            key[1]
+            for key in self._sections
+            if key[0] == profile and key[1] not in document
+        ]
+        names += [name for name in models if name not in names]
+        sections = []
+        for name in names:
+            key = (profile, name)
+            cached = self._sections.get(key)
+            if name in models:
+                model = models[name]
+                compact = self._use_compact(model)
+                # 같은 형식으로 직렬화한 적이 있을 때만 변경된 타일만 다시 직렬화
+                tiles = dirty[name] if cached and cached[0] == compact else None
+                text = self._serialize_model(key, model, compact, tiles)
+                self._sections[key] = cached = (compact, text)
+                self.serialized_sections += 1
+            elif cached is None:
+                # 변경되지 않은 섹션은 파일 내용 그대로 (처음 한 번만 직렬화)
+                text = json.dumps(document[name], indent=2)
+                self._sections[key] = cached = (False, text)
+                self.serialized_sections += 1
+            sections.append((name, cached[1]))
+
+        self._write_atomic(self.filename(profile), self._compose(sections))
+        self._documents[profile] = (self._mtime(profile), document)
+        self.write_count += 1
+        self.last_write_ms = (time.perf_counter() - start) * 1000.0
+
+    def _serialize_model(
+        self,
+        key: Tuple[str, str],
+        model: SystemResourceModel,
+        compact: bool,
+        dirty_tiles: Optional[Set[int]],
+    ) -> str:
+        """시스템 섹션 직렬화 (압축 형식은 변경되지 않은 타일 행을 재사용)"""
+        if not compact:
+            self._rows.pop(key, None)
+            return json.dumps(model.to_dict(), indent=2)
+
+        old_rows = self._rows.get(key, {})
+        rows = {}
+        for tile in model.tiles:
+            cached = old_rows.get(id(tile))
+            if (
+                cached is None
+                or cached[0] is not tile
+                or dirty_tiles is None
+                or id(tile) in dirty_tiles
+            ):
+                text = json.dumps(tile.to_row(), separators=_COMPACT_SEPARATORS)
+                cached = (tile, text)
+            rows[id(tile)] = cached
+        self._rows[key] = rows
+        cpu_cores = json.dumps(model.cpu_cores, separators=_COMPACT_SEPARATORS)
+        columns = json.dumps(list(TileModel.FIELDS), separators=_COMPACT_SEPARATORS)
+        return (
+            f'{{"cpu_cores":{cpu_cores},"tile_columns":{columns},"tile_rows":['
+            + ",".join(rows[id(tile)][1] for tile in model.tiles)
+            + "]}"
+        )
+
+    @staticmethod
+    def _compose(sections) -> str:
+        """섹션 텍스트를 이어 붙여 json.dump(indent=2)와 같은 모양의 문서 생성"""
+        if not sections:
+            return "{}"
+        body = ",\n  ".join(
+            f"{json.dumps(name)}: {text.replace(chr(10), chr(10) + '  ')}"
+            for name, text in sections
+        )
+        return "{\n  " + body + "\n}"
+
+    @staticmethod
+    def _file_mode(filename: str) -> int:
+        """기존 파일의 권한 (없으면 open()으로 새로 만들 때와 같은 0o666 & ~umask)"""
+        try:
+            return stat.S_IMODE(os.stat(filename).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    @staticmethod
+    def _write_atomic(filename: str, text: str):
+        """같은 폴더의 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 파일 유지)"""
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(filename)}.", suffix=".tmp", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp는 0600으로 만들므로 open()으로 쓸 때와 같은 권한으로 맞춤
+            os.chmod(temp_path, ProfileStore._file_mode(filename))
+            os.replace(temp_path, filename)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,104 @@
+import time
+from typing import Dict
+
+from PyQt5 import sip
+from PyQt5.QtCore import QTimer
+
+from PerfInstrumentation import PERF
+
+
+class RenderScheduler:
+    """데이터 도착과 다시 그리기를 분리하는 프레임 단위 스케줄러
+
+    위젯은 샘플을 받으면 값만 기록하고 mark_dirty()로 표시해 둔다.
+    스케줄러는 max_fps 간격마다 한 번, 표시된 위젯의 render_frame()을 호출하므로
+    샘플링 속도를 올려도(10~50 Hz) 타일당 다시 그리기는 프레임당 최대 한 번이다.
+    max_fps가 0이면 제한 없이 mark_dirty() 즉시 그린다.
+    """
+
+    DEFAULT_MAX_FPS = 30
+    FPS_CHOICES = (15, 30, 60, 0)  # 메뉴에서 고를 수 있는 값 (0 = 제한 없음)
+
+    def __init__(self, max_fps: int = DEFAULT_MAX_FPS):
+        self.max_fps = max_fps
+        self._dirty: Dict[int, object] = {}  # id(위젯) → 위젯 (표시된 순서 유지)
+        self._timer = None  # QApplication 생성 후 처음 필요할 때 만듦
+        self._last_frame = 0.0
+        self.marks = 0  # mark_dirty 호출 수
+        self.frames = 0  # 실제로 그린 프레임 수
+        self.renders = 0  # 프레임에서 그린 위젯 수 (marks - renders = 합쳐진 갱신)
+        self.last_frame_ms = 0.0
+        self._total_frame_ms = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_fps > 0
+
+    def set_max_fps(self, max_fps: int):
+        """프레임 상한 변경 (0이면 대기 중인 위젯을 바로 그리고 이후 즉시 모드)"""
+        self.max_fps = max_fps
+        if not self.enabled:
+            self.flush()
+
+    def mark_dirty(self, widget):
+        """다음 프레임에 widget.render_frame() 호출 예약 (같은 프레임 안에서는 한 번)"""
+        if not self.enabled:
+            widget.render_frame()
+            return
+        self.marks += 1
+        self._dirty[id(widget)] = widget
+        self._schedule()
+
+    def discard(self, widget):
+        """위젯 반납/삭제 시 예약 취소"""
+        self._dirty.pop(id(widget), None)
+
+    def has_pending(self) -> bool:
+        return bool(self._dirty)
+
+    def _schedule(self):
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        if self._timer.isActive():
+            return
+        # 마지막 프레임에서 1/max_fps가 지나지 않았으면 남은 시간만큼 기다림
+        wait = self._last_frame + 1.0 / self.max_fps - time.perf_counter()
+        self._timer.start(max(0, int(wait * 1000.0)))
+
+    def flush(self):
+        """표시된 위젯을 지금 그림 (프레임 타이머 또는 직접 호출)"""
+        if self._timer is not None:
+            self._timer.stop()
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        start = time.perf_counter()
+        self._last_frame = start
+        for widget in dirty.values():
+            # dispose()를 거치지 않고 삭제된 위젯(부모와 함께 삭제 등)만 건너뜀
+            if sip.isdeleted(widget):
+                continue
+            widget.render_frame()
+        end = time.perf_counter()
+        PERF.record("render_frame", start, end)
+        self.frames += 1
+        self.renders += len(dirty)
+        self.last_frame_ms = (end - start) * 1000.0
+        self._total_frame_ms += self.last_frame_ms
+
+    def stats(self) -> dict:
+        return {
+            "max_fps": self.max_fps,
+            "marks": self.marks,
+            "frames": self.frames,
+            "renders": self.renders,
+            "coalesced": self.marks - self.renders - len(self._dirty),
+            "pending": len(self._dirty),
+            "avg_frame_ms": self._total_frame_ms / self.frames if self.frames else 0.0,
+        }
+
+
+# 앱 전체에서 공유하는 스케줄러 (모든 탭의 타일이 같은 프레임에 그려짐)
+RENDER_SCHEDULER = RenderScheduler()
@@ -1,5 +1,6 @@
 import sys
 import json
+import time
 from PyQt5.QtWidgets import (
     QApplication,
     QWidget,
@@ -13,19 +14,51 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
     QMenu,
 )
-from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer
 from PyQt5.QtGui import QBrush, QColor, QPainter, QPen, QPainterPath, QFont, QRegion
 from PyQt5.QtWidgets import QGraphicsSimpleTextItem
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from SystemResourceModel import SystemResourceModel
 from SystemResourceViewModel import SystemResourceViewModel
 
-from CircularGaugeWidget import CircularGaugeWidget  # CircularGaugeWidget
-from CPUGraphWidget import CPUGraphWidget
 import qdarktheme
 from SystemResourceModel import TileModel
+from SpatialIndex import SpatialIndex
+from PerfInstrumentation import traced
+
+
+class ProxyGeometryTimer(QTimer):
+    """throttled 크기 조절에서 보류한 위젯 크기 적용을 한 번 예약하는 타이머
+
+    뷰가 하나를 소유해 모든 타일이 함께 쓰고, 레이아웃을 바꿀 때(apply_tile_models)나
+    타일을 제거할 때 cancel()한다. 타일은 QObject가 아니므로 람다 대신 예약한
+    타일을 기억해 두었다가, 이미 삭제된 타일이면 건너뛴다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSingleShot(True)
+        self._tile = None
+        self.timeout.connect(self._fire)
+
+    def schedule(self, tile: "ResizableTileItem", delay_ms: int):
+        self._tile = tile
+        self.start(delay_ms)
+
+    def cancel(self, tile: "ResizableTileItem" = None):
+        """예약 취소 (tile을 주면 그 타일이 예약한 경우만)"""
+        if tile is not None and tile is not self._tile:
+            return
+        self.stop()
+        pending, self._tile = self._tile, None
+        if pending is not None and not sip.isdeleted(pending):
+            pending._proxy_update_pending = False
+
+    def _fire(self):
+        tile, self._tile = self._tile, None
+        if tile is not None and not sip.isdeleted(tile):
+            tile._flush_proxy_geometry()
 
 
 class ResizableTileItem(QGraphicsRectItem):
@@ -39,6 +72,11 @@ class ResizableTileItem(QGraphicsRectItem):
     HANDLE_TOPRIGHT = "topright"
     HANDLE_TOPLEFT = "topleft"
 
+    # 크기 조절 드래그 중 내부 위젯 처리 방식
+    RESIZE_MODE_OUTLINE = "outline"  # 위젯을 숨기고 타일 외곽만 표시, 놓을 때 적용
+    RESIZE_MODE_THROTTLED = "throttled"  # 위젯 크기를 프레임당 최대 한 번만 변경
+    RESIZE_FRAME_MS = 16  # throttled 모드의 최소 간격 (약 60 FPS)
+
     def __init__(
         self,
         grid_size,
@@ -75,6 +113,21 @@ class ResizableTileItem(QGraphicsRectItem):
         self.all_tiles = all_tiles or []
         self.tile_model = tile_model
         self.proxy_inset = 10
+        self.on_screen = True  # 뷰포트 안에 있는지 (밖이면 위젯 갱신 중지)
+        self.widget_registry = None  # 설정되면 제거 시 위젯을 풀에 반납
+        self.spatial_index = None  # 같은 씬 타일의 공간 인덱스 (attach_index)
+        self._dragging = False  # 마우스로 이동 중 (선택 타일 전체를 함께 옮김)
+        self._drag_group = {}  # 함께 이동하는 타일 → 누를 때 위치
+        self._drag_start = None  # 누를 때 씬 좌표
+        self._resize_group = []  # 함께 크기가 바뀌는 다른 선택 타일
+        self.resize_mode = self.RESIZE_MODE_OUTLINE
+        self._live_resizing = False  # 크기 조절 드래그 중 (위젯 크기 적용 보류)
+        self._proxy_update_pending = False
+        self._pending_proxy_tiles = []  # throttled 모드: 보류 중인 그룹
+        self.proxy_timer = None  # 뷰가 공유하는 ProxyGeometryTimer (없으면 자체 생성)
+        self._last_proxy_update = 0.0  # throttled 모드: 마지막 그룹 적용 시각
+        self._proxy_update_cost_ms = 0.0  # throttled 모드: 적용~다시 그리기 소요 시간
+        self._proxy_update_started = None
         self.resize_direction = self.HANDLE_NONE
 
         if scene_rect is None:
@@ -85,6 +138,8 @@ class ResizableTileItem(QGraphicsRectItem):
 
         self.proxy = QGraphicsProxyWidget(self)
         self.proxy.setWidget(widget)
+        if widget is not None and widget.isHidden():
+            widget.show()  # 풀에서 재사용한 위젯은 반납 시 숨겨져 있음
         self.proxy.setAcceptHoverEvents(False)  # 프록시 위젯이 hover 이벤트를 받지 않게
         self.setZValue(1)  # 타일이 ProxyWidget보다 위에 오도록
         self.proxy.setZValue(0)  # 프록시 위젯은 기본값(0)
@@ -133,13 +188,123 @@ class ResizableTileItem(QGraphicsRectItem):
         if widget:
             widget.resize(widget_width, widget_height)
             widget.updateGeometry()
+        self._update_text_position()
 
+    def _update_text_position(self):
         # 텍스트 위치 재조정 (상단 중앙)
+        tile_rect = self.rect()
         text_rect = self.text_item.boundingRect()
         x = (tile_rect.width() - text_rect.width()) / 2
         y = 4
         self.text_item.setPos(x, y)
 
+    def index_rect(self, pos: QPointF = None, rect: QRectF = None):
+        """공간 인덱스에 쓰는 씬 좌표 (x, y, 폭, 높이)"""
+        pos = self.pos() if pos is None else pos
+        rect = self.rect() if rect is None else rect
+        return (pos.x(), pos.y(), rect.width(), rect.height())
+
+    def attach_index(self, spatial_index: SpatialIndex):
+        """공간 인덱스 등록 (이후 이동/크기 변경 시 자동 갱신)"""
+        self.spatial_index = spatial_index
+        spatial_index.insert(self, self.index_rect())
+
+    def _sync_index(self):
+        if self.spatial_index is not None and self.scene() is not None:
+            self.spatial_index.update(self, self.index_rect())
+
+    def _blocked(self, candidate, ignore=()) -> bool:
+        """candidate 위치에서 지금은 겹치지 않는 타일과 새로 겹치는지
+
+        원래 겹쳐 있던 타일(이전 레이아웃 등)은 무시해 움직일 수 없게 되지 않도록 한다.
+        ignore의 타일(함께 이동 중인 선택 타일)은 충돌로 보지 않는다.
+        """
+        if self.spatial_index is None:
+            return False
+        hits = self.spatial_index.query(candidate, exclude=(self,))
+        if ignore:
+            hits = {item for item in hits if item not in ignore}
+        if not hits:
+            return False
+        current = self.spatial_index.query(self.index_rect(), exclude=(self,))
+        return bool(hits - current)
+
+    def setRect(self, *args):
+        super().setRect(*args)
+        self._sync_index()
+
+    def _begin_live_resize(self):
+        """크기 조절 드래그 시작: outline 모드면 위젯을 숨기고 갱신 중지"""
+        self._live_resizing = True
+        if self.resize_mode == self.RESIZE_MODE_OUTLINE:
+            self.proxy.hide()
+            widget = self.proxy.widget()
+            if widget is not None and hasattr(widget, "set_updates_paused"):
+                widget.set_updates_paused(True)
+        self.update()
+
+    def _end_live_resize(self):
+        """크기 조절 드래그 종료: 최종 크기를 위젯에 한 번만 적용"""
+        if not self._live_resizing:
+            return
+        self._live_resizing = False
+        self._proxy_update_pending = False
+        self._proxy_update_started = None
+        self._update_proxy_geometry()
+        if not self.proxy.isVisible():
+            self.proxy.show()
+            widget = self.proxy.widget()
+            if widget is not None and hasattr(widget, "set_updates_paused"):
+                widget.set_updates_paused(not self.on_screen)
+        self.update()
+
+    def _request_proxy_geometry(self, tiles):
+        """드래그 중 tiles의 위젯 크기 변경 요청 (모드에 따라 보류/프레임 단위로 제한)
+
+        throttled 모드는 그룹 전체를 한 번에 적용하며, 적용 후 다시 그리기까지
+        걸린 시간이 프레임보다 길면 그만큼 간격을 늘려 드래그가 밀리지 않게 한다.
+        """
+        if not self._live_resizing:
+            for tile in tiles:
+                tile._update_proxy_geometry()
+            return
+        for tile in tiles:
+            tile._update_text_position()  # 위젯 크기는 아래에서 적용/보류
+        if self.resize_mode == self.RESIZE_MODE_OUTLINE or self._proxy_update_pending:
+            return
+        if self._proxy_update_started is not None:
+            # 직전 적용부터 이번 요청까지 = 위젯 크기 변경 + 다시 그리기 시간
+            self._proxy_update_cost_ms = (
+                time.perf_counter() - self._proxy_update_started
+            ) * 1000.0
+            self._proxy_update_started = None
+        interval_ms = max(self.RESIZE_FRAME_MS, self._proxy_update_cost_ms)
+        elapsed_ms = (time.perf_counter() - self._last_proxy_update) * 1000.0
+        if elapsed_ms >= interval_ms:
+            self._apply_proxy_geometry(tiles)
+        else:
+            # 남은 시간 뒤 그때의 최종 크기로 한 번만 적용
+            self._proxy_update_pending = True
+            self._pending_proxy_tiles = tiles
+            if self.proxy_timer is None:
+                self.proxy_timer = ProxyGeometryTimer()
+            self.proxy_timer.schedule(self, int(interval_ms - elapsed_ms) + 1)
+
+    def _apply_proxy_geometry(self, tiles):
+        self._proxy_update_started = time.perf_counter()
+        for tile in tiles:
+            if not sip.isdeleted(tile) and tile.scene() is not None:
+                tile._update_proxy_geometry()
+        self._last_proxy_update = time.perf_counter()
+
+    def _flush_proxy_geometry(self):
+        tiles, self._pending_proxy_tiles = self._pending_proxy_tiles, []
+        if self._proxy_update_pending:
+            self._proxy_update_pending = False
+            if self._live_resizing:
+                self._apply_proxy_geometry(tiles)
+
+    @traced("tile.paint")
     def paint(self, painter, option, widget=None):
         rect = self.rect()
         corner_radius = self.corner_radius
@@ -152,9 +317,12 @@ class ResizableTileItem(QGraphicsRectItem):
         painter.setBrush(QBrush(self.color))
         painter.drawPath(path)
 
-        # 2. 테두리
+        # 2. 테두리 (크기 조절 중 outline 모드는 점선 외곽)
         painter.setBrush(Qt.NoBrush)
-        painter.setPen(QPen(QColor(100, 100, 100, 180), self.border_width))
+        if self._live_resizing and not self.proxy.isVisible():
+            painter.setPen(QPen(QColor(0, 200, 255), self.border_width, Qt.DashLine))
+        else:
+            painter.setPen(QPen(QColor(100, 100, 100, 180), self.border_width))
         painter.drawPath(path)
 
         # 3. 선택 표시 (드래그/다중 선택 시)
@@ -285,11 +453,31 @@ class ResizableTileItem(QGraphicsRectItem):
             self.resize_start_scene_pos = event.scenePos()  # ✅ 씬 기준 좌표 추가
             self.resize_start_rect = self.rect()
             self.original_scene_pos = self.pos()  # ✅ 초기 씬 위치 저장
+            # 함께 크기가 바뀔 선택 타일은 누를 때 한 번만 조회
+            scene = self.scene()
+            self._resize_group = [
+                item
+                for item in (scene.selectedItems() if scene else [])
+                if isinstance(item, ResizableTileItem) and item is not self
+            ]
+            for tile in [self] + self._resize_group:
+                tile._begin_live_resize()
         else:
             self.resizing = False
             self.resizing_direction = self.HANDLE_NONE
+            self._dragging = True
             self.setCursor(Qt.ClosedHandCursor)
         super().mousePressEvent(event)
+        if self._dragging:
+            # 선택 처리(super) 후의 선택 타일 전체가 한 그룹으로 이동
+            scene = self.scene()
+            group = [self] + [
+                item
+                for item in (scene.selectedItems() if scene else [])
+                if isinstance(item, ResizableTileItem) and item is not self
+            ]
+            self._drag_group = {tile: QPointF(tile.pos()) for tile in group}
+            self._drag_start = event.scenePos()
 
     def mouseMoveEvent(self, event):
         if self.resizing and self.resizing_direction:
@@ -303,39 +491,32 @@ class ResizableTileItem(QGraphicsRectItem):
             new_x, new_y = self.original_scene_pos.x(), self.original_scene_pos.y()
             new_w, new_h = rect.width(), rect.height()
 
-            # 각 핸들 방향별 처리
+            # 각 핸들 방향별 처리 (적용은 충돌 검사 후 한 번에)
             if self.resizing_direction == self.HANDLE_RIGHT:
                 new_w = max(min_size, rect.width() + dx)
                 new_w = round(new_w / self.grid_size) * self.grid_size
-                self.setRect(0, 0, new_w, rect.height())
 
             elif self.resizing_direction == self.HANDLE_BOTTOM:
                 new_h = max(min_size, rect.height() + dy)
                 new_h = round(new_h / self.grid_size) * self.grid_size
-                self.setRect(0, 0, rect.width(), new_h)
 
             elif self.resizing_direction == self.HANDLE_LEFT:
                 new_w = max(min_size, rect.width() - dx)
                 new_x = self.original_scene_pos.x() + dx
                 new_w = round(new_w / self.grid_size) * self.grid_size
                 new_x = round(new_x / self.grid_size) * self.grid_size
-                self.setRect(0, 0, new_w, rect.height())
-                self.setPos(new_x, self.pos().y())
 
             elif self.resizing_direction == self.HANDLE_TOP:
                 new_h = max(min_size, rect.height() - dy)
                 new_y = self.original_scene_pos.y() + dy
                 new_h = round(new_h / self.grid_size) * self.grid_size
                 new_y = round(new_y / self.grid_size) * self.grid_size
-                self.setRect(0, 0, rect.width(), new_h)
-                self.setPos(self.pos().x(), new_y)
 
             elif self.resizing_direction == self.HANDLE_BOTTOMRIGHT:
                 new_w = max(min_size, rect.width() + dx)
                 new_h = max(min_size, rect.height() + dy)
                 new_w = round(new_w / self.grid_size) * self.grid_size
                 new_h = round(new_h / self.grid_size) * self.grid_size
-                self.setRect(0, 0, new_w, new_h)
 
             elif self.resizing_direction == self.HANDLE_BOTTOMLEFT:
                 new_w = max(min_size, rect.width() - dx)
@@ -344,8 +525,6 @@ class ResizableTileItem(QGraphicsRectItem):
                 new_x = round(new_x / self.grid_size) * self.grid_size
                 new_w = round(new_w / self.grid_size) * self.grid_size
                 new_h = round(new_h / self.grid_size) * self.grid_size
-                self.setRect(0, 0, new_w, new_h)
-                self.setPos(new_x, self.pos().y())
 
             elif self.resizing_direction == self.HANDLE_TOPRIGHT:
                 new_w = max(min_size, rect.width() + dx)
@@ -354,8 +533,6 @@ class ResizableTileItem(QGraphicsRectItem):
                 new_w = round(new_w / self.grid_size) * self.grid_size
                 new_h = round(new_h / self.grid_size) * self.grid_size
                 new_y = round(new_y / self.grid_size) * self.grid_size
-                self.setRect(0, 0, new_w, new_h)
-                self.setPos(self.pos().x(), new_y)
 
             elif self.resizing_direction == self.HANDLE_TOPLEFT:
                 new_w = max(min_size, rect.width() - dx)
@@ -366,66 +543,119 @@ class ResizableTileItem(QGraphicsRectItem):
                 new_y = round(new_y / self.grid_size) * self.grid_size
                 new_w = round(new_w / self.grid_size) * self.grid_size
                 new_h = round(new_h / self.grid_size) * self.grid_size
-                self.setRect(0, 0, new_w, new_h)
-                self.setPos(new_x, new_y)
 
-            # ✅ 모든 선택된 타일의 크기 동기화
-            scene = self.scene()
-            if scene:
-                selected_items = scene.selectedItems()
-                for item in selected_items:
-                    if isinstance(item, ResizableTileItem) and item is not self:
-                        item.setRect(0, 0, new_w, new_h)
-                        item._update_proxy_geometry()
+            # ✅ 다른 타일과 새로 겹치면 이번 이동은 무시 (직전 크기 유지)
+            if self._blocked((new_x, new_y, new_w, new_h)):
+                return
 
             # 현재 타일 업데이트
+            if (new_x, new_y) != (self.pos().x(), self.pos().y()):
+                self.setPos(new_x, new_y)
             self.setRect(0, 0, new_w, new_h)
-            self._update_proxy_geometry()
 
-            # 씬 갱신
-            scene.update()
-            return  # ✅ 기본 이동 이벤트 방지
+            # ✅ 함께 선택된 타일의 크기 동기화 (각자 겹치지 않을 때만)
+            for item in self._resize_group:
+                if item.scene() is None:
+                    continue
+                candidate = (item.pos().x(), item.pos().y(), new_w, new_h)
+                if not item._blocked(candidate):
+                    item.setRect(0, 0, new_w, new_h)
+            self._request_proxy_geometry([self] + self._resize_group)
 
-            # # 충돌 및 경계 체크
-            # if self.is_within_scene() and not self.is_overlapping():
-            #     self._update_proxy_geometry()
-            #     self.scene().update()
-            # else:
-            #     self.setRect(0, 0, rect.width(), rect.height())
-            #     self.setPos(self.original_scene_pos)
+            # setRect가 바뀐 영역만 다시 그리므로 씬 전체 갱신은 하지 않음
+            return  # ✅ 기본 이동 이벤트 방지
 
-            # return  # ✅ 기본 이동 동작 방지
+        if (
+            self._dragging
+            and self._drag_group
+            and event.buttons() & Qt.LeftButton
+            and self.flags() & QGraphicsItem.ItemIsMovable
+        ):
+            # ✅ 기본 이동(타일마다 따로 setPos) 대신 그룹 단위로 검사 후 이동
+            self._move_group(event.scenePos() - self._drag_start)
+            return
 
         super().mouseMoveEvent(event)
 
+    def _move_group(self, delta: QPointF):
+        """선택 타일 전체를 누를 때 위치 + delta(그리드 스냅)로 이동
+
+        한 타일이라도 그룹 밖의 타일과 새로 겹치면 아무것도 옮기지 않아
+        여러 타일을 함께 끌 때 그룹이 흩어지지 않는다.
+        """
+        moves = []
+        for tile, start in self._drag_group.items():
+            if tile.scene() is None:
+                continue
+            target = tile.snap_to_grid(start + delta)
+            if target != tile.pos():
+                moves.append((tile, target))
+        if not moves:
+            return
+        for tile, target in moves:
+            if tile._blocked(tile.index_rect(pos=target), ignore=self._drag_group):
+                return
+        for tile, target in moves:
+            tile.setPos(target)
+
+    def snap_to_grid(self, pos: QPointF) -> QPointF:
+        return QPointF(
+            round(pos.x() / self.grid_size) * self.grid_size,
+            round(pos.y() / self.grid_size) * self.grid_size,
+        )
+
     def mouseReleaseEvent(self, event):
+        # ✅ 드래그 중 보류한 위젯 크기를 여기서 한 번만 적용
+        for tile in [self] + self._resize_group:
+            tile._end_live_resize()
         self.resizing = False
+        self._dragging = False
+        self._drag_group = {}
+        self._drag_start = None
+        self._resize_group = []
         self.resizing_direction = self.HANDLE_NONE
         self.setCursor(Qt.ArrowCursor)
 
-        # ✅ 선택된 모든 타일 모델 업데이트
+        # ✅ 선택된 모든 타일 모델 업데이트 (실제로 바뀐 타일만 저장 대상으로 알림)
         scene = self.scene()
         if scene:
+            changed = []
             selected_items = scene.selectedItems()
             for item in selected_items:
                 if isinstance(item, ResizableTileItem):
-                    item.tile_model.x = item.scenePos().x()
-                    item.tile_model.y = item.scenePos().y()
-                    item.tile_model.width = item.rect().width()
-                    item.tile_model.height = item.rect().height()
+                    model = item.tile_model
+                    geometry = (
+                        item.scenePos().x(),
+                        item.scenePos().y(),
+                        item.rect().width(),
+                        item.rect().height(),
+                    )
+                    if geometry != (model.x, model.y, model.width, model.height):
+                        model.x, model.y, model.width, model.height = geometry
+                        changed.append(model)
+            viewmodel = getattr(self, "viewmodel", None)
+            if changed and viewmodel is not None:
+                viewmodel.mark_tiles_dirty(changed)
 
         super().mouseReleaseEvent(event)
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemPositionChange:
-            # 그리드 스냅 적용
-            new_pos = value
-            snapped_x = round(new_pos.x() / self.grid_size) * self.grid_size
-            snapped_y = round(new_pos.y() / self.grid_size) * self.grid_size
-            return QPointF(snapped_x, snapped_y)
+            # 그리드 스냅 적용 (마우스 이동 충돌 검사는 _move_group에서 그룹 단위로,
+            # 레이아웃 적용 중 임시 겹침은 허용)
+            return self.snap_to_grid(value)
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            self._sync_index()
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            if value is None and self.spatial_index is not None:
+                self.spatial_index.remove(self)
+            else:
+                self._sync_index()
         return super().itemChange(change, value)
 
     def is_overlapping(self):
+        if self.spatial_index is not None:
+            return self.spatial_index.overlaps(self.index_rect(), exclude=(self,))
         my_rect = self.mapRectToScene(self.rect())  # ✅ 실제 rect를 씬 좌표로 변환
         for tile in self.all_tiles:
             if tile is self:
@@ -435,6 +665,61 @@ class ResizableTileItem(QGraphicsRectItem):
                 return True
         return False
 
+    @property
+    def has_widget(self) -> bool:
+        return self.proxy.widget() is not None
+
+    def attach_widget(self, widget):
+        """위젯 없는 타일(자리표시자)에 위젯 연결 (편집모드/화면 밖 상태도 반영)"""
+        self.proxy.setWidget(widget)
+        if widget.isHidden():
+            widget.show()  # 풀에서 재사용한 위젯은 반납 시 숨겨져 있음
+        self._update_proxy_geometry()
+        enabled = getattr(self, "is_enabled", None)
+        if enabled is not None:
+            self.set_enabled(enabled)
+        if not self.on_screen and hasattr(widget, "set_updates_paused"):
+            widget.set_updates_paused(True)
+        self.update()
+
+    def release_widget(self):
+        """프록시에서 위젯을 떼어내 반환 (위젯은 삭제되지 않음)"""
+        widget = self.proxy.widget()
+        if widget is not None:
+            self.proxy.setWidget(None)
+            # 프록시에서 빠지면 최상위 창이 되므로 바로 숨김
+            widget.hide()
+            widget.setParent(None)
+        return widget
+
+    def dispose(self):
+        """타일 제거: 위젯 정리(구독/타이머 해제, 삭제 또는 풀 반납) 후 씬에서 제거"""
+        if self.proxy_timer is not None:
+            self.proxy_timer.cancel(self)
+        self._pending_proxy_tiles = []
+        widget = self.proxy.widget()
+        if widget is not None:
+            if self.widget_registry is not None:
+                self.widget_registry.release(self.release_widget())
+            elif hasattr(widget, "dispose"):
+                widget.dispose()
+            else:
+                widget.deleteLater()
+        if self.spatial_index is not None:
+            self.spatial_index.remove(self)
+        scene = self.scene()
+        if scene is not None:
+            scene.removeItem(self)
+
+    def set_on_screen(self, on_screen: bool):
+        """뷰포트 노출 여부 반영 (위젯이 지원하면 갱신 일시정지)"""
+        if on_screen == self.on_screen:
+            return
+        self.on_screen = on_screen
+        widget = self.proxy.widget()
+        if widget is not None and hasattr(widget, "set_updates_paused"):
+            widget.set_updates_paused(not on_screen)
+
     def is_within_scene(self):
         tile_rect = self.sceneBoundingRect()
         return self.scene().sceneRect().contains(tile_rect)
@@ -453,9 +738,9 @@ class ResizableTileItem(QGraphicsRectItem):
             widget.setMouseTracking(False)
             widget.setFocusPolicy(Qt.NoFocus)
 
-            # Matplotlib Figure의 이벤트도 차단
-            canvas = widget.findChild(FigureCanvas)
-            if canvas:
+            # 내부 캔버스(Matplotlib Figure 등)의 이벤트도 차단
+            canvas = getattr(widget, "canvas", None)
+            if canvas is not None:
                 canvas.setAttribute(Qt.WA_TransparentForMouseEvents, enabled)
                 canvas.setFocusPolicy(Qt.NoFocus)
 
@@ -0,0 +1,296 @@
+import calendar
+import glob
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from TelemetrySource import TRACE_MAGIC, load_recording, record_dtype
+
+
+class SampleLog:
+    """샘플링 소스별 CPU 사용률 장기 기록 (고정 폭 바이너리, 추가 전용)
+
+    CpuSampler가 소스마다 하나씩 연결해 샘플을 한 번만 기록하고, 같은 소스를
+    구독하는 뷰(AP1/AP2/MCU)는 이 기록을 함께 조회한다.
+    파일은 segment_seconds(기본 하루, UTC 기준) 단위로 나뉜다:
+        <directory>/<name>/<name>_<구간 시작 UTC>.cpulog
+    형식은 RecordingSource 기록 파일과 같아 ReplaySource로 재생할 수도 있다.
+
+    append()는 샘플러 스레드에서 큐에 넣기만 하고, 쓰기 스레드가 flush_interval_s마다
+    모아서 파일에 덧붙인다. 읽기는 파일을 메모리 매핑해 시간 범위를 잘라 내므로,
+    한 구간 파일 안의 범위(기본: 하루)는 복사 없이 그래프에 넘길 수 있다.
+    """
+
+    EXTENSION = ".cpulog"
+    MAX_QUEUE = 100000  # 디스크가 멈췄을 때 쌓아 둘 최대 샘플 수 (넘으면 버림)
+
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        segment_seconds: int = 86400,
+        flush_interval_s: float = 1.0,
+    ):
+        self.directory = os.path.join(directory, name)
+        self.name = name
+        self.segment_seconds = segment_seconds
+        self.flush_interval_s = flush_interval_s
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flushed = threading.Event()
+        self._thread = None
+        # 구간 시작 → (파일 이름, 코어 목록) (쓰기 스레드 전용)
+        self._open_segments: Dict[int, Tuple[str, List[str]]] = {}
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0  # 기록에 실패한 배치 수 (쓰기 스레드는 계속 동작)
+        self.last_error = None
+        self.batches = 0
+        self.last_batch_ms = 0.0
+
+    def append(self, timestamp: float, values: Dict[str, float]):
+        """샘플 하나 기록 예약 (샘플러 스레드에서 호출, 디스크 I/O 없음)"""
+        if len(self._queue) >= self.MAX_QUEUE:
+            self.dropped += 1
+            return
+        self._queue.append((timestamp, values))
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"SampleLog-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def flush(self, timeout: float = 5.0):
+        """쌓인 샘플을 지금 기록하도록 요청하고 완료까지 대기"""
+        if self._thread is None:
+            return
+        self._flushed.clear()
+        self._wake.set()
+        self._flushed.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """쓰기 스레드 종료 (남은 샘플은 모두 기록)"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            stopping = self._stop.is_set()
+            try:
+                self._write_pending()
+            except Exception as e:
+                # 디스크 오류뿐 아니라 코어 수 변경 등 어떤 오류에도 스레드는 유지
+                # (죽으면 append()가 스레드를 다시 띄우지 않아 샘플이 조용히 쌓임)
+                self.errors += 1
+                self.last_error = repr(e)
+                print(f"{self.name} 샘플 기록 실패: {e}")
+            finally:
+                self._flushed.set()
+            if stopping:
+                return
+
+    def _write_pending(self):
+        start = time.perf_counter()
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return
+        try:
+            self._write_batch(batch)
+        except Exception:
+            self.dropped += len(batch)  # 실패한 배치는 버림
+            raise
+        self.written += len(batch)
+        self.batches += 1
+        self.last_batch_ms = (time.perf_counter() - start) * 1000.0
+
+    def _write_batch(self, batch):
+        # 구간별로 나눠 한 번씩 덧붙임 (자정 경계에서만 두 구간에 걸침)
+        segments: Dict[int, list] = {}
+        for sample in batch:
+            segments.setdefault(self.segment_start(sample[0]), []).append(sample)
+        for segment, samples in segments.items():
+            # 배치 중간에 코어가 늘어도 잃지 않도록 배치 전체의 코어 합집합 사용
+            batch_cores = {}
+            for _, values in samples:
+                batch_cores.update(dict.fromkeys(values))
+            filename, core_ids = self._segment_file(segment, list(batch_cores))
+            records = np.empty(len(samples), dtype=record_dtype(len(core_ids)))
+            for i, (timestamp, values) in enumerate(samples):
+                records["t"][i] = timestamp
+                if list(values) == core_ids:
+                    records["v"][i] = np.fromiter(
+                        values.values(), np.float32, len(core_ids)
+                    )
+                else:
+                    records["v"][i] = [values.get(c, math.nan) for c in core_ids]
+            with open(filename, "ab") as f:
+                f.write(records.tobytes())
+
+    def segment_start(self, timestamp: float) -> int:
+        return int(timestamp // self.segment_seconds) * self.segment_seconds
+
+    def _segment_path(self, segment: int, suffix: int = 0) -> str:
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(segment))
+        extra = f"_{suffix}" if suffix else ""
+        return os.path.join(
+            self.directory, f"{self.name}_{stamp}{extra}{self.EXTENSION}"
+        )
+
+    def _segment_file(
+        self, segment: int, batch_cores: List[str]
+    ) -> Tuple[str, List[str]]:
+        """구간 파일 (없으면 생성, 새 코어가 나타나면 번호를 붙인 새 파일)
+
+        새 파일의 코어 목록은 열려 있던 파일의 코어 + 새 코어라서
+        이후 일부 코어가 빠진 샘플(NaN으로 기록)은 같은 파일에 이어 쓴다.
+        """
+        opened = self._open_segments.get(segment)
+        if opened is not None and set(batch_cores) <= set(opened[1]):
+            return opened
+        core_ids = list(opened[1]) if opened is not None else []
+        core_ids += [c for c in batch_cores if c not in core_ids]
+        suffix = 0
+        while True:
+            filename = self._segment_path(segment, suffix)
+            if not os.path.exists(filename):
+                self._create(filename, core_ids, segment)
+                break
+            existing, _ = load_recording(filename)
+            if existing == core_ids:
+                self._truncate_partial(filename, len(core_ids))
+                break
+            suffix += 1
+        # 다음 구간으로 넘어가면 이전 구간 정보는 필요 없음
+        self._open_segments = {segment: (filename, core_ids)}
+        return self._open_segments[segment]
+
+    def _create(self, filename: str, core_ids: List[str], segment: int):
+        header = json.dumps(
+            {
+                "core_ids": core_ids,
+                "dtype": record_dtype(len(core_ids)).descr,
+                "source": self.name,
+                "segment_start": segment,
+                "segment_seconds": self.segment_seconds,
+            }
+        )
+        with open(filename, "wb") as f:
+            f.write(TRACE_MAGIC + header.encode("utf-8") + b"\n")
+
+    @staticmethod
+    def _truncate_partial(filename: str, core_count: int):
+        """비정상 종료로 잘린 마지막 레코드 제거 (이어 쓰기 전)"""
+        with open(filename, "rb") as f:
+            f.readline()  # TRACE_MAGIC
+            f.readline()  # JSON 헤더
+            offset = f.tell()
+        itemsize = record_dtype(core_count).itemsize
+        size = os.path.getsize(filename)
+        extra = (size - offset) % itemsize
+        if extra:
+            os.truncate(filename, size - extra)
+
+    def segment_files(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> List[str]:
+        """[start, end) 범위와 겹치는 구간 파일 (시간순)"""
+        files = []
+        prefix = os.path.join(self.directory, f"{self.name}_")
+        for filename in sorted(glob.glob(prefix + "*" + self.EXTENSION)):
+            stamp = filename[len(prefix) :].split("_")[0].split(".")[0]
+            try:
+                segment = calendar.timegm(time.strptime(stamp, "%Y%m%dT%H%M%SZ"))
+            except ValueError:
+                continue
+            if end is not None and segment >= end:
+                continue
+            if start is not None and segment + self.segment_seconds <= start:
+                continue
+            files.append(filename)
+        return files
+
+    def read(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> List[Tuple[List[str], np.ndarray]]:
+        """구간 파일별 (코어 목록, 레코드 배열) — 배열은 메모리 매핑 슬라이스 (복사 없음)"""
+        result = []
+        for filename in self.segment_files(start, end):
+            core_ids, records = load_recording(filename)
+            if len(records) == 0:
+                continue
+            times = records["t"]
+            lo = 0 if start is None else int(np.searchsorted(times, start, "left"))
+            hi = len(records) if end is None else int(np.searchsorted(times, end))
+            if hi > lo:
+                result.append((core_ids, records[lo:hi]))
+        return result
+
+    def recent(self, count: int) -> List[Tuple[List[str], np.ndarray]]:
+        """가장 최근 count개 레코드를 구간 파일별 (코어 목록, 레코드 배열)로 (시간순)"""
+        result = []
+        for filename in reversed(self.segment_files()):
+            if count <= 0:
+                break
+            core_ids, records = load_recording(filename)
+            if len(records) == 0:
+                continue
+            records = records[-count:]
+            count -= len(records)
+            result.append((core_ids, records))
+        result.reverse()
+        return result
+
+    def history(
+        self, core_id: str, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """core_id의 (시각, 사용률) 배열
+
+        범위가 구간 파일 하나 안에 있으면 메모리 매핑 뷰를 그대로 반환하고,
+        여러 파일에 걸치면 이어 붙인 복사본을 반환한다.
+        """
+        parts = []
+        for core_ids, records in self.read(start, end):
+            if core_id in core_ids:
+                parts.append((records["t"], records["v"][:, core_ids.index(core_id)]))
+        if not parts:
+            return np.empty(0), np.empty(0, dtype=np.float32)
+        if len(parts) == 1:
+            return parts[0]
+        return (
+            np.concatenate([t for t, _ in parts]),
+            np.concatenate([v for _, v in parts]),
+        )
+
+    def stats(self) -> dict:
+        return {
+            "queued": len(self._queue),
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "batches": self.batches,
+            "last_batch_ms": self.last_batch_ms,
+        }
@@ -0,0 +1,176 @@
+import time
+from collections import deque
+
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+
+from PerfInstrumentation import traced
+
+
+class SparklineCanvas(QWidget):
+    """matplotlib 없이 QPainter로 직접 그리는 CPU 사용률 그래프
+
+    CPUGraphWidget의 matplotlib 축 구성(0~100 축, 점선 그리드, 눈금,
+    축 레이블, 80/90% 색상 구간)을 그대로 흉내낸다.
+    """
+
+    # CPUGraphWidget의 subplots_adjust와 동일한 여백 (비율)
+    MARGIN_LEFT = 0.12
+    MARGIN_RIGHT = 0.95
+    MARGIN_BOTTOM = 0.15
+    MARGIN_TOP = 0.9
+
+    Y_TICKS = (0, 25, 50, 75, 100)
+
+    def __init__(
+        self,
+        num_points: int = 30,
+        bg_color: str = "#202124",
+        text_color: str = "#e8eaed",
+        grid_color: str = "gray",
+        tick_font_size: int = 7,
+        dpi: int = 80,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.num_points = num_points
+        self.bg_color = QColor(bg_color)
+        self.text_color = QColor(text_color)
+        self.grid_color = QColor(grid_color)
+        self.grid_color.setAlphaF(0.7)
+        # matplotlib 포인트 단위를 같은 dpi의 픽셀로 환산
+        self._pt = dpi / 72.0
+        self.tick_font = QFont()
+        self.tick_font.setPixelSize(max(6, round(tick_font_size * self._pt)))
+        self.label_font = QFont()
+        self.label_font.setPixelSize(max(6, round(10 * self._pt)))
+        self.x_ticks = tuple(range(0, num_points + 1, 10))
+
+        self._y = np.zeros(num_points)
+        self._color = QColor("#00FF00")
+        self.paint_times = deque(maxlen=120)  # 최근 paintEvent 소요 시간 (ms)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def set_data(self, y, color: str):
+        """그릴 샘플(0~100)과 라인 색상 지정 후 다시 그리기 예약"""
+        self._y = y
+        self._color = QColor(color)
+        self.update()
+
+    def _plot_rect(self) -> QRectF:
+        w, h = self.width(), self.height()
+        return QRectF(
+            w * self.MARGIN_LEFT,
+            h * (1 - self.MARGIN_TOP),
+            w * (self.MARGIN_RIGHT - self.MARGIN_LEFT),
+            h * (self.MARGIN_TOP - self.MARGIN_BOTTOM),
+        )
+
+    @traced("graph.paint")
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.bg_color)
+        plot = self._plot_rect()
+        x_span = max(1, self.num_points)
+
+        def map_x(v):
+            return plot.left() + plot.width() * v / x_span
+
+        def map_y(v):
+            return plot.bottom() - plot.height() * v / 100.0
+
+        # 그리드 (점선)
+        grid_pen = QPen(self.grid_color, 0.4 * self._pt, Qt.DashLine)
+        painter.setPen(grid_pen)
+        for v in self.Y_TICKS:
+            y = map_y(v)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+        for v in self.x_ticks:
+            x = map_x(v)
+            painter.drawLine(QPointF(x, plot.top()), QPointF(x, plot.bottom()))
+
+        # 데이터 (채움 + 라인)
+        y_data = np.asarray(self._y, dtype=float)
+        n = len(y_data)
+        if n:
+            xs = plot.left() + plot.width() * np.arange(n) / x_span
+            ys = plot.bottom() - plot.height() * np.clip(y_data, 0, 100) / 100.0
+            line = QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)])
+            painter.setRenderHint(QPainter.Antialiasing)
+            fill = QPolygonF(line)
+            fill.append(QPointF(xs[-1], plot.bottom()))
+            fill.append(QPointF(xs[0], plot.bottom()))
+            fill_color = QColor(self._color)
+            fill_color.setAlphaF(0.3)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(fill_color)
+            painter.save()
+            painter.setClipRect(plot)
+            painter.drawPolygon(fill)
+            painter.setPen(QPen(self._color, 1.5 * self._pt))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(line)
+            painter.restore()
+            painter.setRenderHint(QPainter.Antialiasing, False)
+
+        # 축 테두리와 눈금
+        painter.setPen(QPen(self.text_color, 0.8 * self._pt))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(plot)
+        tick_len = 3.5 * self._pt
+        painter.setFont(self.tick_font)
+        metrics = painter.fontMetrics()
+        for v in self.Y_TICKS:
+            y = map_y(v)
+            painter.drawLine(
+                QPointF(plot.left() - tick_len, y), QPointF(plot.left(), y)
+            )
+            label = str(v)
+            painter.drawText(
+                QRectF(
+                    0,
+                    y - metrics.height() / 2,
+                    plot.left() - tick_len - 2,
+                    metrics.height(),
+                ),
+                Qt.AlignRight | Qt.AlignVCenter,
+                label,
+            )
+        for v in self.x_ticks:
+            x = map_x(v)
+            painter.drawLine(
+                QPointF(x, plot.bottom()), QPointF(x, plot.bottom() + tick_len)
+            )
+            painter.drawText(
+                QRectF(x - 20, plot.bottom() + tick_len, 40, metrics.height()),
+                Qt.AlignHCenter | Qt.AlignTop,
+                str(v),
+            )
+
+        tick_label_w = metrics.horizontalAdvance("100")
+
+        # 축 레이블
+        painter.setFont(self.label_font)
+        label_h = painter.fontMetrics().height()
+        painter.drawText(
+            QRectF(plot.left(), self.height() - label_h, plot.width(), label_h),
+            Qt.AlignCenter,
+            "Time (seconds)",
+        )
+        painter.save()
+        # matplotlib처럼 눈금 레이블 왼쪽에 배치 (공간이 부족하면 잘림)
+        label_x = plot.left() - tick_len - 4 - tick_label_w - label_h
+        painter.translate(label_x, plot.center().y())
+        painter.rotate(-90)
+        painter.drawText(
+            QRectF(-plot.height() / 2, 0, plot.height(), label_h),
+            Qt.AlignCenter,
+            "Usage (%)",
+        )
+        painter.restore()
+        painter.end()
+        self.paint_times.append((time.perf_counter() - start) * 1000.0)
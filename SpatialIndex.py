@@ -0,0 +1,176 @@
+import math
+from typing import Dict, Hashable, Iterable, Optional, Set, Tuple
+
+Rect = Tuple[float, float, float, float]  # (x, y, 폭, 높이) 씬 좌표
+
+
+def rects_overlap(a: Rect, b: Rect) -> bool:
+    """면적이 겹치는지 (변이 맞닿기만 한 경우는 겹침 아님, QRectF.intersects와 동일)"""
+    return (
+        a[0] < b[0] + b[2]
+        and b[0] < a[0] + a[2]
+        and a[1] < b[1] + b[3]
+        and b[1] < a[1] + a[3]
+    )
+
+
+class SpatialIndex:
+    """그리드 셀(cell_size) 단위 버킷으로 타일 위치를 관리하는 공간 인덱스
+
+    항목마다 걸쳐 있는 셀 목록을 기억해 두고, 이동/크기 변경 시 셀 범위가
+    바뀐 경우에만 버킷을 갱신한다. 겹침/이웃 조회는 질의 영역이 걸친 셀의
+    항목만 확인하므로 전체 타일 수와 무관하게 거의 일정한 시간이 걸린다.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._rects: Dict[Hashable, Rect] = {}
+        self._ranges: Dict[Hashable, Tuple[int, int, int, int]] = {}
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, item):
+        return item in self._rects
+
+    def _cell_range(self, rect: Rect) -> Tuple[int, int, int, int]:
+        """rect가 걸친 셀 범위 (오른쪽/아래 변에 딱 맞으면 다음 셀은 제외)"""
+        size = self.cell_size
+        x, y, w, h = rect
+        x0 = math.floor(x / size)
+        y0 = math.floor(y / size)
+        x1 = max(x0, math.ceil((x + w) / size) - 1)
+        y1 = max(y0, math.ceil((y + h) / size) - 1)
+        return x0, y0, x1, y1
+
+    @staticmethod
+    def _cells_of(cell_range):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def insert(self, item, rect: Rect):
+        """항목 추가 (이미 있으면 위치 갱신)"""
+        if item in self._rects:
+            self.update(item, rect)
+            return
+        cell_range = self._cell_range(rect)
+        for cell in self._cells_of(cell_range):
+            self._cells.setdefault(cell, set()).add(item)
+        self._rects[item] = rect
+        self._ranges[item] = cell_range
+
+    def update(self, item, rect: Rect):
+        """항목 위치/크기 갱신 (셀 범위가 같으면 버킷은 그대로)"""
+        old_range = self._ranges.get(item)
+        if old_range is None:
+            self.insert(item, rect)
+            return
+        self._rects[item] = rect
+        cell_range = self._cell_range(rect)
+        if cell_range == old_range:
+            return
+        self._remove_from_cells(item, old_range)
+        for cell in self._cells_of(cell_range):
+            self._cells.setdefault(cell, set()).add(item)
+        self._ranges[item] = cell_range
+
+    def remove(self, item):
+        cell_range = self._ranges.pop(item, None)
+        if cell_range is None:
+            return
+        del self._rects[item]
+        self._remove_from_cells(item, cell_range)
+
+    def _remove_from_cells(self, item, cell_range):
+        for cell in self._cells_of(cell_range):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(item)
+                if not bucket:
+                    del self._cells[cell]
+
+    def clear(self):
+        self._cells.clear()
+        self._rects.clear()
+        self._ranges.clear()
+
+    def rect_of(self, item) -> Optional[Rect]:
+        return self._rects.get(item)
+
+    def _candidates(self, rect: Rect) -> Set[Hashable]:
+        result = set()
+        for cell in self._cells_of(self._cell_range(rect)):
+            bucket = self._cells.get(cell)
+            if bucket:
+                result |= bucket
+        return result
+
+    def query(self, rect: Rect, exclude: Iterable = ()) -> Set[Hashable]:
+        """rect와 면적이 겹치는 항목"""
+        excluded = set(exclude)
+        return {
+            item
+            for item in self._candidates(rect)
+            if item not in excluded and rects_overlap(rect, self._rects[item])
+        }
+
+    def overlaps(self, rect: Rect, exclude: Iterable = ()) -> bool:
+        excluded = set(exclude)
+        for item in self._candidates(rect):
+            if item not in excluded and rects_overlap(rect, self._rects[item]):
+                return True
+        return False
+
+    def neighbors(self, item, distance: float = None) -> Set[Hashable]:
+        """item에서 distance(기본: 셀 한 칸) 이내에 있는 다른 항목"""
+        rect = self._rects.get(item)
+        if rect is None:
+            return set()
+        if distance is None:
+            distance = self.cell_size
+        x, y, w, h = rect
+        area = (x - distance, y - distance, w + 2 * distance, h + 2 * distance)
+        return self.query(area, exclude=(item,))
+
+    def find_free_slot(
+        self,
+        width: float,
+        height: float,
+        near: Tuple[float, float] = (0.0, 0.0),
+        bounds: Optional[Rect] = None,
+        max_rings: int = 64,
+        exclude: Iterable = (),
+        step: float = None,
+    ) -> Optional[Tuple[float, float]]:
+        """near에서 가까운 순서로 step(기본: 셀 크기) 격자 위의 빈 자리 (x, y) 탐색
+
+        near를 중심으로 한 칸씩 넓혀 가며(링) 확인하고, bounds가 있으면
+        그 안에 완전히 들어가는 자리만 반환한다. 없으면 None.
+        """
+        size = step or self.cell_size
+        excluded = set(exclude)
+        cx0 = round(near[0] / size)
+        cy0 = round(near[1] / size)
+        for ring in range(max_rings + 1):
+            for dy in range(-ring, ring + 1):
+                for dx in range(-ring, ring + 1):
+                    if max(abs(dx), abs(dy)) != ring:
+                        continue  # 링 테두리만 확인 (안쪽은 이전 링에서 확인)
+                    rect = ((cx0 + dx) * size, (cy0 + dy) * size, width, height)
+                    if bounds is not None and not self._inside(rect, bounds):
+                        continue
+                    if not self.overlaps(rect, excluded):
+                        return rect[0], rect[1]
+        return None
+
+    @staticmethod
+    def _inside(rect: Rect, bounds: Rect) -> bool:
+        return (
+            rect[0] >= bounds[0]
+            and rect[1] >= bounds[1]
+            and rect[0] + rect[2] <= bounds[0] + bounds[2]
+            and rect[1] + rect[3] <= bounds[1] + bounds[3]
+        )
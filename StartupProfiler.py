@@ -0,0 +1,78 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+
+class StartupProfiler:
+    """앱 시작부터 첫 화면 표시까지의 구간별 소요 시간 측정
+
+    phase()는 중첩될 수 있으며, 안쪽 구간의 시간은 바깥 구간에서 빠진다
+    (예: 타일 생성 중 matplotlib 지연 import는 "imports"로만 집계).
+    finish()가 호출된 뒤에는 측정하지 않는다.
+    """
+
+    PHASES = ("imports", "layout_parse", "tile_construction", "first_render")
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.finished = False
+        self.time_to_first_paint = None
+        self._stack: List[list] = []  # [구간 이름, 시작 시각]
+        self._last_mark = self.t0
+
+    def _add(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        """구간 측정 (중첩 시 바깥 구간은 일시정지)"""
+        if self.finished:
+            yield
+            return
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self._add(parent[0], now - parent[1])
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            entry = self._stack.pop()
+            self._add(entry[0], now - entry[1])
+            if self._stack:
+                self._stack[-1][1] = now
+            self._last_mark = now
+
+    def mark(self, name: str):
+        """마지막 측정 지점부터 지금까지를 name 구간으로 기록"""
+        if self.finished:
+            return
+        now = time.perf_counter()
+        self._add(name, now - self._last_mark)
+        self._last_mark = now
+
+    def finish(self):
+        """첫 화면 표시 시점: 측정 종료"""
+        if self.finished:
+            return
+        self.mark("first_render")
+        self.time_to_first_paint = time.perf_counter() - self.t0
+        self.finished = True
+
+    def report(self) -> dict:
+        """구간별 소요 시간 (ms)"""
+        names = list(self.PHASES) + [n for n in self.phases if n not in self.PHASES]
+        result = {name: self.phases.get(name, 0.0) * 1000.0 for name in names}
+        if self.time_to_first_paint is not None:
+            result["time_to_first_paint"] = self.time_to_first_paint * 1000.0
+        return result
+
+    def print_report(self):
+        for name, ms in self.report().items():
+            print(f"[startup] {name:<20} {ms:8.1f} ms")
+
+
+# 프로세스 전체에서 공유하는 인스턴스 (가장 먼저 import되는 시점이 기준)
+STARTUP = StartupProfiler()
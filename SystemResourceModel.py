@@ -1,9 +1,22 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+import numpy as np
 
 
 class TileModel:
     """개별 타일의 상태 관리"""
 
+    # 압축 형식에서 타일 한 개를 나타내는 행의 열 순서
+    FIELDS = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "widget_type",
+        "core_id",
+        "renderer",
+        "mode",
+    )
+
     def __init__(
         self,
         x: float,
@@ -12,6 +25,8 @@ class TileModel:
         height: float,
         widget_type: str,
         core_id: str,
+        renderer: Optional[str] = None,
+        mode: Optional[str] = None,
     ):
         self.x = x
         self.y = y
@@ -19,38 +34,169 @@ class TileModel:
         self.height = height
         self.widget_type = widget_type  # "CircularGauge" 또는 "CPUGraphWidget"
         self.core_id = core_id  # "core1", "core2" 등
+        # 그리기 방식 (CPUGraphWidget: "matplotlib"/"qpainter", None이면 기본값)
+        self.renderer = renderer
+        # 표시 모드 (CoreHeatmap: "history"/"cells", None이면 기본값)
+        # 허용 값은 위젯 종류마다 다르며 위젯 생성 시 검사한다
+        self.mode = mode
+
+    def to_dict(self) -> dict:
+        data = {
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height,
+            "widget_type": self.widget_type,
+            "core_id": self.core_id,
+        }
+        if self.renderer:
+            data["renderer"] = self.renderer
+        if self.mode:
+            data["mode"] = self.mode
+        return data
+
+    def to_row(self) -> list:
+        """압축 형식용 행 (FIELDS 순서)"""
+        return [
+            self.x,
+            self.y,
+            self.width,
+            self.height,
+            self.widget_type,
+            self.core_id,
+            self.renderer,
+            self.mode,
+        ]
+
+
+class CpuHistoryBuffer:
+    """코어 × 샘플 2차원 링 버퍼 (열 단위 일괄 기록, 시간순 뷰는 복사 없이 반환)
+
+    저장 공간을 2배(length * 2)로 잡고 커서 위치와 커서 + length 위치에
+    같은 값을 함께 기록한다. 그러면 data[:, cursor:cursor + length]가
+    항상 오래된 값 → 최신 값 순서의 연속 구간이 되어 슬라이스 뷰만으로
+    읽을 수 있다. 반환하는 뷰는 버퍼를 공유하므로 읽기 전용으로 표시한다.
+    """
+
+    def __init__(self, length: int = 120, dtype=np.float64):
+        self.length = length
+        self.dtype = dtype
+        self.core_ids: List[str] = []
+        self._row: Dict[str, int] = {}  # core_id → 행 번호
+        self._data = np.zeros((0, 2 * length), dtype=dtype)
+        self._cursor = 0
+        self.count = 0  # 지금까지 기록된 샘플 수
+
+    def _ensure_cores(self, core_ids):
+        new_ids = [c for c in core_ids if c not in self._row]
+        if not new_ids:
+            return
+        for core_id in new_ids:
+            self._row[core_id] = len(self.core_ids)
+            self.core_ids.append(core_id)
+        grown = np.zeros((len(self.core_ids), 2 * self.length), dtype=self.dtype)
+        grown[: self._data.shape[0]] = self._data
+        self._data = grown
+
+    def append(self, values: Dict[str, float]):
+        """한 틱의 { core_id: 값 }을 한 번의 벡터 연산으로 기록
+
+        이번 틱에 빠진 코어는 직전 값을 이어 쓴다 (0으로 떨어진 것처럼 보이지 않도록).
+        """
+        if list(values) != self.core_ids:
+            self._ensure_cores(values)
+            column = self._data[:, self._cursor + self.length - 1].copy()
+            rows = [self._row[c] for c in values]
+            column[rows] = list(values.values())
+        else:
+            column = np.fromiter(values.values(), self.dtype, len(self.core_ids))
+        cursor = self._cursor
+        self._data[:, cursor] = column
+        self._data[:, cursor + self.length] = column
+        self._cursor = (cursor + 1) % self.length
+        self.count += 1
+
+    def window(self) -> np.ndarray:
+        """전체 코어의 시간순 (cores × length) 읽기 전용 뷰"""
+        window = self._data[:, self._cursor : self._cursor + self.length]
+        window.setflags(write=False)
+        return window
+
+    def view(
+        self, core_id: str, num_points: Optional[int] = None
+    ) -> Optional[np.ndarray]:
+        """특정 코어의 최근 num_points개 샘플 읽기 전용 뷰 (복사 없음, 없는 코어는 None)"""
+        row = self._row.get(core_id)
+        if row is None:
+            return None
+        n = self.length if num_points is None else min(num_points, self.length)
+        end = self._cursor + self.length
+        view = self._data[row, end - n : end]
+        view.setflags(write=False)
+        return view
+
+    def resize(self, length: int):
+        """히스토리 길이 변경 (최근 샘플은 유지)"""
+        if length == self.length:
+            return
+        window = self.window()
+        keep = min(length, self.length)
+        data = np.zeros((len(self.core_ids), 2 * length), dtype=self.dtype)
+        data[:, length - keep : length] = window[:, self.length - keep :]
+        data[:, 2 * length - keep :] = window[:, self.length - keep :]
+        self._data = data
+        self.length = length
+        self._cursor = 0
 
 
 class SystemResourceModel:
     """전체 시스템 리소스 데이터 중앙 관리"""
 
-    def __init__(self):
+    DEFAULT_HISTORY_LENGTH = 120  # 코어별 보관 샘플 수
+
+    def __init__(self, history_length: int = DEFAULT_HISTORY_LENGTH):
         self.cpu_cores: Dict[str, float] = {}  # { "core1": 75.0, "core2": 60.0 }
         self.tiles: List[TileModel] = []  # 모든 타일 정보
+        self.history = CpuHistoryBuffer(history_length)  # 코어별 샘플 이력
+        self.sample_log = None  # 장기 기록 조회용 (SampleLog, 설정한 경우만)
 
-    def update_cpu_data(self, new_data: Dict[str, float]):
+    def update_cpu_data(self, new_data: Dict[str, float], timestamp: float = None):
         """CPU 코어 데이터 일괄 업데이트"""
         self.cpu_cores = new_data
+        self.append_history(new_data, timestamp)
+
+    def append_history(self, new_data: Dict[str, float], timestamp: float = None):
+        """최신값은 바꾸지 않고 이력에만 기록 (밀린 샘플 처리용)"""
+        self.history.append(new_data)
+
+    def set_sample_log(self, sample_log):
+        """장기 기록 조회용 SampleLog 연결 (기록은 CpuSampler가 소스별로 한 번만 함)"""
+        self.sample_log = sample_log
+
+    def adopt_history(self, other: "SystemResourceModel"):
+        """다른 모델의 이력/최신값/장기 기록을 이어받음 (레이아웃 교체 시)"""
+        self.history = other.history
+        self.cpu_cores = other.cpu_cores
+        self.sample_log = other.sample_log
 
     def add_tile(self, tile: TileModel):
         """새 타일 추가"""
         self.tiles.append(tile)
 
-    def to_dict(self) -> dict:
-        """JSON 직렬화용 딕셔너리 변환"""
+    def to_dict(self, compact: bool = False) -> dict:
+        """JSON 직렬화용 딕셔너리 변환
+
+        compact=True면 타일을 키 없는 행(tile_rows)으로 저장한다 (타일 수천 개용).
+        """
+        if compact:
+            return {
+                "cpu_cores": self.cpu_cores,
+                "tile_columns": list(TileModel.FIELDS),
+                "tile_rows": [tile.to_row() for tile in self.tiles],
+            }
         return {
             "cpu_cores": self.cpu_cores,
-            "tiles": [
-                {
-                    "x": tile.x,
-                    "y": tile.y,
-                    "width": tile.width,
-                    "height": tile.height,
-                    "widget_type": tile.widget_type,
-                    "core_id": tile.core_id,
-                }
-                for tile in self.tiles
-            ],
+            "tiles": [tile.to_dict() for tile in self.tiles],
         }
 
     @classmethod
@@ -65,7 +211,17 @@ class SystemResourceModel:
                 height=int(t["height"]),  # ✅
                 widget_type=t["widget_type"],
                 core_id=t["core_id"],
+                renderer=t.get("renderer"),
+                mode=t.get("mode"),
             )
-            for t in data.get("tiles", [])
+            for t in cls._tile_dicts(data)
         ]
         return model
+
+    @staticmethod
+    def _tile_dicts(data: dict):
+        """일반 형식(tiles)과 압축 형식(tile_columns/tile_rows) 모두 지원"""
+        if "tile_rows" in data:
+            columns = data.get("tile_columns", TileModel.FIELDS)
+            return [dict(zip(columns, row)) for row in data["tile_rows"]]
+        return data.get("tiles", [])
@@ -1,45 +1,153 @@
 import sys
 import json
-import psutil
+import time
 from PyQt5.QtWidgets import (
     QApplication,
     QWidget,
     QVBoxLayout,
     QGraphicsView,
     QGraphicsScene,
-    QGraphicsLineItem,
     QMenu,
-    QSizePolicy,
 )
-from PyQt5.QtCore import Qt, QTimer, QPointF
-from PyQt5.QtGui import QColor, QPainter, QPalette
+from PyQt5.QtCore import Qt, QTimer, QPointF, QRectF
+from PyQt5.QtGui import QColor, QFont, QPainter, QPalette, QPixmap, QPen
 from SystemResourceModel import SystemResourceModel, TileModel
 from SystemResourceViewModel import SystemResourceViewModel
-from ResizableTileItem import ResizableTileItem
-from CircularGaugeWidget import CircularGaugeWidget
-from CPUGraphWidget import CPUGraphWidget
+from ResizableTileItem import ProxyGeometryTimer, ResizableTileItem
+from TelemetrySource import TelemetrySource, PsutilSource
+from StartupProfiler import STARTUP
+from ProfileStore import ProfileStore
+import TileDiagnostics
+from WidgetRegistry import WIDGET_REGISTRY
+from SpatialIndex import SpatialIndex
+from TileLayoutEngine import TileLayoutEngine
+from PerfInstrumentation import PERF
+from RenderScheduler import RENDER_SCHEDULER
 import qdarktheme
 from typing import List
-import os
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from MainTabWidget import MainTabWidget
 
 
-class ColorDemoWidget(QWidget):
-    def __init__(self, color=QColor(255, 100, 100, 180), parent=None):
-        super().__init__(parent)
-        self.color = color
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+class GridGraphicsView(QGraphicsView):
+    """편집모드 그리드를 아이템 대신 배경에 직접 그리는 QGraphicsView"""
+
+    def __init__(self, scene, grid_size=10, grid_color=QColor(200, 200, 200)):
+        super().__init__(scene)
+        self.grid_size = grid_size
+        self.grid_color = grid_color
+        self.grid_visible = False
+        self._grid_cache = None  # 뷰포트 크기 단위 그리드 QPixmap
+        self._grid_cache_key = None
+        # 성능 오버레이: 계측이 켜져 있는 동안 주기적으로 다시 그려 수치 갱신
+        self._overlay_font = QFont("Consolas", 9)
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setInterval(500)
+        self._overlay_timer.timeout.connect(self._refresh_overlay)
+
+    def set_grid(self, visible: bool, grid_size: int = None, grid_color=None):
+        """그리드 표시 여부/간격/색상 변경"""
+        self.grid_visible = visible
+        if grid_size is not None:
+            self.grid_size = grid_size
+        if grid_color is not None:
+            self.grid_color = grid_color
+        self.resetCachedContent()
+        self.viewport().update()
+
+    def _grid_pixmap(self, width: int, height: int) -> QPixmap:
+        """(폭, 높이, 간격, 색상, DPR)이 같으면 캐시된 그리드 반환"""
+        dpr = self.viewport().devicePixelRatioF()
+        key = (width, height, self.grid_size, self.grid_color.rgba(), dpr)
+        if key != self._grid_cache_key:
+            pixmap = QPixmap(int(width * dpr), int(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setPen(QPen(self.grid_color, 0))
+            for x in range(0, width, self.grid_size):
+                painter.drawLine(x, 0, x, height)
+            for y in range(0, height, self.grid_size):
+                painter.drawLine(0, y, width, y)
+            painter.end()
+            self._grid_cache = pixmap
+            self._grid_cache_key = key
+        return self._grid_cache
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        if not self.grid_visible or self.grid_size <= 0:
+            return
+        viewport = self.viewport()
+        grid_rect = QRectF(0, 0, viewport.width(), viewport.height())
+        exposed = rect.intersected(grid_rect)  # ✅ 노출된 영역만 그림
+        if exposed.isEmpty():
+            return
+        pixmap = self._grid_pixmap(viewport.width(), viewport.height())
+        dpr = pixmap.devicePixelRatioF()
+        source = QRectF(
+            exposed.x() * dpr,
+            exposed.y() * dpr,
+            exposed.width() * dpr,
+            exposed.height() * dpr,
+        )
+        painter.drawPixmap(exposed, pixmap, source)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(self.color)
+        if not PERF.enabled:
+            super().paintEvent(event)
+            return
+        start = time.perf_counter()
+        super().paintEvent(event)
+        PERF.frame(start, time.perf_counter())
+
+    def _refresh_overlay(self):
+        if not PERF.enabled:
+            self._overlay_timer.stop()
+        self.viewport().update()
+
+    def drawForeground(self, painter, rect):
+        super().drawForeground(painter, rect)
+        if not PERF.enabled:
+            return
+        if not self._overlay_timer.isActive():
+            self._overlay_timer.start()
+        summary = PERF.summary()
+        frame = summary["frame_ms"]
+        lines = [
+            f"FPS {summary['fps']:3d}   frame p50 {frame['p50']:5.1f} ms"
+            f"  p99 {frame['p99']:5.1f} ms",
+        ]
+        for name in ("fetch_cpu_data", "update_cpu_values"):
+            span = summary["spans"].get(name)
+            if span:
+                lines.append(
+                    f"{name:<18} p50 {span['p50']:5.2f}  p99 {span['p99']:5.2f}"
+                )
+        if summary["slowest_tiles"]:
+            lines.append("slowest tiles (ms/s)")
+            lines += [
+                f"  {tile:<26} {cost:6.1f}" for tile, cost in summary["slowest_tiles"]
+            ]
+
+        # ✅ 씬 좌표가 아니라 뷰포트 왼쪽 위에 고정
+        painter.save()
+        painter.resetTransform()
+        painter.setFont(self._overlay_font)
+        line_height = painter.fontMetrics().height()
+        width = max(painter.fontMetrics().horizontalAdvance(line) for line in lines)
+        box = QRectF(8, 8, width + 16, line_height * len(lines) + 12)
         painter.setPen(Qt.NoPen)
-        painter.drawRect(self.rect())
+        painter.setBrush(QColor(0, 0, 0, 170))
+        painter.drawRoundedRect(box, 6, 6)
+        painter.setPen(QColor(0, 255, 120))
+        for i, line in enumerate(lines):
+            painter.drawText(
+                QPointF(box.left() + 8, box.top() + 6 + line_height * (i + 0.8)), line
+            )
+        painter.restore()
 
 
 class SystemResourceView(QWidget):
@@ -51,7 +159,7 @@ class SystemResourceView(QWidget):
 
         main_layout = QVBoxLayout(self)
         self.scene = QGraphicsScene()
-        self.view = QGraphicsView(self.scene)
+        self.view = GridGraphicsView(self.scene)
         self.view.setFrameShape(QGraphicsView.NoFrame)
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -60,15 +168,50 @@ class SystemResourceView(QWidget):
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setDragMode(QGraphicsView.RubberBandDrag)
         self.view.viewport().installEventFilter(self)
+        # ✅ 스크롤 시 화면 밖 타일 갱신 중지/재개
+        self.view.horizontalScrollBar().valueChanged.connect(
+            self.update_tile_visibility
+        )
+        self.view.verticalScrollBar().valueChanged.connect(self.update_tile_visibility)
         main_layout.addWidget(self.view)
         self.edit_mode = False
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.grid_size = 10
+        self.grid_color = QColor(200, 200, 200)
         self.tiles = []
+        self.reuse_tiles = True  # 프로필 변경 시 기존 타일 재사용
+        self.widget_registry = WIDGET_REGISTRY  # 위젯 생성/풀 (앱 전체 공유)
+        # 타일 충돌/주변 조회용 인덱스 (버킷은 그리드 10칸 단위, 타일 하나가 몇 칸만 차지)
+        self.spatial_index = SpatialIndex(self.grid_size * 10)
+        # 크기 조절 중 보류한 위젯 크기 적용 예약 (모든 타일 공유, 레이아웃 교체 시 취소)
+        self.proxy_timer = ProxyGeometryTimer(self)
+        # 기본 타일 자동 배치 (저장된 레이아웃을 불러오거나 직접 옮기면 해제)
+        self.layout_engine = TileLayoutEngine(self.grid_size)
+        self.auto_layout = False
+        # 기본 타일에 전체 코어 히트맵 포함 여부 (기본은 코어별 게이지/그래프만)
+        self.default_heatmap = False
+        # ✅ 가상화: 뷰포트 주변 타일에만 실제 위젯을 붙이고 나머지는 빈 타일로 유지
+        self.virtualize = True
+        self.virtualize_margin = 0.5  # 뷰포트 크기 대비 미리 붙여 둘 주변 범위
+        self._materialized = set()  # 위젯이 붙어 있는 타일 (virtualize일 때)
+        self.last_layout_stats = {
+            "reused": 0,
+            "created": 0,
+            "removed": 0,
+            "pool_hit_rate": 0.0,
+            "elapsed_ms": 0.0,
+        }
         self.scene.setSceneRect(0, 0, 600, 600)
         self.model = SystemResourceModel()
         self.viewmodel = SystemResourceViewModel(self.model)
         self.viewmodel.cpu_data_updated.connect(self.on_cpu_data_updated)
+        self.viewmodel.tiles_dirty.connect(self.on_tiles_dirty)
+        # ✅ 장기 기록: 샘플러가 소스별로 기록한 로그를 조회하고 그래프 이력을 미리 채움
+        #    (모델이 바뀌어도 adopt_history로 이어짐)
+        sample_log = getattr(parent, "sample_log", None)
+        if sample_log is not None:
+            self.model.set_sample_log(sample_log)
+            self.viewmodel.backfill_history()
         self.add_grid_lines()
         self._load_current_profile()  # 프로필 로드
 
@@ -76,41 +219,72 @@ class SystemResourceView(QWidget):
             self.load_layout()  # 저장된 레이아웃이 있으면 복구
         else:
             self.create_tiles()  # 없으면 기본 생성
-        self.update_minimum_size()
+        if not self.auto_layout:
+            # 자동 배치는 창 크기에 맞추므로 타일 범위로 창 크기를 고정하지 않음
+            self.update_minimum_size()
         self.customContextMenuRequested.connect(self.show_context_menu)
 
         self.init_data_timer()
-        self.resize(
-            int(self.scene.sceneRect().width()) + 10,
-            int(self.scene.sceneRect().height()) + 10,
-        )
+        if not self.auto_layout:
+            self.resize(
+                int(self.scene.sceneRect().width()) + 10,
+                int(self.scene.sceneRect().height()) + 10,
+            )
 
     def eventFilter(self, obj, event):
         if obj is self.view.viewport() and event.type() == event.Resize:
+            self.relayout_tiles()
             self.add_grid_lines()
+            self.update_tile_visibility()
         return super().eventFilter(obj, event)
 
+    def set_active(self, active: bool):
+        """탭 표시 여부 반영 (숨겨진 동안은 이력만 쌓고 위젯 갱신 생략)"""
+        self.viewmodel.set_active(active)
+        if active:
+            self.update_tile_visibility()
+
+    def update_tile_visibility(self):
+        """뷰포트와 겹치지 않는 타일은 갱신을 멈춤
+
+        virtualize면 뷰포트 주변(virtualize_margin) 타일에만 풀에서 위젯을 붙이고,
+        범위를 벗어난 타일의 위젯은 풀에 반납한다. 공간 인덱스로 주변 타일만
+        조회하므로 전체 타일 수가 아니라 화면에 보이는 타일 수에 비례한다.
+        """
+        if self.view.scene() is None:
+            return  # 씬 삭제 중 (타일이 이미 삭제됨)
+        viewport_rect = self.view.mapToScene(self.view.viewport().rect())
+        visible_rect = viewport_rect.boundingRect()
+        if not self.virtualize:
+            for tile in self.tiles:
+                tile.set_on_screen(visible_rect.intersects(tile.sceneBoundingRect()))
+            return
+
+        dx = visible_rect.width() * self.virtualize_margin
+        dy = visible_rect.height() * self.virtualize_margin
+        near_rect = visible_rect.adjusted(-dx, -dy, dx, dy)
+        near = self.spatial_index.query(
+            (near_rect.x(), near_rect.y(), near_rect.width(), near_rect.height())
+        )
+        for tile in self._materialized - near:
+            tile.set_on_screen(False)
+            widget = tile.release_widget()
+            if widget is not None:
+                self.widget_registry.release(widget)
+        for tile in near:
+            tile.set_on_screen(visible_rect.intersects(tile.sceneBoundingRect()))
+            if not tile.has_widget:
+                tile.attach_widget(
+                    self.widget_registry.acquire(tile.tile_model, self.viewmodel)
+                )
+        self._materialized = near
+
     def add_grid_lines(self):
-        for item in self.scene.items():
-            if isinstance(item, QGraphicsLineItem):
-                self.scene.removeItem(item)
+        """편집모드 그리드 갱신 (뷰 배경에서 그림, 씬 아이템은 만들지 않음)"""
         if self.edit_mode:
             viewport = self.view.viewport()
-            width = viewport.width()
-            height = viewport.height()
-            self.scene.setSceneRect(0, 0, width, height)
-            x = 0
-            while x < width:
-                line = QGraphicsLineItem(x, 0, x, height)
-                line.setPen(QColor(200, 200, 200))
-                self.scene.addItem(line)
-                x += self.grid_size
-            y = 0
-            while y < height:
-                line = QGraphicsLineItem(0, y, width, y)
-                line.setPen(QColor(200, 200, 200))
-                self.scene.addItem(line)
-                y += self.grid_size
+            self.scene.setSceneRect(0, 0, viewport.width(), viewport.height())
+        self.view.set_grid(self.edit_mode, self.grid_size, self.grid_color)
 
     def show_context_menu(self, pos):
         menu = QMenu()
@@ -147,8 +321,41 @@ class SystemResourceView(QWidget):
         load_action = menu.addAction("불러오기")
         load_action.triggered.connect(self.load_layout)
 
+        # 화면 갱신 상한 (샘플링 속도와 무관하게 타일은 프레임당 최대 한 번 그림)
+        menu.addSeparator()
+        fps_menu = menu.addMenu("화면 갱신 FPS")
+        for fps in RENDER_SCHEDULER.FPS_CHOICES:
+            fps_action = fps_menu.addAction(f"{fps} FPS" if fps else "제한 없음")
+            fps_action.setCheckable(True)
+            fps_action.setChecked(RENDER_SCHEDULER.max_fps == fps)
+            fps_action.triggered.connect(
+                lambda _=False, fps=fps: RENDER_SCHEDULER.set_max_fps(fps)
+            )
+
+        # 성능 계측 (오버레이 표시, 트레이스 내보내기)
+        perf_action = menu.addAction("성능 오버레이")
+        perf_action.setCheckable(True)
+        perf_action.setChecked(PERF.enabled)
+        perf_action.triggered.connect(self.set_perf_instrumentation)
+        trace_action = menu.addAction("성능 트레이스 내보내기")
+        trace_action.setEnabled(PERF.enabled)
+        trace_action.triggered.connect(self.export_perf_trace)
+
         menu.exec_(self.mapToGlobal(pos))
 
+    def set_perf_instrumentation(self, enabled: bool):
+        """핫 패스 계측 켜기/끄기 (앱 전체 공유, 켜져 있으면 뷰에 오버레이 표시)"""
+        PERF.set_enabled(enabled)
+        self.view.viewport().update()
+
+    def export_perf_trace(self, filename: str = None) -> str:
+        """계측 기록을 Chrome 트레이스 파일로 저장 (chrome://tracing, Perfetto)"""
+        if filename is None:
+            filename = time.strftime("perf_trace_%Y%m%d_%H%M%S.json")
+        count = PERF.export_chrome_trace(filename)
+        print(f"성능 트레이스 저장: {filename} (구간 {count}개)")
+        return filename
+
     def _update_profile_checks(self):
         """현재 프로필에 따라 체크 상태 업데이트"""
         self.profile_all_action.setChecked(self.current_profile == "ALL")
@@ -162,7 +369,7 @@ class SystemResourceView(QWidget):
 
     def get_profile_filename(self):
         """프로필 기반 파일명"""
-        return f"dashboard_state_{self.parent_tab.current_profile}.json"
+        return self.profile_store.filename(self.parent_tab.current_profile)
 
     def toggle_edit_mode(self):
         self.edit_mode = not self.edit_mode
@@ -174,169 +381,225 @@ class SystemResourceView(QWidget):
             tile.set_enabled(self.edit_mode)
 
     def create_tiles(self):
-        # 예시: 9개 코어, 각 코어마다 CircularGauge/CPUGraphWidget 1개씩
-        num_cores = 9
-        core_ids = [f"core{i+1}" for i in range(num_cores)]
-        widgets = []
-        self.model.tiles.clear()
-        self.tiles.clear()
-        for idx, core_id in enumerate(core_ids):
-            # CircularGauge 타일
-            gauge_model = TileModel(
-                x=10,
-                y=10 + idx * 200,
-                width=200,
-                height=180,
-                widget_type="CircularGauge",
-                core_id=core_id,
-            )
-            self.model.add_tile(gauge_model)
-            gauge = CircularGaugeWidget(core_id=core_id, viewmodel=self.viewmodel)
-            gauge_tile = ResizableTileItem(
-                self.grid_size,
-                cols=10,
-                rows=10,
-                widget=gauge,
-                color=QColor(80, 80, 80, 180),
-                text=f"{core_id}",
-                all_tiles=self.tiles,
-                tile_model=gauge_model,
+        with STARTUP.phase("tile_construction"):
+            # ✅ 코어마다 CircularGauge/CPUGraphWidget 1개씩 + 데모 타일 1개
+            #    (default_heatmap이면 맨 앞에 전체 코어 히트맵 1개)
+            core_ids = self.telemetry_source.core_ids()
+            tile_models = []
+            if self.default_heatmap:
+                tile_models.append(
+                    TileModel(
+                        x=0,
+                        y=0,
+                        width=410,
+                        height=180,
+                        widget_type="CoreHeatmap",
+                        core_id="all",
+                        mode="history",
+                    )
+                )
+            tile_models += self.layout_engine.build_tiles(core_ids)
+            tile_models.append(
+                TileModel(
+                    x=0,
+                    y=0,
+                    width=200,
+                    height=180,
+                    widget_type="ColorDemoWidget",
+                    core_id="demo",
+                )
             )
-            gauge_tile.setRect(0, 0, gauge_model.width, gauge_model.height)
-            gauge_tile.setPos(gauge_model.x, gauge_model.y)
-            gauge_tile.viewmodel = self.viewmodel
-            self.scene.addItem(gauge_tile)
-            gauge_tile.set_enabled(self.edit_mode)
-            self.tiles.append(gauge_tile)
-
-            # CPUGraphWidget 타일
-            graph_model = TileModel(
-                x=220,
-                y=10 + idx * 200,
-                width=200,
-                height=180,
-                widget_type="CPUGraphWidget",
-                core_id=core_id,
-            )
-            self.model.add_tile(graph_model)
-            graph = CPUGraphWidget(core_id=core_id, viewmodel=self.viewmodel)
-            graph_tile = ResizableTileItem(
-                self.grid_size,
-                cols=10,
-                rows=10,
-                widget=graph,
-                color=QColor(80, 80, 80, 180),
-                text=f"{core_id}",
-                all_tiles=self.tiles,
-                tile_model=graph_model,
-            )
-            graph_tile.setRect(0, 0, graph_model.width, graph_model.height)
-            graph_tile.setPos(graph_model.x, graph_model.y)
-            graph_tile.viewmodel = self.viewmodel
-            self.scene.addItem(graph_tile)
-            graph_tile.set_enabled(self.edit_mode)
-            self.tiles.append(graph_tile)
-
-            color_demo_model = TileModel(
-                x=450,
-                y=10,
-                width=200,
-                height=180,
-                widget_type="ColorDemoWidget",
-                core_id="demo",
-            )
-            self.model.add_tile(color_demo_model)
-            color_demo_widget = ColorDemoWidget(
-                color=QColor(255, 100, 100, 180)
-            )  # 원하는 색상 지정
-            color_demo_tile = ResizableTileItem(
-                self.grid_size,
-                cols=10,
-                rows=10,
-                widget=color_demo_widget,
-                color=QColor(80, 80, 80, 180),
-                text="Color Demo",
-                all_tiles=self.tiles,
-                tile_model=color_demo_model,
-            )
-            color_demo_tile.setRect(
-                0, 0, color_demo_model.width, color_demo_model.height
-            )
-            color_demo_tile.setPos(color_demo_model.x, color_demo_model.y)
-            color_demo_tile.viewmodel = self.viewmodel
-            self.scene.addItem(color_demo_tile)
-            color_demo_tile.set_enabled(self.edit_mode)
-            self.tiles.append(color_demo_tile)
+            # 뷰포트 폭에 맞춰 그리드 위에 자동 배치 (창 크기가 바뀌면 다시 배치)
+            self.layout_engine.pack(tile_models, self.view.viewport().width())
+
+            # 캐시된 다른 프로필 모델을 건드리지 않도록 새 모델에서 시작
+            self.model = SystemResourceModel()
+            self.viewmodel.set_model(self.model)
+            for tile_model in tile_models:
+                self.model.add_tile(tile_model)
+            self.apply_tile_models(self.model.tiles)
+            self.auto_layout = True
+            self._fit_scene_rect()
+            self.update_grid_and_tiles()
+
+    def relayout_tiles(self):
+        """자동 배치 중이면 뷰포트 폭에 맞춰 다시 배치 (위치가 바뀐 타일만 이동)"""
+        if not self.auto_layout or not self.tiles:
+            return
+        changed = self.layout_engine.pack(
+            self.model.tiles, self.view.viewport().width()
+        )
+        if not changed:
+            return
+        changed_ids = {id(tile_model) for tile_model in changed}
+        for tile in self.tiles:
+            if id(tile.tile_model) in changed_ids:
+                tile.setPos(tile.tile_model.x, tile.tile_model.y)
+        self._fit_scene_rect()
+
+    def _fit_scene_rect(self):
+        """씬 크기를 타일 전체가 들어가도록 조정"""
+        if self.model.tiles:
+            extent = TileLayoutEngine.extent(self.model.tiles)
+            self.scene.setSceneRect(0, 0, extent["right"] + 100, extent["bottom"] + 100)
+
+    def _tile_key(self, tile_model: TileModel):
+        widget_type = self.widget_registry.canonical(tile_model.widget_type)
+        return (widget_type, tile_model.core_id, tile_model.renderer, tile_model.mode)
+
+    def _build_tile(self, tile_model: TileModel) -> ResizableTileItem:
+        """TileModel로 새 타일 생성 (위젯은 레지스트리 풀에서 가져옴)
+
+        virtualize면 위젯 없이 만들고 update_tile_visibility에서 필요할 때 붙인다.
+        """
+        widget = None
+        if not self.virtualize:
+            widget = self.widget_registry.acquire(tile_model, self.viewmodel)
+        tile = ResizableTileItem(
+            self.grid_size,
+            cols=10,
+            rows=10,
+            widget=widget,
+            color=QColor(80, 80, 80, 180),
+            text=f"{tile_model.core_id}",
+            all_tiles=self.tiles,
+            tile_model=tile_model,
+        )
+        tile.viewmodel = self.viewmodel
+        tile.widget_registry = self.widget_registry
+        tile.proxy_timer = self.proxy_timer
+        self.scene.addItem(tile)
+        tile.attach_index(self.spatial_index)
+        return tile
+
+    def apply_tile_models(self, tile_models: List[TileModel]):
+        """현재 타일을 목표 TileModel 목록에 맞춤
+
+        위젯 종류/코어/렌더러가 같은 타일은 위치와 크기만 바꿔 재사용하고
+        (위젯 상태와 이력 유지), 짝이 없는 모델만 새로 만든다.
+        짝이 없는 기존 타일을 먼저 제거해 그 위젯이 새 타일에 재사용되도록 한다.
+        reuse_tiles가 False면 전부 새로 만든다 (비교 측정용).
+        """
+        start = time.perf_counter()
+        self.proxy_timer.cancel()  # 제거될 타일에 예약된 크기 적용이 남지 않도록
+        available = {}
+        if self.reuse_tiles:
+            for tile in self.tiles:
+                available.setdefault(self._tile_key(tile.tile_model), []).append(tile)
+
+        matches = []
+        reused_ids = set()
+        for tile_model in tile_models:
+            if not self.widget_registry.is_registered(tile_model.widget_type):
+                print(f"⚠️ 알 수 없는 위젯 종류, 건너뜀: {tile_model.widget_type}")
+                continue
+            candidates = available.get(self._tile_key(tile_model))
+            tile = candidates.pop(0) if candidates else None
+            if tile is not None:
+                reused_ids.add(id(tile))
+            matches.append((tile_model, tile))
+
+        removed = 0
+        for tile in self.tiles:
+            if id(tile) not in reused_ids:
+                tile.dispose()  # 위젯은 레지스트리 풀로 반납
+                removed += 1
+
+        new_tiles = []
+        created = 0
+        for tile_model, tile in matches:
+            if tile is not None:
+                tile.tile_model = tile_model
+            else:
+                with STARTUP.phase("tile_construction"):
+                    tile = self._build_tile(tile_model)
+                created += 1
+            tile.setRect(0, 0, tile_model.width, tile_model.height)
+            tile.setPos(tile_model.x, tile_model.y)
+            tile._update_proxy_geometry()
+            new_tiles.append(tile)
+
+        # all_tiles로 같은 리스트를 공유하므로 객체는 유지하고 내용만 교체
+        self.tiles[:] = new_tiles
+        self._materialized = {t for t in self._materialized if t.scene() is not None}
+        self.update_tile_visibility()
+        self.last_layout_stats = {
+            "reused": len(reused_ids),
+            "created": created,
+            "removed": removed,
+            "pool_hit_rate": self.widget_registry.stats()["hit_rate"],
+            "elapsed_ms": (time.perf_counter() - start) * 1000.0,
+        }
+        return self.last_layout_stats
+
+    def diagnostics(self) -> dict:
+        """살아있는 위젯/Figure/연결 수 (프로필 전환 누수 확인용)"""
+        result = TileDiagnostics.report([self.viewmodel])
+        result["tiles"] = len(self.tiles)
+        result["materialized"] = sum(1 for tile in self.tiles if tile.has_widget)
+        result["pool"] = self.widget_registry.stats()
+        result["render"] = RENDER_SCHEDULER.stats()
+        result["layout"] = dict(self.last_layout_stats)  # 마지막 레이아웃 적용
+        if self.model.sample_log is not None:
+            result["sample_log"] = self.model.sample_log.stats()
+        return result
+
+    @property
+    def telemetry_source(self) -> TelemetrySource:
+        """MainTabWidget이 공유하는 데이터 소스 (단독 실행 시 psutil)"""
+        source = getattr(self.parent_tab, "telemetry_source", None)
+        if source is None:
+            source = getattr(self, "_own_telemetry_source", None)
+            if source is None:
+                source = self._own_telemetry_source = PsutilSource()
+        return source
+
+    @property
+    def profile_store(self) -> ProfileStore:
+        """MainTabWidget이 공유하는 프로필 저장소 (단독 실행 시 자체 생성)"""
+        store = getattr(self.parent_tab, "profile_store", None)
+        if store is None:
+            store = getattr(self, "_own_profile_store", None)
+            if store is None:
+                store = self._own_profile_store = ProfileStore()
+        return store
 
     def save_layout(self):
-        filename = self.get_profile_filename()
-        # 기존 파일 읽기
-        if os.path.exists(filename):
-            with open(filename, "r", encoding="utf-8") as f:
-                all_data = json.load(f)
-        else:
-            all_data = {}
-
-        # 현재 시스템 데이터 갱신
-        all_data[self.system_name] = self.model.to_dict()
+        # 현재 시스템 섹션만 즉시 갱신 (다른 시스템 섹션은 저장소 캐시에서 유지)
+        self.profile_store.save_model(
+            self.parent_tab.current_profile, self.system_name, self.model
+        )
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(all_data, f, indent=2)
+    def on_tiles_dirty(self, tiles: list):
+        """타일 편집 후 호출: 공유 저장소에 변경 기록 (잠시 뒤 한 번에 저장)"""
+        self.auto_layout = False  # 직접 옮긴 배치는 창 크기 변경 시 유지
+        self.profile_store.mark_dirty(
+            self.parent_tab.current_profile, self.system_name, self.model, tiles
+        )
 
     def load_layout(self):
-        filename = self.get_profile_filename()
         try:
-            # 파일이 존재하면 전체 데이터 로드
-            if os.path.exists(filename):
-                with open(filename, "r", encoding="utf-8") as f:
-                    all_data = json.load(f)
-                # 현재 시스템에 해당하는 데이터만 추출
-                data = all_data.get(self.system_name, None)
-                if data:
-                    # 모델 갱신
-                    self.model = SystemResourceModel.from_dict(data)
-                    self.viewmodel.model = self.model
-
-                    # 기존 타일 제거
-                    for tile in self.tiles:
-                        self.scene.removeItem(tile)
-                    self.tiles.clear()
-
-                    # 새 타일 생성
-                    for tile_model in self.model.tiles:
-                        if tile_model.widget_type == "CircularGaugeWidget":
-                            widget = CircularGaugeWidget(
-                                core_id=tile_model.core_id, viewmodel=self.viewmodel
-                            )
-                        else:
-                            widget = CPUGraphWidget(
-                                core_id=tile_model.core_id, viewmodel=self.viewmodel
-                            )
-                        tile = ResizableTileItem(
-                            self.grid_size,
-                            cols=10,
-                            rows=10,
-                            widget=widget,
-                            color=QColor(80, 80, 80, 180),
-                            text=f"{tile_model.core_id}",
-                            all_tiles=self.tiles,
-                            tile_model=tile_model,
-                        )
-                        tile.setRect(0, 0, tile_model.width, tile_model.height)
-                        tile.setPos(tile_model.x, tile_model.y)
-                        tile._update_proxy_geometry()
-                        self.scene.addItem(tile)
-                        self.tiles.append(tile)
-
-                    # 씬 크기 조정
-                    if self.model.tiles:
-                        max_x = max(tile.x + tile.width for tile in self.model.tiles)
-                        max_y = max(tile.y + tile.height for tile in self.model.tiles)
-                        self.scene.setSceneRect(0, 0, max_x + 100, max_y + 100)
-
-                    self.update_grid_and_tiles()
-                    print(f"{self.system_name} 레이아웃 복구 성공")
-                    return  # 성공 시 종료
+            # ✅ 공유 저장소에서 현재 시스템 모델 조회 (프로필 파일은 한 번만 파싱)
+            model = self.profile_store.get_model(
+                self.parent_tab.current_profile, self.system_name
+            )
+            if model is not None:
+                # 모델 갱신
+                self.model = model
+                self.viewmodel.set_model(self.model)
+
+                # ✅ 기존 타일과 새 레이아웃 비교: 같은 종류/코어는 재사용
+                self.apply_tile_models(self.model.tiles)
+
+                # 씬 크기 조정 (저장된 배치는 자동으로 다시 배치하지 않음)
+                self.auto_layout = False
+                self._fit_scene_rect()
+
+                self.update_grid_and_tiles()
+                self.update_tile_visibility()
+                # 재사용/생성/제거 수와 소요 시간은 diagnostics()["layout"]로 확인
+                print(f"{self.system_name} 레이아웃 복구 성공")
+                return  # 성공 시 종료
 
             # 파일이 없거나 해당 시스템 데이터가 없으면 기본 타일 생성
             print(f"{self.system_name} 레이아웃 데이터 없음, 기본 타일 생성")
@@ -347,8 +610,7 @@ class SystemResourceView(QWidget):
             self.create_tiles()
 
     def _has_saved_layout(self):
-        filename = self.get_profile_filename()
-        return os.path.exists(filename) and os.path.getsize(filename) > 0
+        return self.profile_store.has_layout(self.parent_tab.current_profile)
 
     def _save_current_profile(self):
         """현재 프로필을 설정 파일에 저장"""
@@ -375,14 +637,20 @@ class SystemResourceView(QWidget):
         self.setMinimumSize(int(max_right + margin), int(max_bottom + margin))
 
     def init_data_timer(self):
+        sampler = getattr(self.parent_tab, "sampler", None)
+        if sampler is not None:
+            # ✅ 공유 샘플러에 ViewModel 등록 (탭마다 타이머를 두지 않음)
+            sampler.subscribe(self.viewmodel, "cpu")
+            return
+        # 공유 샘플러가 없는 경우 (단독 실행) 자체 타이머 사용
         self.data_timer = QTimer()
         self.data_timer.timeout.connect(self.fetch_cpu_data)
         self.data_timer.start(1000)  # 1초마다 업데이트
 
     def fetch_cpu_data(self):
-        cpu_percent = psutil.cpu_percent(percpu=True)
-        new_data = {f"core{i+1}": val for i, val in enumerate(cpu_percent)}
-        self.viewmodel.update_cpu_values(new_data)
+        with PERF.span("fetch_cpu_data"):
+            values = self.telemetry_source.read()
+        self.viewmodel.update_cpu_values(values)
 
     def on_cpu_data_updated(self, new_data):
         # 이 메서드는 CircularGauge/CPUGraphWidget에서 ViewModel의 시그널로 자동 반영됨
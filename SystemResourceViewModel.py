@@ -1,25 +1,251 @@
+import math
+import threading
+from collections import deque
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Union
 from PyQt5.QtCore import QObject, pyqtSignal
 from SystemResourceModel import SystemResourceModel
+from PerfInstrumentation import PERF
+
+
+class CoreSubscription:
+    """코어 단위 구독 정보 (subscribe()가 반환)"""
+
+    def __init__(
+        self,
+        cores: Iterable[str],
+        callback: Callable[[str, float], None],
+        deadband: Optional[float],
+        change_key: Optional[Callable[[float], Hashable]] = None,
+    ):
+        self.cores = frozenset(cores)
+        self.callback = callback
+        # None: 매 틱 전달 / 0.0: 값이 바뀔 때만 / x: 마지막 전달값 대비 x 초과 변화 시
+        self.deadband = deadband
+        # 설정하면 deadband 대신 change_key(값)이 마지막 전달값과 다를 때만 전달
+        # (예: 표시 문자열이나 색 구간이 바뀔 때)
+        self.change_key = change_key
+        self.last_values: Dict[str, float] = {}
+        self.paused = False  # 화면 밖 타일: 값은 버리고 재개 시 한 번에 따라잡음
+        self.delivered = 0
+        self.suppressed = 0  # 데드밴드로 생략된 갱신
+        self.skipped = 0  # 일시정지(화면 밖)로 생략된 갱신
+
+    def offer(self, core_id: str, value: float):
+        """데드밴드 조건을 만족하면 콜백 호출"""
+        if self.paused:
+            self.skipped += 1
+            return
+        last = self.last_values.get(core_id)
+        if self.change_key is not None:
+            if last is not None and self.change_key(value) == self.change_key(last):
+                self.suppressed += 1
+                return
+        elif (
+            self.deadband is not None
+            and last is not None
+            and abs(value - last) <= self.deadband
+            and (self.deadband > 0 or value == last)
+        ):
+            self.suppressed += 1
+            return
+        self.last_values[core_id] = value
+        self.delivered += 1
+        self.callback(core_id, value)
 
 
 class SystemResourceViewModel(QObject):
     cpu_data_updated = pyqtSignal(dict)  # { "core1": 값, ... }
     tiles_updated = pyqtSignal(list)  # 타일 정보 변경 시
+    tiles_dirty = pyqtSignal(list)  # 저장이 필요한 타일 (TileModel 목록)
 
-    def __init__(self, model: SystemResourceModel):
+    def __init__(self, model: SystemResourceModel, sample_buffer_size: int = 256):
         super().__init__()
         self._model = model
+        # ✅ 수집 스레드 → GUI 스레드 전달용 제한 크기 버퍼 (가득 차면 오래된 샘플부터 버림)
+        # 버림 판정(추가 전후 길이 비교)과 비우기가 섞이지 않도록 잠금으로 보호
+        self._pending = deque(maxlen=sample_buffer_size)
+        self._pending_lock = threading.Lock()
+        self.dropped_samples = 0  # 버퍼가 가득 차 버려진 샘플 수
+        # ✅ 코어별 구독자 목록 (해당 코어 값만 전달)
+        self._subscriptions: Dict[str, List[CoreSubscription]] = {}
+        # ✅ 숨겨진 탭이면 이력만 쌓고 위젯 갱신은 생략
+        self.active = True
+        self.skipped_updates = 0  # 비활성 상태에서 생략된 위젯 갱신 수
 
     # CPU 데이터 관련 메서드
-    def update_cpu_values(self, new_values: dict):
-        """CPU 데이터 업데이트 및 신호 발생"""
-        self._model.update_cpu_data(new_values)
-        self.cpu_data_updated.emit(new_values)
+    def push_sample(self, timestamp: float, values: dict):
+        """수집 스레드에서 호출: 타임스탬프가 붙은 샘플을 버퍼에 추가"""
+        with self._pending_lock:
+            before = len(self._pending)
+            self._pending.append((timestamp, values))
+            if len(self._pending) == before:
+                self.dropped_samples += 1  # 가득 찬 버퍼에서 가장 오래된 샘플이 밀려남
+
+    def drain_samples(self) -> int:
+        """GUI 스레드에서 호출: 버퍼를 비우고 최신 샘플로 한 번만 신호 발생"""
+        with self._pending_lock:
+            samples = list(self._pending)
+            self._pending.clear()
+        if not samples:
+            return 0
+        for timestamp, values in samples[:-1]:
+            self._model.append_history(values, timestamp)  # 밀린 샘플은 이력에만
+        timestamp, values = samples[-1]
+        self.update_cpu_values(values, timestamp)
+        return len(samples)
+
+    def update_cpu_values(self, new_values: dict, timestamp: float = None):
+        """CPU 데이터 업데이트 및 신호 발생 (timestamp: 샘플 시각, 없으면 현재)"""
+        self._model.update_cpu_data(new_values, timestamp)
+        if not self.active:
+            subscriptions = self._subscriptions
+            self.skipped_updates += sum(
+                len(subscriptions[c]) for c in new_values if c in subscriptions
+            )
+            return
+        with PERF.span("update_cpu_values"):
+            self._dispatch(new_values)
+            self.cpu_data_updated.emit(new_values)
+
+    def set_active(self, active: bool):
+        """탭 표시 여부 반영 (다시 보이면 최신값으로 한 번에 갱신)"""
+        if active == self.active:
+            return
+        self.active = active
+        if active and self._model.cpu_cores:
+            self._dispatch(self._model.cpu_cores)
+            self.cpu_data_updated.emit(self._model.cpu_cores)
+
+    def set_subscription_paused(self, subscription: CoreSubscription, paused: bool):
+        """타일 단위 일시정지 (재개 시 담당 코어 최신값을 한 번 전달)"""
+        if subscription is None or subscription.paused == paused:
+            return
+        subscription.paused = paused
+        if not paused and self.active:
+            cpu_cores = self._model.cpu_cores
+            for core_id in subscription.cores:
+                if core_id in cpu_cores:
+                    subscription.offer(core_id, cpu_cores[core_id])
+
+    def update_stats(self) -> dict:
+        """위젯 갱신 전달/생략 통계 (생략 수 = 절약된 다시 그리기 수)"""
+        subscriptions = {
+            id(s): s for subs in self._subscriptions.values() for s in subs
+        }
+        delivered = sum(s.delivered for s in subscriptions.values())
+        deadband = sum(s.suppressed for s in subscriptions.values())
+        offscreen = sum(s.skipped for s in subscriptions.values())
+        return {
+            "subscriptions": len(subscriptions),
+            "delivered": delivered,
+            "skipped_deadband": deadband,
+            "skipped_offscreen": offscreen,
+            "skipped_hidden": self.skipped_updates,
+            "saved_paints": deadband + offscreen + self.skipped_updates,
+        }
+
+    def subscribe(
+        self,
+        cores: Union[str, Iterable[str]],
+        callback: Callable[[str, float], None],
+        deadband: Optional[float] = 0.0,
+        change_key: Optional[Callable[[float], Hashable]] = None,
+    ) -> CoreSubscription:
+        """코어 하나 또는 여러 개를 구독 (callback(core_id, value))
+
+        deadband가 None이면 매 틱 전달, 0.0이면 값이 바뀐 경우만,
+        양수이면 마지막 전달값과의 차이가 deadband를 넘을 때만 전달한다.
+        change_key를 주면 deadband 대신 change_key(값)이 바뀔 때만 전달한다.
+        """
+        if isinstance(cores, str):
+            cores = [cores]
+        subscription = CoreSubscription(cores, callback, deadband, change_key)
+        for core_id in subscription.cores:
+            self._subscriptions.setdefault(core_id, []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: CoreSubscription):
+        """구독 해제"""
+        for core_id in subscription.cores:
+            subs = self._subscriptions.get(core_id)
+            if subs and subscription in subs:
+                subs.remove(subscription)
+                if not subs:
+                    del self._subscriptions[core_id]
+
+    def subscription_count(self) -> int:
+        """현재 등록된 구독 수 (진단용)"""
+        return len({id(s) for subs in self._subscriptions.values() for s in subs})
+
+    def _dispatch(self, new_values: dict):
+        subscriptions = self._subscriptions
+        for core_id, value in new_values.items():
+            subs = subscriptions.get(core_id)
+            if subs:
+                for subscription in subs:
+                    subscription.offer(core_id, value)
 
     def get_cpu_value(self, core_id: str) -> float:
         """특정 코어 값 조회"""
         return self._model.cpu_cores.get(core_id, 0.0)
 
+    def get_history(self, core_id: str, num_points: int = None):
+        """특정 코어의 최근 샘플 (모델 링 버퍼의 읽기 전용 뷰)"""
+        return self._model.history.view(core_id, num_points)
+
+    def get_history_window(self, num_points: int = None):
+        """전체 코어의 최근 샘플 (코어 × num_points 읽기 전용 뷰, 행 순서는 history.core_ids)"""
+        window = self._model.history.window()
+        if num_points is not None and num_points < window.shape[1]:
+            window = window[:, -num_points:]
+        return window
+
+    def get_logged_history(self, core_id: str, start: float = None, end: float = None):
+        """장기 기록에서 core_id의 (시각, 사용률) 배열 (기록하지 않으면 None)
+
+        하루 단위 구간 파일 안의 범위는 메모리 매핑 뷰 그대로 반환된다.
+        """
+        sample_log = self._model.sample_log
+        if sample_log is None:
+            return None
+        return sample_log.history(core_id, start, end)
+
+    def backfill_history(self) -> int:
+        """이력 버퍼가 비어 있으면 장기 기록의 최근 샘플로 채움 (채운 샘플 수)
+
+        재시작 직후나 나중에 만든 탭의 그래프도 바로 지난 값을 보여 준다.
+        기록에 없는 코어(NaN)는 빠진 코어로 취급한다.
+        """
+        sample_log = self._model.sample_log
+        history = self._model.history
+        if sample_log is None or history.count:
+            return 0
+        filled = 0
+        for core_ids, records in sample_log.recent(history.length):
+            for row in records["v"]:
+                history.append(
+                    {c: float(v) for c, v in zip(core_ids, row) if not math.isnan(v)}
+                )
+            filled += len(records)
+        return filled
+
+    def set_history_length(self, length: int):
+        """코어별 보관 샘플 수 변경"""
+        self._model.history.resize(length)
+
+    @property
+    def model(self) -> SystemResourceModel:
+        return self._model
+
+    @model.setter
+    def model(self, model: SystemResourceModel):
+        self.set_model(model)
+
+    def set_model(self, model: SystemResourceModel):
+        """모델 교체 (수집된 이력은 새 모델로 이어짐)"""
+        model.adopt_history(self._model)
+        self._model = model
+
     # 타일 관련 메서드
     def get_tile_state(self, index: int) -> dict:
         """타일 상태 반환"""
@@ -41,3 +267,9 @@ class SystemResourceViewModel(QObject):
         tile.width = state["width"]
         tile.height = state["height"]
         self.tiles_updated.emit(self._model.tiles)
+        self.mark_tiles_dirty([tile])
+
+    def mark_tiles_dirty(self, tiles: list):
+        """타일 위치/크기 변경을 저장 대상으로 알림"""
+        if tiles:
+            self.tiles_dirty.emit(list(tiles))
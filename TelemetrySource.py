@@ -0,0 +1,355 @@
+import json
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import psutil
+
+from CpuSampler import read_psutil_cpu
+
+Sample = Tuple[float, Dict[str, float]]  # (time.time() 기준 시각, { "core1": 값, ... })
+
+TRACE_MAGIC = b"CPUTRACE1\n"
+
+
+def record_dtype(core_count: int) -> np.dtype:
+    """기록 파일의 고정 폭 레코드 (시각 float64 + 코어별 사용률 float32)"""
+    return np.dtype([("t", "<f8"), ("v", "<f4", (core_count,))])
+
+
+class TelemetrySource(ABC):
+    """CPU 사용률 공급원 인터페이스 (CpuSampler.add_source에 그대로 등록)
+
+    read()는 최신 샘플 하나, poll()은 지난 호출 이후 도착한 샘플 목록을 반환한다.
+    CpuSampler는 poll()이 있으면 그 결과를 모두 ViewModel 버퍼로 넘기므로,
+    샘플러 주기(period_ms)보다 빠른 소스도 샘플을 잃지 않는다.
+    poll()/read()는 수집 스레드에서 호출된다.
+    read()를 구현하지 않은 하위 클래스는 생성 시점에 TypeError가 난다.
+    """
+
+    period_ms = 1000  # 권장 poll 주기
+
+    @abstractmethod
+    def read(self) -> Dict[str, float]:
+        """최신 샘플 하나 { "core1": 값, ... }"""
+
+    def poll(self) -> List[Sample]:
+        return [(time.time(), self.read())]
+
+    def core_ids(self) -> List[str]:
+        """기본 타일 생성에 쓸 코어 목록"""
+        return list(self.read())
+
+    def close(self):
+        pass
+
+    def __call__(self) -> Dict[str, float]:
+        return self.read()
+
+
+class PsutilSource(TelemetrySource):
+    """실제 장비의 psutil 코어별 사용률 (기본 소스)"""
+
+    def __init__(self, period_ms: int = 1000):
+        self.period_ms = period_ms
+
+    def read(self) -> Dict[str, float]:
+        return read_psutil_cpu()
+
+    def core_ids(self) -> List[str]:
+        # cpu_percent()를 여기서 부르면 수집 스레드의 측정 구간이 초기화되므로
+        # 샘플링 없이 코어 수만 조회
+        return [f"core{i+1}" for i in range(psutil.cpu_count())]
+
+
+class SyntheticSource(TelemetrySource):
+    """cores개 코어, rate_hz 속도의 가상 부하 생성기
+
+    pattern:
+    - random_walk: 코어별 랜덤 워크
+    - sine / square / ramp: period_s 주기 파형 (코어마다 위상이 다름)
+    - spike: 낮은 기본 부하에 spike_rate 확률로 95~100% 스파이크
+    - constant: level 고정
+    poll()은 시계 기준으로 그동안 나왔어야 할 샘플을 한 번에 배열로 만들어
+    반환하므로, 샘플러가 늦게 불러도 rate_hz가 유지된다 (최대 1초 분량).
+    """
+
+    PATTERNS = ("random_walk", "sine", "square", "ramp", "spike", "constant")
+
+    def __init__(
+        self,
+        cores: int = 8,
+        rate_hz: float = 10.0,
+        pattern: str = "random_walk",
+        period_s: float = 5.0,
+        level: float = 50.0,
+        spike_rate: float = 0.02,
+        seed: int = 0,
+    ):
+        if pattern not in self.PATTERNS:
+            raise ValueError(f"알 수 없는 패턴: {pattern} ({', '.join(self.PATTERNS)})")
+        self.cores = cores
+        self.rate_hz = rate_hz
+        self.pattern = pattern
+        self.period_s = period_s
+        self.level = level
+        self.spike_rate = spike_rate
+        self.period_ms = max(10, int(1000.0 / rate_hz))
+        self._core_ids = [f"core{i+1}" for i in range(cores)]
+        self._rng = np.random.default_rng(seed)
+        self._phase = self._rng.uniform(0.0, 1.0, cores)  # 코어별 위상 (주기 비율)
+        self._values = self._rng.uniform(0.0, 100.0, cores)
+        self._step = 0  # 지금까지 만든 샘플 수 (파형의 시간축)
+        self._t0 = None  # 첫 poll 시각 (monotonic)
+        self._wall0 = None
+
+    def core_ids(self) -> List[str]:
+        return list(self._core_ids)
+
+    def generate(self, count: int) -> np.ndarray:
+        """다음 count개 샘플 (count × cores 배열, 0~100)"""
+        steps = self._step + np.arange(count)
+        self._step += count
+        t = (steps / self.rate_hz)[:, None]
+        cycle = (t / self.period_s + self._phase) % 1.0
+        if self.pattern == "random_walk":
+            values = np.empty((count, self.cores))
+            noise = self._rng.normal(0.0, 8.0, (count, self.cores))
+            for i in range(count):
+                self._values = np.clip(self._values + noise[i], 0.0, 100.0)
+                values[i] = self._values
+            return values
+        if self.pattern == "sine":
+            return 50.0 + 45.0 * np.sin(2.0 * np.pi * cycle)
+        if self.pattern == "square":
+            return np.where(cycle < 0.5, 90.0, 10.0)
+        if self.pattern == "ramp":
+            return cycle * 100.0
+        if self.pattern == "spike":
+            base = np.clip(self._rng.normal(10.0, 5.0, (count, self.cores)), 0.0, 100.0)
+            spikes = self._rng.random((count, self.cores)) < self.spike_rate
+            return np.where(spikes, self._rng.uniform(95.0, 100.0, base.shape), base)
+        return np.full((count, self.cores), self.level)
+
+    def _to_dict(self, row) -> Dict[str, float]:
+        return dict(zip(self._core_ids, row.tolist()))
+
+    def sample(self) -> Dict[str, float]:
+        """시계와 무관하게 다음 샘플 하나 (벤치마크 등 결정적 재현용)"""
+        return self._to_dict(self.generate(1)[0])
+
+    def read(self) -> Dict[str, float]:
+        return self.sample()
+
+    def poll(self) -> List[Sample]:
+        now = time.monotonic()
+        if self._t0 is None:
+            self._t0, self._wall0 = now, time.time()
+            self._step = 0
+        due = int((now - self._t0) * self.rate_hz) + 1 - self._step
+        if due <= 0:
+            return []
+        limit = max(1, int(self.rate_hz))
+        if due > limit:
+            # 1초 넘게 밀렸으면 (디버거 정지 등) 밀린 구간은 건너뜀
+            self._step += due - limit
+            due = limit
+        first = self._step
+        values = self.generate(due)
+        return [
+            (self._wall0 + (first + i) / self.rate_hz, self._to_dict(row))
+            for i, row in enumerate(values)
+        ]
+
+
+class RecordingSource(TelemetrySource):
+    """다른 소스를 감싸 샘플을 그대로 전달하면서 파일에 기록
+
+    파일은 TRACE_MAGIC, JSON 헤더 한 줄(코어 목록) 뒤에 record_dtype 레코드가
+    이어지는 형식이며, 코어 목록은 첫 샘플에서 정해진다 (이후 빠진 코어는 NaN).
+    쓰기는 수집 스레드에서 버퍼링되며 flush_interval_s마다 디스크로 내보낸다.
+    """
+
+    def __init__(self, inner: TelemetrySource, filename: str, flush_interval_s=1.0):
+        self.inner = inner
+        self.filename = filename
+        self.period_ms = inner.period_ms
+        self.flush_interval_s = flush_interval_s
+        self.recorded = 0
+        self._file = None
+        self._core_ids: Optional[List[str]] = None
+        self._dtype = None
+        self._last_flush = time.monotonic()
+
+    def core_ids(self) -> List[str]:
+        return self.inner.core_ids()
+
+    def _open(self, core_ids: Sequence[str]):
+        self._core_ids = list(core_ids)
+        self._dtype = record_dtype(len(self._core_ids))
+        self._file = open(self.filename, "wb", buffering=1 << 20)
+        header = json.dumps({"core_ids": self._core_ids, "dtype": self._dtype.descr})
+        self._file.write(TRACE_MAGIC + header.encode("utf-8") + b"\n")
+
+    def _write(self, samples: List[Sample]):
+        if not samples:
+            return
+        if self._file is None:
+            self._open(samples[0][1])
+        records = np.empty(len(samples), dtype=self._dtype)
+        for i, (timestamp, values) in enumerate(samples):
+            records["t"][i] = timestamp
+            records["v"][i] = [values.get(c, math.nan) for c in self._core_ids]
+        self._file.write(records.tobytes())
+        self.recorded += len(samples)
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval_s:
+            self._file.flush()
+            self._last_flush = now
+
+    def read(self) -> Dict[str, float]:
+        values = self.inner.read()
+        self._write([(time.time(), values)])
+        return values
+
+    def poll(self) -> List[Sample]:
+        samples = self.inner.poll()
+        self._write(samples)
+        return samples
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            print(f"텔레메트리 기록 저장: {self.filename} ({self.recorded}개 샘플)")
+        self.inner.close()
+
+
+def load_recording(filename: str) -> Tuple[List[str], np.ndarray]:
+    """기록 파일을 메모리 매핑으로 열어 (코어 목록, 레코드 배열) 반환
+
+    기록 도중 끊겨 마지막 레코드가 잘린 파일도 완전한 레코드까지만 읽는다.
+    """
+    with open(filename, "rb") as f:
+        if f.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError(f"텔레메트리 기록 파일이 아님: {filename}")
+        header = json.loads(f.readline().decode("utf-8"))
+        offset = f.tell()
+    core_ids = header["core_ids"]
+    dtype = record_dtype(len(core_ids))
+    count = (os.path.getsize(filename) - offset) // dtype.itemsize
+    if count == 0:
+        return core_ids, np.empty(0, dtype=dtype)
+    records = np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=(count,))
+    return core_ids, records
+
+
+class ReplaySource(TelemetrySource):
+    """RecordingSource로 기록한 파일 재생
+
+    speed=1은 기록 당시 속도, 2는 두 배속, 0은 시계와 무관하게 poll마다
+    max_batch개씩 최대한 빠르게 내보낸다. loop=True면 끝에서 처음으로 돌아간다.
+    샘플 시각은 재생 시작 시각 + (기록 시각 - 기록 시작 시각) / speed로 다시 매긴다
+    (speed=0이면 기록 간격 그대로라 실제 시각보다 앞설 수 있다).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        speed: float = 1.0,
+        loop: bool = False,
+        period_ms: int = 20,
+        max_batch: int = 128,
+    ):
+        self.filename = filename
+        self.speed = speed
+        self.loop = loop
+        self.period_ms = period_ms
+        self.max_batch = max_batch
+        self._core_ids, self._records = load_recording(filename)
+        self._position = 0
+        # (재생 시작 monotonic, 재생 시작 time.time(), 해당 기록 시각)
+        self._start = None
+        self._last_time = 0.0  # 마지막으로 내보낸 샘플 시각 (반복 재생 시 역행 방지)
+        self.finished = len(self._records) == 0
+        self._last: Dict[str, float] = {}
+
+    def core_ids(self) -> List[str]:
+        return list(self._core_ids)
+
+    def __len__(self):
+        return len(self._records)
+
+    def read(self) -> Dict[str, float]:
+        if not self._last and len(self._records):
+            return dict(zip(self._core_ids, self._records[0]["v"].tolist()))
+        return dict(self._last)
+
+    def poll(self) -> List[Sample]:
+        if self.finished:
+            return []
+        now = time.monotonic()
+        if self._start is None:
+            wall0 = max(time.time(), self._last_time)
+            self._start = (now, wall0, float(self._records[self._position]["t"]))
+        start, wall0, t_start = self._start
+        if self.speed > 0:
+            target = t_start + (now - start) * self.speed
+            end = int(np.searchsorted(self._records["t"], target, side="right"))
+            end = min(max(end, self._position), self._position + self.max_batch)
+        else:
+            end = self._position + self.max_batch
+        end = min(end, len(self._records))
+
+        chunk = self._records[self._position : end]
+        scale = 1.0 / self.speed if self.speed > 0 else 1.0
+        times = (wall0 + (chunk["t"] - t_start) * scale).tolist()
+        samples = [
+            (t, dict(zip(self._core_ids, values)))
+            for t, values in zip(times, chunk["v"].tolist())
+        ]
+        self._position = end
+        if samples:
+            self._last_time, self._last = samples[-1]
+        if self._position >= len(self._records):
+            if self.loop:
+                self._position = 0
+                self._start = None
+            else:
+                self.finished = True
+                print(f"텔레메트리 재생 완료: {self.filename}")
+        return samples
+
+
+def add_telemetry_arguments(parser):
+    """명령줄 옵션 등록 (MainTabWidget 실행 시 소스 선택)"""
+    parser.add_argument(
+        "--synthetic",
+        metavar="CORESxHZ",
+        help="가상 부하 사용 (예: 256x100)",
+    )
+    parser.add_argument(
+        "--pattern", default="random_walk", choices=SyntheticSource.PATTERNS
+    )
+    parser.add_argument("--replay", metavar="FILE", help="기록 파일 재생")
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="재생 배속 (0=최대한 빠르게)"
+    )
+    parser.add_argument("--loop", action="store_true", help="재생 반복")
+    parser.add_argument("--record", metavar="FILE", help="수집한 샘플을 파일에 기록")
+
+
+def telemetry_source_from_args(args) -> TelemetrySource:
+    if args.replay:
+        source = ReplaySource(args.replay, speed=args.speed, loop=args.loop)
+    elif args.synthetic:
+        cores, _, rate = args.synthetic.lower().partition("x")
+        source = SyntheticSource(int(cores), float(rate or 10.0), pattern=args.pattern)
+    else:
+        source = PsutilSource()
+    if args.record:
+        source = RecordingSource(source, args.record)
+    return source
@@ -0,0 +1,42 @@
+import gc
+import weakref
+from typing import Iterable
+
+# 살아있는 위젯/Figure 추적 (약한 참조라 추적 자체가 수명에 영향을 주지 않음)
+_live_widgets = weakref.WeakSet()
+_live_figures = weakref.WeakSet()
+
+
+def track_widget(widget):
+    """타일 위젯 생성 시 등록"""
+    _live_widgets.add(widget)
+
+
+def track_figure(figure):
+    """matplotlib Figure 생성 시 등록"""
+    _live_figures.add(figure)
+
+
+def report(viewmodels: Iterable = (), collect: bool = True) -> dict:
+    """살아있는 위젯/Figure 수와 ViewModel 연결 수 집계
+
+    collect=True면 먼저 gc를 돌려 순환 참조로 남은 객체를 정리한다.
+    """
+    if collect:
+        gc.collect()
+    widgets = {}
+    for widget in list(_live_widgets):
+        if getattr(widget, "_disposed", False):
+            continue
+        name = type(widget).__name__
+        widgets[name] = widgets.get(name, 0) + 1
+    connections = 0
+    for viewmodel in viewmodels:
+        connections += viewmodel.subscription_count()
+        connections += viewmodel.receivers(viewmodel.cpu_data_updated)
+    return {
+        "widgets": widgets,
+        "live_widgets": sum(widgets.values()),
+        "figures": len(_live_figures),
+        "connections": connections,
+    }
@@ -0,0 +1,92 @@
+import math
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from SystemResourceModel import TileModel
+
+
+class TileLayoutEngine:
+    """코어 목록과 뷰포트 폭으로 타일을 그리드(grid_size)에 맞춰 배치
+
+    shelf 방식: 왼쪽부터 채우다 폭을 넘으면 다음 줄(선반)로 내려가며, 줄 높이는
+    그 줄에서 가장 높은 타일이 정한다. 크기가 모두 같으면 일반 격자 배치와 같다.
+    같은 폭에 대해 다시 배치하면 결과가 같으므로, 창 크기가 바뀌어도 한 줄에
+    들어가는 칸 수가 그대로면 아무 타일도 움직이지 않는다.
+    """
+
+    def __init__(
+        self,
+        grid_size: int = 10,
+        tile_width: int = 200,
+        tile_height: int = 180,
+        spacing: int = 10,
+        margin: int = 10,
+    ):
+        self.grid_size = grid_size
+        self.tile_width = tile_width  # 목표 타일 크기 (그리드에 맞춰 올림)
+        self.tile_height = tile_height
+        self.spacing = spacing
+        self.margin = margin
+        self.last_pack_ms = 0.0
+
+    def _snap(self, value: float) -> int:
+        """그리드 간격 배수로 올림"""
+        return int(math.ceil(value / self.grid_size) * self.grid_size)
+
+    def build_tiles(
+        self,
+        core_ids: Sequence[str],
+        widget_types: Sequence[str] = ("CircularGauge", "CPUGraphWidget"),
+    ) -> List[TileModel]:
+        """코어마다 widget_types 순서대로 목표 크기의 타일 생성 (위치는 pack에서)"""
+        width = self._snap(self.tile_width)
+        height = self._snap(self.tile_height)
+        return [
+            TileModel(
+                x=0, y=0, width=width, height=height, widget_type=t, core_id=core_id
+            )
+            for core_id in core_ids
+            for t in widget_types
+        ]
+
+    def pack(self, tiles: List[TileModel], viewport_width: float) -> List[TileModel]:
+        """tiles 위치를 뷰포트 폭에 맞춰 다시 계산, 위치가 바뀐 타일만 반환"""
+        start = time.perf_counter()
+        changed = []
+        for tile, (x, y) in zip(tiles, self.positions(tiles, viewport_width)):
+            if (tile.x, tile.y) != (x, y):
+                tile.x, tile.y = x, y
+                changed.append(tile)
+        self.last_pack_ms = (time.perf_counter() - start) * 1000.0
+        return changed
+
+    def positions(
+        self, tiles: Sequence[TileModel], viewport_width: float
+    ) -> List[Tuple[float, float]]:
+        """shelf 배치로 계산한 타일별 (x, y) (타일은 바꾸지 않음)"""
+        left = self._snap(self.margin)
+        gap = self._snap(self.spacing)
+        right = max(viewport_width - self.margin, 0)
+        result = []
+        x = y = left
+        shelf_height = 0
+        for tile in tiles:
+            # 줄에 타일이 하나라도 있는데 폭을 넘으면 다음 줄로 (너무 좁아도 최소 1개)
+            if x > left and x + tile.width > right:
+                x = left
+                y += self._snap(shelf_height + gap)
+                shelf_height = 0
+            result.append((float(x), float(y)))
+            x += self._snap(tile.width + gap)
+            shelf_height = max(shelf_height, tile.height)
+        return result
+
+    @staticmethod
+    def extent(tiles: Sequence[TileModel]) -> Dict[str, float]:
+        """배치된 타일 전체가 차지하는 오른쪽/아래 끝"""
+        if not tiles:
+            return {"right": 0.0, "bottom": 0.0}
+        return {
+            "right": max(t.x + t.width for t in tiles),
+            "bottom": max(t.y + t.height for t in tiles),
+        }
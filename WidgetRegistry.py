@@ -0,0 +1,132 @@
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+from SystemResourceModel import TileModel
+
+
+class _WidgetType:
+    """등록된 위젯 종류 하나의 팩토리와 재사용 풀"""
+
+    def __init__(self, name: str, factory: Callable, poolable: bool):
+        self.name = name
+        self.factory = factory  # factory(tile_model, viewmodel) -> QWidget
+        self.poolable = poolable
+        self.pools: Dict[Tuple[str, str], List] = {}  # (렌더러, 모드)별 대기 위젯
+        self.hits = 0
+        self.misses = 0
+
+
+class WidgetRegistry:
+    """TileModel.widget_type → 위젯 팩토리 매핑 + 종류별 위젯 풀
+
+    release()된 위젯은 구독을 끊은 상태로 풀에 보관했다가 다음 acquire()에서
+    rebind(core_id, viewmodel)로 다시 연결해 재사용한다. 위젯 종류는 각
+    위젯 모듈이 register()로 직접 등록한다.
+    """
+
+    # 기본 제공 위젯 모듈 (처음 조회할 때 import되어 스스로 등록)
+    BUILTIN_MODULES = (
+        "CircularGaugeWidget",
+        "CPUGraphWidget",
+        "CoreHeatmapWidget",
+        "ColorDemoWidget",
+    )
+
+    def __init__(self, max_pool_size: int = 64):
+        self.max_pool_size = max_pool_size
+        self._types: Dict[str, _WidgetType] = {}
+        self._aliases: Dict[str, str] = {}
+        self._builtins_loaded = False
+
+    def register(
+        self,
+        widget_type: str,
+        factory: Callable,
+        aliases: Tuple[str, ...] = (),
+        poolable: bool = True,
+    ):
+        """위젯 종류 등록 (aliases: 같은 종류로 취급할 다른 이름)"""
+        self._types[widget_type] = _WidgetType(widget_type, factory, poolable)
+        self._aliases[widget_type] = widget_type
+        for alias in aliases:
+            self._aliases[alias] = widget_type
+
+    def _load_builtins(self):
+        if self._builtins_loaded:
+            return
+        self._builtins_loaded = True
+        for module_name in self.BUILTIN_MODULES:
+            importlib.import_module(module_name)
+
+    def canonical(self, widget_type: str) -> str:
+        """별칭을 등록된 대표 이름으로 변환 (미등록이면 그대로)"""
+        self._load_builtins()
+        return self._aliases.get(widget_type, widget_type)
+
+    def is_registered(self, widget_type: str) -> bool:
+        return self.canonical(widget_type) in self._types
+
+    def acquire(self, tile_model: TileModel, viewmodel):
+        """타일 모델에 맞는 위젯 반환 (풀에 있으면 재사용)"""
+        name = self.canonical(tile_model.widget_type)
+        entry = self._types.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 위젯 종류: {tile_model.widget_type}")
+        pool_key = (tile_model.renderer or "", tile_model.mode or "")
+        pool = entry.pools.get(pool_key)
+        if pool:
+            widget = pool.pop()
+            widget.rebind(tile_model.core_id, viewmodel)
+            entry.hits += 1
+        else:
+            widget = entry.factory(tile_model, viewmodel)
+            entry.misses += 1
+        widget.widget_type = name
+        widget.pool_key = pool_key
+        return widget
+
+    def release(self, widget):
+        """타일에서 떼어낸 위젯을 풀에 반납 (풀이 가득 차면 폐기)"""
+        entry = self._types.get(getattr(widget, "widget_type", None))
+        if entry is not None and entry.poolable and hasattr(widget, "detach"):
+            pool = entry.pools.setdefault(widget.pool_key, [])
+            if len(pool) < self.max_pool_size:
+                widget.detach()
+                pool.append(widget)
+                return
+        if hasattr(widget, "dispose"):
+            widget.dispose()
+        else:
+            widget.deleteLater()
+
+    def clear_pools(self):
+        """풀에 보관 중인 위젯 모두 폐기"""
+        for entry in self._types.values():
+            for pool in entry.pools.values():
+                for widget in pool:
+                    widget.dispose()
+                pool.clear()
+
+    def stats(self) -> dict:
+        """종류별 풀 적중/생성 수와 전체 적중률"""
+        result = {}
+        hits = misses = 0
+        for name, entry in self._types.items():
+            result[name] = {
+                "hits": entry.hits,
+                "misses": entry.misses,
+                "pooled": sum(len(p) for p in entry.pools.values()),
+            }
+            hits += entry.hits
+            misses += entry.misses
+        result["hit_rate"] = hits / (hits + misses) if hits + misses else 0.0
+        return result
+
+
+# 앱 전체에서 공유하는 기본 레지스트리
+WIDGET_REGISTRY = WidgetRegistry()
+
+
+def register_widget(widget_type: str, factory: Callable, **kwargs):
+    """기본 레지스트리에 위젯 종류 등록"""
+    WIDGET_REGISTRY.register(widget_type, factory, **kwargs)
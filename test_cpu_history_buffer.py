@@ -0,0 +1,28 @@
+import pytest
+
+from SystemResourceModel import CpuHistoryBuffer
+
+
+def test_missing_core_carries_previous_value():
+    history = CpuHistoryBuffer(4)
+    history.append({"core1": 10.0, "core2": 20.0})
+    history.append({"core1": 30.0})  # core2 샘플 누락
+    history.append({"core2": 50.0, "core3": 70.0})  # core1 누락, core3 새로 등장
+
+    assert history.view("core1").tolist() == [0.0, 10.0, 30.0, 30.0]
+    assert history.view("core2").tolist() == [0.0, 20.0, 20.0, 50.0]
+    assert history.view("core3").tolist() == [0.0, 0.0, 0.0, 70.0]
+
+
+def test_views_are_read_only():
+    history = CpuHistoryBuffer(4)
+    history.append({"core1": 10.0})
+
+    with pytest.raises(ValueError):
+        history.view("core1")[-1] = 0.0
+    with pytest.raises(ValueError):
+        history.window()[0, -1] = 0.0
+
+    # 버퍼 자체는 계속 기록 가능
+    history.append({"core1": 40.0})
+    assert history.view("core1", 2).tolist() == [10.0, 40.0]
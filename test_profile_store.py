@@ -0,0 +1,75 @@
+import json
+import os
+import stat
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+from ProfileStore import ProfileStore
+from SystemResourceModel import SystemResourceModel, TileModel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def make_model(core_id: str) -> SystemResourceModel:
+    model = SystemResourceModel()
+    model.add_tile(TileModel(10, 10, 200, 180, "CPUGraphWidget", core_id))
+    return model
+
+
+def read_sections(store: ProfileStore, profile: str) -> dict:
+    with open(store.filename(profile), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_systems_saved_in_turn_into_empty_profile_all_survive(qapp, tmp_path, compact):
+    store = ProfileStore(
+        os.path.join(tmp_path, "dashboard_state_{profile}.json"), compact=compact
+    )
+    store.mark_dirty("ALL", "AP1", make_model("core1"))
+    store.flush()
+    assert list(read_sections(store, "ALL")) == ["AP1"]
+
+    store.mark_dirty("ALL", "AP2", make_model("core2"))
+    store.flush()
+    store.mark_dirty("ALL", "MCU", make_model("core3"))
+    store.flush()
+    assert list(read_sections(store, "ALL")) == ["AP1", "AP2", "MCU"]
+
+    # 다시 파싱해도 시스템별 타일이 그대로
+    reloaded = ProfileStore(store.filename_pattern)
+    for system_name, core_id in (("AP1", "core1"), ("AP2", "core2"), ("MCU", "core3")):
+        model = reloaded.get_model("ALL", system_name)
+        assert [tile.core_id for tile in model.tiles] == [core_id]
+
+
+def test_new_system_added_to_existing_profile_keeps_other_sections(qapp, tmp_path):
+    store = ProfileStore(os.path.join(tmp_path, "dashboard_state_{profile}.json"))
+    with open(store.filename("ALL"), "w", encoding="utf-8") as f:
+        json.dump({"AP1": make_model("core1").to_dict()}, f)
+
+    store.mark_dirty("ALL", "AP2", make_model("core2"))
+    store.flush()
+    store.mark_dirty("ALL", "MCU", make_model("core3"))
+    store.flush()
+    store.mark_dirty("ALL", "AP1", store.get_model("ALL", "AP1"))
+    store.flush()
+    assert list(read_sections(store, "ALL")) == ["AP1", "AP2", "MCU"]
+
+
+def test_saved_file_keeps_permissions(qapp, tmp_path):
+    store = ProfileStore(os.path.join(tmp_path, "dashboard_state_{profile}.json"))
+    umask = os.umask(0o022)
+    try:
+        store.save_model("ALL", "AP1", make_model("core1"))
+        assert stat.S_IMODE(os.stat(store.filename("ALL")).st_mode) == 0o644
+
+        os.chmod(store.filename("ALL"), 0o640)
+        store.save_model("ALL", "AP2", make_model("core2"))
+        assert stat.S_IMODE(os.stat(store.filename("ALL")).st_mode) == 0o640
+    finally:
+        os.umask(umask)